@@ -10,6 +10,7 @@ from threshold.engine.composite import (
     classify_dcs,
     classify_vix,
     compose_dcs,
+    resolve_falling_knife_caps,
 )
 
 # ---------------------------------------------------------------------------
@@ -123,6 +124,18 @@ class TestFallingKnifeFilter:
         assert dcs == 15  # Capped down from 20
         assert cap == 15
 
+    def test_nan_trend_no_cap(self):
+        dcs, cap = apply_falling_knife_filter(80.0, float("nan"))
+        assert dcs == 80.0
+        assert cap is None
+
+    def test_precomputed_caps(self):
+        freefall, downtrend = resolve_falling_knife_caps()
+        freefall["HEDGE"] = 40
+        dcs, cap = apply_falling_knife_filter(80.0, 0.1, "HEDGE", caps=(freefall, downtrend))
+        assert dcs == 40
+        assert cap == 40
+
 
 # ---------------------------------------------------------------------------
 # Drawdown Modifier (D-5)
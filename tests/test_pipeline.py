@@ -516,6 +516,92 @@ class TestPipelineStructure:
         assert top[1] == ("AAPL", 72.0)
         assert top[2] == ("GLD", 55.0)
 
+    def test_market_context_flat_columns(self):
+        """Non-MultiIndex price data should return neutral defaults."""
+        from threshold.config.schema import ThresholdConfig
+        from threshold.engine.pipeline import _compute_market_context
+
+        dates = pd.bdate_range("2024-01-01", periods=250)
+        flat = pd.DataFrame({"Close": np.linspace(100, 150, 250)}, index=dates)
+        ctx = _compute_market_context(flat, ThresholdConfig())
+        assert ctx["spy_close"] is None
+        assert ctx["vix_current"] == 15.0
+        assert ctx["breadth_total"] == 0
+        assert ctx["market_regime_score"] == 0.5
+
+    @staticmethod
+    def _run_pipeline_on_synthetic_prices(config, symbols):
+        """Run the pipeline over random-walk prices with storage mocked out."""
+        from unittest.mock import MagicMock, patch
+
+        from threshold.engine.pipeline import run_scoring_pipeline
+
+        dates = pd.bdate_range("2024-01-01", periods=260)
+        rng = np.random.default_rng(5)
+        close = pd.DataFrame(
+            {sym: 100 * np.cumprod(1 + rng.normal(0, 0.01, 260))
+             for sym in [*symbols, "SPY", "^VIX"]},
+            index=dates,
+        )
+        batch = pd.concat({"Close": close}, axis=1)
+
+        pipeline = "threshold.engine.pipeline"
+        with patch(f"{pipeline}.expire_overdue_grace_periods", return_value=0), \
+             patch(f"{pipeline}.list_tickers",
+                   return_value=[{"symbol": sym} for sym in symbols]), \
+             patch(f"{pipeline}.get_exempt_tickers", return_value={}), \
+             patch(f"{pipeline}.list_active_grace_periods", return_value=[]), \
+             patch(f"{pipeline}.get_latest_positions", return_value=[]), \
+             patch(f"{pipeline}.get_latest_scores", return_value={}), \
+             patch(f"{pipeline}.get_drawdown_classifications", return_value={}), \
+             patch(f"{pipeline}._fetch_prices_yfinance", return_value=batch):
+            return run_scoring_pipeline(
+                config=config, db=MagicMock(),
+                sa_data={sym: {} for sym in symbols}, dry_run=True,
+            )
+
+    def test_scoring_config_resolved_once_per_run(self):
+        """The scoring loop reuses one CompiledScoringConfig for every ticker."""
+        from unittest.mock import patch
+
+        from threshold.config.schema import ThresholdConfig
+        from threshold.engine.scorer import CompiledScoringConfig
+
+        symbols = ["AAA", "BBB", "CCC"]
+        from_config = CompiledScoringConfig.from_config
+        with patch.object(
+            CompiledScoringConfig, "from_config", side_effect=from_config,
+        ) as mock_from_config:
+            result = self._run_pipeline_on_synthetic_prices(ThresholdConfig(), symbols)
+
+        assert sorted(result.scores) == symbols
+        mock_from_config.assert_called_once()
+
+    def test_overlays_and_subscore_tables_built_once_per_run(self):
+        """Enabled overlays and sub-score tables are not rebuilt per ticker."""
+        from unittest.mock import patch
+
+        from threshold.config.schema import ThresholdConfig
+        from threshold.engine.advanced import ContinuousTrendFollower
+        from threshold.engine.subscores import CompiledSubscoreConfig
+
+        config = ThresholdConfig()
+        config.advanced.trend_following.enabled = True
+        symbols = ["AAA", "BBB", "CCC"]
+        from_config = CompiledSubscoreConfig.from_config
+        with patch(
+            "threshold.engine.scorer.ContinuousTrendFollower",
+            side_effect=ContinuousTrendFollower,
+        ) as mock_trend, patch.object(
+            CompiledSubscoreConfig, "from_config", side_effect=from_config,
+        ) as mock_subscores:
+            result = self._run_pipeline_on_synthetic_prices(config, symbols)
+
+        assert sorted(result.scores) == symbols
+        assert "trend_following" in result.scores["AAA"]["advanced_signals"]
+        mock_trend.assert_called_once()
+        mock_subscores.assert_called_once()
+
 
 # ---------------------------------------------------------------------------
 # CLI Import Tests
@@ -245,6 +245,51 @@ class TestHRPAllocator:
             # but should never put all weight in one asset
             assert w < 0.95
 
+    def test_structure_cache_reused(self, correlated_returns):
+        """Unchanged returns should hit the clustering cache."""
+        hrp = HRPAllocator(min_periods=60)
+        first = hrp.compute_weights(correlated_returns)
+        second = hrp.compute_weights(correlated_returns.copy())
+        assert first == second
+        assert len(hrp._structure_cache) == 1
+
+        hrp.compute_weights(correlated_returns * 1.01)
+        assert len(hrp._structure_cache) == 2
+
+    def test_structure_cache_disabled(self, correlated_returns):
+        """cache_size=0 should skip caching but give identical weights."""
+        cached = HRPAllocator(min_periods=60).compute_weights(correlated_returns)
+        hrp = HRPAllocator(min_periods=60, cache_size=0)
+        assert hrp.compute_weights(correlated_returns) == cached
+        assert len(hrp._structure_cache) == 0
+
+    def test_float32_path(self, correlated_returns):
+        """Single-precision path should closely match float64 weights."""
+        w64 = HRPAllocator(min_periods=60).compute_weights(correlated_returns)
+        w32 = HRPAllocator(min_periods=60, float_dtype=np.float32).compute_weights(
+            correlated_returns
+        )
+        assert set(w32["weights"]) == set(w64["weights"])
+        for name, w in w64["weights"].items():
+            assert abs(w32["weights"][name] - w) < 1e-4
+
+    def test_gram_covariance_matches_numpy(self, correlated_returns):
+        """Gram-matrix covariance/correlation should match np.cov/np.corrcoef."""
+        arr = correlated_returns.to_numpy()
+        cov, corr = HRPAllocator()._covariance_and_correlation(arr)
+        np.testing.assert_allclose(cov, np.cov(arr, rowvar=False), rtol=1e-9, atol=1e-15)
+        np.testing.assert_allclose(corr, np.corrcoef(arr, rowvar=False), atol=1e-10)
+
+    def test_quasi_diagonal_matches_leaves_list(self, correlated_returns):
+        """Iterative dendrogram walk should match scipy's leaf order."""
+        from scipy.cluster.hierarchy import leaves_list, linkage
+
+        hrp = HRPAllocator()
+        corr = np.corrcoef(correlated_returns.to_numpy(), rowvar=False)
+        link = linkage(hrp._correlation_distance(corr), method="single")
+        order = hrp._quasi_diagonalize(link, corr.shape[0])
+        assert order.tolist() == leaves_list(link).tolist()
+
 
 # ---------------------------------------------------------------------------
 # HIFO Tax Lot Tests
@@ -275,6 +320,26 @@ class TestHIFOSelector:
         assert result["selected_lots"][1]["shares_to_sell"] == 10
         assert result["total_shares"] == 40
 
+    def test_hifo_oversell_takes_all_lots(self, sample_tax_lots):
+        """Selling more than held should consume every lot fully."""
+        selector = HIFOSelector()
+        result = selector.select_lots(
+            sample_tax_lots, shares_to_sell=500, current_price=160.0
+        )
+        assert [lot["lot_id"] for lot in result["selected_lots"]] == [2, 3, 1]
+        assert result["total_shares"] == 100
+
+    def test_hifo_fractional_exact_fill(self):
+        """Float residue should not pull in an extra zero-share lot."""
+        lots = [
+            {"lot_id": 1, "shares": 0.1, "cost_basis_per_share": 20.0, "acquired_at": "2024-01-02"},
+            {"lot_id": 2, "shares": 0.2, "cost_basis_per_share": 15.0, "acquired_at": "2024-01-02"},
+            {"lot_id": 3, "shares": 5.0, "cost_basis_per_share": 10.0, "acquired_at": "2024-01-02"},
+        ]
+        result = HIFOSelector().select_lots(lots, shares_to_sell=0.3, current_price=12.0)
+        assert [lot["lot_id"] for lot in result["selected_lots"]] == [1, 2]
+        assert result["total_shares"] == 0.3
+
     def test_hifo_gain_estimate(self, sample_tax_lots):
         """Estimated gain should be correct."""
         selector = HIFOSelector()
@@ -296,8 +361,30 @@ class TestHIFOSelector:
     def test_holding_period_classification(self):
         """Should correctly classify short-term vs long-term."""
         selector = HIFOSelector(long_term_days=366)
-        assert selector._holding_period("2022-01-01", "2024-01-01") == "long_term"
-        assert selector._holding_period("2024-06-01", "2024-12-01") == "short_term"
+
+        def period(acquired_at: str, sell_date: str) -> str:
+            lot = {
+                "lot_id": 1, "shares": 10, "cost_basis_per_share": 100.0,
+                "acquired_at": acquired_at, "is_open": True,
+            }
+            result = selector.select_lots(
+                [lot], shares_to_sell=10, current_price=100.0, sell_date=sell_date
+            )
+            return result["holding_periods"][0]
+
+        assert period("2022-01-01", "2024-01-01") == "long_term"
+        assert period("2024-06-01", "2024-12-01") == "short_term"
+
+    def test_selected_lot_holding_periods(self, sample_tax_lots):
+        """Selected lots should be classified by the sell date, bad dates short-term."""
+        lots = [dict(lot) for lot in sample_tax_lots]
+        lots[2]["acquired_at"] = "not-a-date"
+        selector = HIFOSelector()
+        result = selector.select_lots(
+            lots, shares_to_sell=100, current_price=160.0, sell_date="2024-03-01"
+        )
+        # HIFO order: lot 2 (2023-06-01), lot 3 (bad date), lot 1 (2022-01-15)
+        assert result["holding_periods"] == ["short_term", "short_term", "long_term"]
 
 
 # ---------------------------------------------------------------------------
@@ -348,6 +435,16 @@ class TestTaxLossHarvester:
         ]
         assert harvester.check_wash_sale("AAPL", trades, "2025-01-10") is False
 
+    def test_wash_sale_ignores_trades_without_symbol(self):
+        """Trades missing a symbol should be skipped, not indexed under None."""
+        harvester = TaxLossHarvester()
+        trades = [
+            {"date": "2025-01-01", "action": "buy"},
+            {"symbol": "AAPL", "date": "2024-12-20", "action": "buy"},
+        ]
+        assert harvester._index_trades(trades).keys() == {"AAPL"}
+        assert harvester.check_wash_sale("AAPL", trades, "2025-01-10") is True
+
     def test_threshold_filter(self, sample_positions):
         """Positions with losses below threshold should be excluded."""
         harvester = TaxLossHarvester(loss_threshold_pct=0.20)
@@ -79,6 +79,11 @@ class TestGradeProperties:
         """Same grade always gives same result."""
         assert sa_grade_to_norm(grade) == sa_grade_to_norm(grade)
 
+    @given(grade=sa_grades)
+    def test_grade_to_norm_ignores_case_and_padding(self, grade):
+        """Canonical grades and their padded lower-case forms agree."""
+        assert sa_grade_to_norm(f" {grade.lower()} ") == sa_grade_to_norm(grade)
+
 
 # ---------------------------------------------------------------------------
 # DCS composition properties
@@ -6,6 +6,7 @@ import numpy as np
 import pandas as pd
 import pytest
 
+from threshold.engine.risk._rolling import rolling_mahalanobis
 from threshold.engine.risk.cdar import CDaRCalculator
 from threshold.engine.risk.cvar import CVaRCalculator
 from threshold.engine.risk.ebp import EBPMonitor
@@ -141,6 +142,24 @@ class TestEBPMonitor:
         assert signal["ebp_3m_change"] is not None
         assert signal["ebp_3m_change"] > 0
 
+    def test_percentile_refreshes_on_reload(self, ebp_high_risk, ebp_accommodative):
+        monitor = EBPMonitor()
+        monitor.load_data(ebp_high_risk)
+        assert monitor.get_current_signal()["ebp_percentile"] == pytest.approx(59 / 60, abs=1e-4)
+        monitor.load_data(ebp_accommodative)
+        expected = float(np.mean(ebp_accommodative.to_numpy() < ebp_accommodative.iloc[-1]))
+        assert monitor.get_current_signal()["ebp_percentile"] == pytest.approx(expected, abs=1e-4)
+
+    def test_classify_batch(self):
+        monitor = EBPMonitor()
+        values = np.array([-0.2, 0.0, 0.3, 0.5, 0.99, 1.0, 2.0])
+        regimes = monitor.classify_batch(values)
+        assert regimes.tolist() == [
+            "ACCOMMODATIVE", "NORMAL", "NORMAL", "ELEVATED",
+            "ELEVATED", "HIGH_RISK", "HIGH_RISK",
+        ]
+        assert regimes.tolist() == [monitor._classify_regime(v) for v in values]
+
     def test_custom_thresholds(self):
         monitor = EBPMonitor(thresholds={
             "high_risk": 0.50,
@@ -152,6 +171,15 @@ class TestEBPMonitor:
         signal = monitor.get_current_signal()
         assert signal["ebp_regime"] == "ELEVATED"
 
+    def test_thresholds_fixed_after_construction(self):
+        custom = {"high_risk": 0.50, "elevated": 0.20, "normal": 0.00}
+        monitor = EBPMonitor(thresholds=custom)
+        custom["high_risk"] = 5.0
+        assert monitor.thresholds["high_risk"] == 0.50
+        with pytest.raises(TypeError):
+            monitor.thresholds["high_risk"] = 5.0  # type: ignore[index]
+        assert monitor._classify_regime(0.6) == "HIGH_RISK"
+
 
 # ---------------------------------------------------------------------------
 # Turbulence Tests
@@ -171,6 +199,36 @@ class TestTurbulenceIndex:
         assert signal["turbulence_percentile"] is not None
         assert signal["turbulence_regime"] in ("CALM", "ELEVATED", "TURBULENT")
 
+    def test_series_matches_per_window_loop(self, calm_prices):
+        returns = np.log(calm_prices / calm_prices.shift(1)).dropna().to_numpy()
+        series = rolling_mahalanobis(returns, 100)
+        assert len(series) == len(returns) - 100
+        for t in (100, 150, len(returns) - 1):
+            window = returns[t - 100:t]
+            cov = np.cov(window, rowvar=False) + np.eye(4) * 1e-8
+            diff = returns[t] - window.mean(axis=0)
+            expected = diff @ np.linalg.inv(cov) @ diff
+            assert series[t - 100] == pytest.approx(expected, rel=1e-6)
+
+    def test_long_series_matches_per_window_cov(self, monkeypatch):
+        # Many blocks over a long, drifting series: running sums must not
+        # accumulate error across the whole history
+        monkeypatch.setattr(
+            "threshold.engine.risk._rolling._MAHALANOBIS_MAX_BLOCK", 64,
+        )
+        rng = np.random.default_rng(7)
+        n_dates, n_assets, w = 3000, 5, 60
+        drift = np.linspace(0.0, 5.0, n_dates)[:, None]
+        returns = drift + rng.normal(0.0, 0.01, (n_dates, n_assets))
+        series = rolling_mahalanobis(returns, w)
+        assert len(series) == n_dates - w
+        for t in range(w, n_dates, 97):
+            window = returns[t - w:t]
+            cov = np.cov(window, rowvar=False) + np.eye(n_assets) * 1e-8
+            diff = returns[t] - window.mean(axis=0)
+            expected = diff @ np.linalg.solve(cov, diff)
+            assert series[t - w] == pytest.approx(expected, rel=1e-6)
+
     def test_too_few_assets(self):
         ti = TurbulenceIndex(min_assets=3)
         df = pd.DataFrame({"A": range(300), "B": range(300)})
@@ -225,6 +283,37 @@ class TestMomentumCrash:
         score = mcp.get_regime_score(signal)
         assert 0.0 <= score <= 1.0
 
+    def test_array_input_matches_series(self, bear_returns):
+        mcp = MomentumCrashProtection()
+        assert mcp.compute_dynamic_weight(bear_returns.to_numpy()) == (
+            mcp.compute_dynamic_weight(bear_returns)
+        )
+
+    def test_rolling_matches_prefix_evaluation(self):
+        np.random.seed(7)
+        returns = np.random.normal(-0.005, 0.05, 90)
+        mcp = MomentumCrashProtection()
+        rolling = mcp.compute_rolling(returns)
+        for t in (10, 23, 59, 89):
+            is_bear, cum = mcp._compute_bear_indicator(returns[:t + 1])
+            var = mcp._estimate_wml_variance(returns[:t + 1])
+            assert bool(rolling["is_bear"][t]) == is_bear
+            if cum is None:
+                assert np.isnan(rolling["cumulative_return"][t])
+            else:
+                assert rolling["cumulative_return"][t] == pytest.approx(cum)
+            if var is None:
+                assert np.isnan(rolling["wml_variance"][t])
+            else:
+                assert rolling["wml_variance"][t] == pytest.approx(var)
+            signal = mcp.compute_dynamic_weight(returns[:t + 1])
+            assert rolling["crash_probability"][t] == pytest.approx(signal["crash_probability"])
+            assert rolling["momentum_weight"][t] == pytest.approx(signal["momentum_weight"])
+
+    def test_rolling_rejects_misaligned_wml(self, bear_returns):
+        with pytest.raises(ValueError, match="row-aligned"):
+            MomentumCrashProtection().compute_rolling(bear_returns, bear_returns[:-1])
+
     def test_min_weight_floor(self):
         mcp = MomentumCrashProtection(lookback_months=6, min_weight=0.30)
         # Very bearish: large negative returns
@@ -258,18 +347,53 @@ class TestCVaR:
         assert result["cvar"] > 0
         assert result["method"] == "parametric"
 
+    def test_parametric_matches_normal_closed_form(self, daily_returns_crash):
+        from scipy import stats
+
+        arr = daily_returns_crash.to_numpy()
+        for alpha in (0.9, 0.95, 0.99):
+            z = stats.norm.ppf(1 - alpha)
+            expected = -arr.mean() + arr.std(ddof=1) * stats.norm.pdf(z) / (1 - alpha)
+            calc = CVaRCalculator(alpha=alpha, method="parametric")
+            assert calc.parametric_cvar(arr) == pytest.approx(expected, rel=1e-12)
+
     def test_crash_increases_cvar(self, daily_returns_positive, daily_returns_crash):
         calc = CVaRCalculator(alpha=0.95)
         calm_result = calc.compute(daily_returns_positive)
         crash_result = calc.compute(daily_returns_crash)
         assert crash_result["cvar"] > calm_result["cvar"]
 
+    def test_historical_matches_percentile_tail(self, daily_returns_crash):
+        arr = daily_returns_crash.to_numpy()
+        for alpha in (0.9, 0.95, 0.99):
+            threshold = np.percentile(arr, (1 - alpha) * 100)
+            expected = -arr[arr <= threshold].mean()
+            calc = CVaRCalculator(alpha=alpha)
+            assert calc.historical_cvar(arr) == pytest.approx(expected, rel=1e-12)
+
+    def test_historical_includes_ties_at_threshold(self):
+        arr = np.full(300, 0.001)
+        arr[100:105] = -0.01
+        arr[105:120] = -0.005
+        for alpha in (0.9, 0.95, 0.99):
+            threshold = np.percentile(arr, (1 - alpha) * 100)
+            expected = -arr[arr <= threshold].mean()
+            calc = CVaRCalculator(alpha=alpha)
+            assert calc.historical_cvar(arr) == pytest.approx(expected, rel=1e-12)
+
     def test_invalid_alpha(self):
         with pytest.raises(ValueError, match="alpha must be"):
             CVaRCalculator(alpha=0.3)
         with pytest.raises(ValueError, match="alpha must be"):
             CVaRCalculator(alpha=1.0)
 
+    def test_assume_clean_matches_default(self, daily_returns_crash):
+        calc = CVaRCalculator(alpha=0.95)
+        arr = daily_returns_crash.to_numpy()
+        assert calc.compute(arr, assume_clean=True) == calc.compute(arr)
+        with_nans = np.concatenate([arr, [np.nan, np.nan]])
+        assert calc.compute(with_nans) == calc.compute(arr)
+
     def test_invalid_method(self):
         with pytest.raises(ValueError, match="method must be"):
             CVaRCalculator(method="monte_carlo")
@@ -320,6 +444,57 @@ class TestCDaR:
         result = calc.compute(daily_returns_positive)
         assert result["max_drawdown"] >= result["cdar"]
 
+    def test_historical_matches_percentile_tail(self, daily_returns_crash):
+        for alpha in (0.9, 0.95, 0.99):
+            calc = CDaRCalculator(alpha=alpha)
+            drawdowns = calc.compute_drawdowns(daily_returns_crash)
+            threshold = np.percentile(drawdowns, alpha * 100)
+            expected = drawdowns[drawdowns >= threshold].mean()
+            assert calc.historical_cdar(drawdowns) == pytest.approx(expected, rel=1e-12)
+
+    def test_historical_includes_ties_at_threshold(self):
+        # Flat drift between a dip and a rally leaves long runs of equal
+        # drawdowns (zeros and a plateau) straddling the α percentile
+        returns = np.full(300, 0.001)
+        returns[100:105] = -0.01
+        returns[105:110] = 0.02
+        matrix = np.column_stack([returns, returns[::-1]])
+        for alpha in (0.9, 0.95, 0.99):
+            calc = CDaRCalculator(alpha=alpha)
+            batch = calc.compute_batch(matrix)
+            for j in range(matrix.shape[1]):
+                drawdowns = calc.compute_drawdowns(matrix[:, j])
+                threshold = np.percentile(drawdowns, alpha * 100)
+                expected = drawdowns[drawdowns >= threshold].mean()
+                assert calc.historical_cdar(drawdowns) == pytest.approx(expected, rel=1e-12)
+                assert batch["cdar"][j] == pytest.approx(expected, rel=1e-12)
+
+    def test_batch_matches_per_asset(self, daily_returns_positive, daily_returns_crash):
+        calc = CDaRCalculator(alpha=0.95)
+        matrix = np.column_stack([daily_returns_positive, daily_returns_crash])
+        batch = calc.compute_batch(matrix)
+        assert batch["n_observations"] == 500
+        for j, series in enumerate((daily_returns_positive, daily_returns_crash)):
+            single = calc.compute(series)
+            for key in ("cdar", "dar", "max_drawdown", "avg_drawdown",
+                        "current_drawdown", "n_drawdown_periods"):
+                assert batch[key][j] == pytest.approx(single[key], abs=1e-6)
+
+    def test_batch_insufficient_data(self):
+        batch = CDaRCalculator().compute_batch(np.zeros((5, 3)))
+        assert batch["cdar"].tolist() == [0.0, 0.0, 0.0]
+        assert batch["n_observations"] == 5
+
+    def test_blocked_drawdowns_match_whole_array(self):
+        from threshold.engine.risk.cdar import _blocked_drawdowns
+
+        np.random.seed(3)
+        arr = np.random.normal(0.0, 0.002, 150_000)
+        wealth = np.cumprod(1 + arr)
+        peak = np.maximum.accumulate(wealth)
+        expected = (peak - wealth) / peak
+        np.testing.assert_allclose(_blocked_drawdowns(arr), expected, rtol=1e-9, atol=1e-12)
+
     def test_drawdown_series(self, daily_returns_positive):
         calc = CDaRCalculator()
         drawdowns = calc.compute_drawdowns(daily_returns_positive)
@@ -352,6 +527,29 @@ class TestRiskImports:
             MomentumCrashProtection, TurbulenceIndex,
         ])
 
+    def test_cvar_does_not_import_scipy_stats(self):
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, threshold.engine.risk.cvar; "
+            "sys.exit('scipy.stats' in sys.modules)"
+        )
+        assert subprocess.run([sys.executable, "-c", code]).returncode == 0
+
+    def test_format_result_rounds_at_edge(self, daily_returns_crash):
+        from threshold.engine.risk import format_result
+
+        raw = CVaRCalculator().compute(daily_returns_crash)
+        formatted = format_result(raw, ndigits=4)
+        assert formatted["cvar"] == round(raw["cvar"], 4)
+        assert formatted["method"] == "historical"
+        assert formatted["n_observations"] == 500
+
+        batch = format_result(CDaRCalculator().compute_batch(np.zeros((20, 2))))
+        assert batch["cdar"] == [0.0, 0.0]
+        assert batch["n_drawdown_periods"] == [0, 0]
+
     def test_config_has_risk(self):
         from threshold.config.schema import ThresholdConfig
         config = ThresholdConfig()
@@ -6,9 +6,20 @@ import numpy as np
 import pandas as pd
 import pytest
 
+from threshold.config.schema import ThresholdConfig
+from threshold.engine._rolling_bundle import compute_rolling_bundle
 from threshold.engine.context import ScoringContext
-from threshold.engine.scorer import score_ticker
+from threshold.engine.scorer import (
+    CompiledScoringConfig,
+    _drop_missing,
+    resolve_board_views,
+    round_results,
+    score_ticker,
+)
+from threshold.engine.scorer_batch import score_tickers
+from threshold.engine.scorer_parallel import score_universe
 from threshold.engine.signals import SignalBoard
+from threshold.engine.technical import calc_consecutive_days_below_sma
 
 # ---------------------------------------------------------------------------
 # Fixtures
@@ -229,6 +240,37 @@ class TestDrawdownDefense:
         # No drawdown_classifications in basic_ctx → no drawdown_defense key
         assert "drawdown_defense" not in result
 
+    def test_dashed_ticker_matches_dotted_key(self, mock_sa_data, uptrend_df, spy_close):
+        ctx = ScoringContext(
+            market_regime_score=0.65,
+            vix_regime="FEAR",
+            spy_close=spy_close,
+            drawdown_classifications={
+                "BRK.B": {"classification": "DEFENSIVE", "downside_capture": 0.4},
+            },
+        )
+        assert ctx.get_drawdown_classification("BRK-B") is ctx.get_drawdown_classification("BRK.B")
+        assert ctx.get_drawdown_classification("BRK") is None
+        result = score_ticker("BRK-B", mock_sa_data, uptrend_df, ctx)
+        assert result["drawdown_defense"]["classification"] == "DEFENSIVE"
+
+    def test_classifications_filled_after_construction(
+        self, mock_sa_data, uptrend_df, spy_close,
+    ):
+        ctx = ScoringContext(market_regime_score=0.65, vix_regime="FEAR", spy_close=spy_close)
+        assert ctx.get_drawdown_classification("AAPL") is None
+        ctx.drawdown_classifications = {
+            "AAPL": {"classification": "HEDGE", "downside_capture": -0.2},
+        }
+        assert ctx.get_drawdown_classification("AAPL")["classification"] == "HEDGE"
+        assert ctx.get_drawdown_classification("BRK-B") is None
+        ctx.drawdown_classifications["BRK.B"] = {
+            "classification": "DEFENSIVE", "downside_capture": 0.4,
+        }
+        assert ctx.get_drawdown_classification("BRK-B")["classification"] == "DEFENSIVE"
+        result = score_ticker("AAPL", mock_sa_data, uptrend_df, ctx)
+        assert result["drawdown_defense"]["classification"] == "HEDGE"
+
 
 # ---------------------------------------------------------------------------
 # Falling Knife
@@ -309,3 +351,231 @@ class TestEdgeCases:
         """Completely empty SA data should not crash."""
         result = score_ticker("TEST", {}, uptrend_df, basic_ctx)
         assert result is not None
+
+    def test_clean_series_not_copied(self, uptrend_df):
+        close = uptrend_df["Close"]
+        assert _drop_missing(close) is close
+        gappy = close.copy()
+        gappy.iloc[5] = np.nan
+        assert len(_drop_missing(gappy)) == len(close) - 1
+
+
+# ---------------------------------------------------------------------------
+# Compiled config
+# ---------------------------------------------------------------------------
+
+class TestCompiledScoringConfig:
+    def test_none_uses_calibrated_defaults(self):
+        compiled = CompiledScoringConfig.from_config(None)
+        assert compiled == CompiledScoringConfig()
+        assert compiled.weights is None
+        assert compiled.thresholds is None
+
+    def test_none_shares_one_instance(self):
+        assert CompiledScoringConfig.from_config(None) is CompiledScoringConfig.from_config(None)
+
+    def test_reads_threshold_config(self):
+        config = ThresholdConfig()
+        config.sell_criteria.sma_breach_days = 12
+        config.scoring.modifiers.obv_bullish_max = 4
+        compiled = CompiledScoringConfig.from_config(config)
+        assert compiled.sma_sell_days == 12
+        assert compiled.obv_max == 4
+        assert compiled.weights == {"MQ": 30, "FQ": 25, "TO": 20, "MR": 15, "VC": 10}
+        assert compiled.thresholds["buy_dip"] == 65
+
+    def test_eps_thresholds_precomputed_as_deltas(self):
+        config = ThresholdConfig()
+        config.scoring.revision_momentum.sell_threshold_subgrades = 4
+        compiled = CompiledScoringConfig.from_config(config)
+        assert compiled.eps_sell_delta == -4 / 13.0
+        assert compiled.eps_warn_delta == CompiledScoringConfig().eps_warn_delta == -2 / 13.0
+
+    def test_builds_enabled_overlays_once(self):
+        config = ThresholdConfig()
+        assert CompiledScoringConfig.from_config(config).trend_follower is None
+        config.advanced.trend_following.enabled = True
+        config.advanced.trend_following.mq_blend_weight = 0.4
+        compiled = CompiledScoringConfig.from_config(config)
+        assert compiled.trend_follower is not None
+        assert compiled.trend_follower.window == config.advanced.trend_following.window
+        assert compiled.trend_blend_weight == 0.4
+
+    def test_precompiled_matches_config(self, mock_sa_data, uptrend_df, basic_ctx):
+        config = ThresholdConfig()
+        compiled = CompiledScoringConfig.from_config(config)
+        a = score_ticker("TEST", mock_sa_data, uptrend_df, basic_ctx, config)
+        b = score_ticker("TEST", mock_sa_data, uptrend_df, basic_ctx, config, compiled)
+        assert a["dcs"] == b["dcs"]
+        assert a["sell_flags"] == b["sell_flags"]
+
+
+# ---------------------------------------------------------------------------
+# Result rounding
+# ---------------------------------------------------------------------------
+
+class TestRoundResults:
+    def test_rounds_to_display_precision(self, mock_sa_data, uptrend_df, basic_ctx):
+        result = score_ticker("TEST", mock_sa_data, uptrend_df, basic_ctx)
+        raw_dcs = result["dcs"]
+        raw_rsi = result["technicals"]["rsi_14"]
+        raw_mq = result["sub_scores"]["dcs"]["MQ"]
+        round_results({"TEST": result, "SHORT": None})
+        assert result["dcs"] == round(raw_dcs, 1)
+        assert result["technicals"]["rsi_14"] == round(raw_rsi, 1)
+        assert result["sub_scores"]["dcs"]["MQ"] == round(raw_mq, 3)
+
+    def test_skips_missing_sections_and_non_floats(self):
+        result = {"dcs": 61.2345, "yf_fundamentals": {"sector": "Tech", "fcf_yield": 0.054321}}
+        round_results({"X": result})
+        assert result == {"dcs": 61.2, "yf_fundamentals": {"sector": "Tech", "fcf_yield": 0.0543}}
+
+
+# ---------------------------------------------------------------------------
+# Rolling bundle
+# ---------------------------------------------------------------------------
+
+class TestRollingBundle:
+    def test_matches_pandas_rolling(self, downtrend_df):
+        close = downtrend_df["Close"]
+        bundle = compute_rolling_bundle(close.to_numpy())
+        assert bundle["sma_20"][0] == pytest.approx(close.rolling(20).mean().iloc[-1])
+        assert bundle["std_20"][0] == pytest.approx(close.rolling(20).std().iloc[-1])
+        assert bundle["sma_50"][0] == pytest.approx(close.rolling(50).mean().iloc[-1])
+        assert bundle["sma_200"][0] == pytest.approx(close.rolling(200).mean().iloc[-1])
+        assert bundle["ret_8w"][0] == pytest.approx(close.iloc[-1] / close.iloc[-40] - 1)
+        days, _ = calc_consecutive_days_below_sma(close)
+        assert bundle["days_below_sma"][0] == days
+
+    def test_late_listing_windows_are_nan(self, uptrend_df):
+        panel = np.column_stack([uptrend_df["Close"], uptrend_df["Close"]])
+        panel[:150, 1] = np.nan
+        bundle = compute_rolling_bundle(panel, first_valid=np.array([0, 150]))
+        assert np.isnan(bundle["sma_200"][1])
+        assert bundle["sma_50"][1] == pytest.approx(bundle["sma_50"][0])
+        assert bundle["days_below_sma"][1] == 0
+
+    def test_short_series(self):
+        bundle = compute_rolling_bundle(np.linspace(100, 110, 30))
+        assert np.isnan(bundle["sma_50"][0])
+        assert np.isnan(bundle["ret_8w"][0])
+        assert bundle["sma_20"][0] == pytest.approx(np.linspace(100, 110, 30)[-20:].mean())
+
+
+# ---------------------------------------------------------------------------
+# Panel scoring
+# ---------------------------------------------------------------------------
+
+def _strip_board(result: dict) -> dict:
+    return {k: v for k, v in result.items() if k != "_signal_board_obj"}
+
+
+class TestScoreTickers:
+    @pytest.fixture
+    def panels(self, uptrend_df, downtrend_df) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """Close / Volume panels: full histories, a late listing, a gap, a stub."""
+        n = len(uptrend_df)
+        late = uptrend_df["Close"].to_numpy().copy()
+        late[:n - 120] = np.nan
+        gappy = downtrend_df["Close"].to_numpy().copy()
+        gappy[100] = np.nan
+        stub = np.full(n, np.nan)
+        stub[-30:] = 50.0
+        close = pd.DataFrame({
+            "UP": uptrend_df["Close"], "DOWN": downtrend_df["Close"],
+            "LATE": late, "GAP": gappy, "STUB": stub,
+        })
+        volume = pd.DataFrame({
+            "UP": uptrend_df["Volume"], "DOWN": downtrend_df["Volume"],
+            "LATE": uptrend_df["Volume"], "GAP": downtrend_df["Volume"],
+            "STUB": np.full(n, 1e6),
+        })
+        return close, volume
+
+    def test_matches_score_ticker(self, mock_sa_data, fear_ctx, panels):
+        close, volume = panels
+        sa = dict.fromkeys(close.columns, mock_sa_data)
+        results = score_tickers(close, sa, fear_ctx, volume=volume)
+        assert list(results) == list(close.columns)
+        for ticker in close.columns:
+            df = pd.DataFrame({"Close": close[ticker], "Volume": volume[ticker]})
+            expected = score_ticker(ticker, mock_sa_data, df, fear_ctx)
+            if expected is None:
+                assert results[ticker] is None
+            else:
+                assert _strip_board(results[ticker]) == _strip_board(expected)
+
+    def test_short_history_is_none(self, basic_ctx, panels):
+        close, _ = panels
+        results = score_tickers(close, {}, basic_ctx)
+        assert results["STUB"] is None
+        assert isinstance(results["UP"]["_signal_board_obj"], SignalBoard)
+
+    def test_float32_panel_close_to_float64(self, mock_sa_data, basic_ctx, panels):
+        close, volume = panels
+        sa = dict.fromkeys(close.columns, mock_sa_data)
+        full = score_tickers(close, sa, basic_ctx, volume=volume)
+        half = score_tickers(close, sa, basic_ctx, volume=volume, float_dtype=np.float32)
+        for ticker, result in full.items():
+            if result is None:
+                assert half[ticker] is None
+            else:
+                assert half[ticker]["dcs"] == pytest.approx(result["dcs"], abs=0.5)
+                assert half[ticker]["technicals"]["pct_from_200d"] == pytest.approx(
+                    result["technicals"]["pct_from_200d"], abs=1e-3,
+                )
+
+    def test_lean_boards_resolve_on_demand(self, mock_sa_data, fear_ctx, panels):
+        close, volume = panels
+        sa = dict.fromkeys(close.columns, mock_sa_data)
+        full = score_tickers(close, sa, fear_ctx, volume=volume)
+        lean = score_tickers(close, sa, fear_ctx, volume=volume, board_views=False)
+        assert "sell_flags" not in lean["DOWN"]
+        assert "signal_board" not in lean["DOWN"]
+        resolve_board_views(lean)
+        for ticker, result in full.items():
+            if result is not None:
+                assert lean[ticker]["sell_flags"] == result["sell_flags"]
+                assert lean[ticker]["signal_board"] == result["signal_board"]
+
+
+class TestScoreUniverse:
+    def test_matches_score_tickers(self, mock_sa_data, fear_ctx, uptrend_df, downtrend_df):
+        n = len(uptrend_df)
+        cols = {}
+        for i in range(6):
+            src = uptrend_df if i % 2 else downtrend_df
+            cols[f"T{i}"] = src["Close"].to_numpy() * (1 + 0.01 * i)
+        cols["T5"][: n - 40] = np.nan  # too short once trimmed
+        close = pd.DataFrame(cols)
+        volume = pd.DataFrame({t: uptrend_df["Volume"] for t in cols})
+        sa = dict.fromkeys(cols, mock_sa_data)
+
+        expected = score_tickers(close, sa, fear_ctx, volume=volume)
+        results = score_universe(close, sa, fear_ctx, volume=volume, n_jobs=2, block_size=2)
+        assert list(results) == list(expected)
+        assert results["T5"] is None
+        for ticker, result in expected.items():
+            if result is not None:
+                assert _strip_board(results[ticker]) == _strip_board(result)
+                assert isinstance(results[ticker]["_signal_board_obj"], SignalBoard)
+
+    def test_short_histories_prefiltered(self, mock_sa_data, basic_ctx, uptrend_df):
+        close = pd.DataFrame({
+            "NEW": np.r_[np.full(len(uptrend_df) - 30, np.nan), uptrend_df["Close"].iloc[-30:]],
+            "UP": uptrend_df["Close"],
+            "EMPTY": np.nan,
+        })
+        results = score_universe(close, {"UP": mock_sa_data}, basic_ctx, n_jobs=2)
+        assert list(results) == ["NEW", "UP", "EMPTY"]
+        assert results["NEW"] is None
+        assert results["EMPTY"] is None
+        assert results["UP"]["dcs"] == score_ticker("UP", mock_sa_data, uptrend_df, basic_ctx)["dcs"]
+
+        only_short = score_universe(close[["NEW", "EMPTY"]], {}, basic_ctx, n_jobs=2)
+        assert only_short == {"NEW": None, "EMPTY": None}
+
+    def test_single_job_runs_in_process(self, mock_sa_data, basic_ctx, uptrend_df):
+        close = pd.DataFrame({"UP": uptrend_df["Close"]})
+        results = score_universe(close, {"UP": mock_sa_data}, basic_ctx, n_jobs=1)
+        assert results["UP"]["dcs"] == score_ticker("UP", mock_sa_data, uptrend_df, basic_ctx)["dcs"]
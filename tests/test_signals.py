@@ -2,9 +2,16 @@
 
 from __future__ import annotations
 
+import dataclasses
+import itertools
+import pickle
+
+import numpy as np
 import pytest
 
 from threshold.engine.signals import (
+    SEVERITY_CODES,
+    SIGNAL_TYPE_CODES,
     Severity,
     Signal,
     SignalBoard,
@@ -43,6 +50,40 @@ class TestSignal:
         assert restored.legacy_prefix == sig.legacy_prefix
         assert restored.metadata == sig.metadata
 
+    def test_metadata_record_reads_as_mapping(self):
+        sig = make_quant_drop_sell(-1.5, "2026-01-10")
+        meta = sig.metadata
+        assert not hasattr(meta, "__dict__")
+        assert meta["delta"] == -1.5
+        assert meta.get("missing") is None
+        assert meta == {"criterion": "quant_drop", "delta": -1.5, "compare_date": "2026-01-10"}
+        assert type(sig.to_dict()["metadata"]) is dict
+        with pytest.raises(AttributeError):
+            meta.delta = 0.0
+
+    def test_from_dict_restores_records_and_keeps_other_dicts(self):
+        sig = make_sma_breach_sell(12)
+        restored = Signal.from_dict(sig.to_dict())
+        assert restored == sig
+        assert type(restored.metadata) is type(sig.metadata)
+
+        data = sig.to_dict()
+        data["metadata"] = {"criterion": "sma_breach", "days_below": 12, "note": "manual"}
+        assert Signal.from_dict(data).metadata == data["metadata"]
+
+    def test_legacy_flag_follows_replaced_message(self):
+        sig = make_sma_breach_sell(12)
+        changed = dataclasses.replace(sig, message="edited")
+        assert changed.to_legacy_flag() == "SELL: edited"
+        assert changed.to_dict()["legacy_flag"] == "SELL: edited"
+        assert sig.to_legacy_flag().startswith("SELL: 12")
+
+    def test_from_dict_rejects_unknown_type(self):
+        data = make_sma_breach_sell(12).to_dict()
+        data["signal_type"] = "SELL_SOFT"
+        with pytest.raises(ValueError):
+            Signal.from_dict(data)
+
     def test_frozen(self):
         sig = make_sma_breach_sell(10)
         with pytest.raises(AttributeError):
@@ -104,12 +145,29 @@ class TestFactories:
         sig = make_bottom_turning()
         assert sig.signal_type == SignalType.BUY_WATCHLIST
 
+    def test_constant_signals_are_shared(self):
+        assert make_reversal_confirmed() is make_reversal_confirmed()
+        assert make_bottom_turning() is make_bottom_turning()
+        assert make_quant_freshness_warning() is make_quant_freshness_warning()
+
     def test_concentration_warning(self):
         sig = make_concentration_warning(["AAPL", "MSFT", "GOOG"], 12.0)
         assert sig.signal_type == SignalType.DEPLOYMENT_GATE
         assert "AAPL" in sig.message
         assert sig.metadata["effective_bets"] == 12.0
 
+    def test_concentration_message_uses_top_three(self):
+        peers = ["AAPL", "MSFT", "GOOG", "AMZN"]
+        sig = make_concentration_warning(peers, 7.4)
+        again = make_concentration_warning(list(peers), 7.4)
+        assert sig.message == "High corr with AAPL, MSFT, GOOG (eff. bets: 7)"
+        assert again.message is sig.message
+        assert sig.metadata["correlated_with"] == peers
+
+    def test_concentration_message_nan_bets(self):
+        sig = make_concentration_warning(["AAPL"], float("nan"))
+        assert sig.message == "High corr with AAPL (eff. bets: nan)"
+
 
 # ---------------------------------------------------------------------------
 # SignalBoard
@@ -142,6 +200,19 @@ class TestSignalBoard:
         board.add(make_bottom_turning())
         assert len(board.buy_signals) == 2
 
+    def test_views_keep_insertion_order(self):
+        board = SignalBoard()
+        board.add(make_bottom_turning())
+        board.add(make_sma_breach_sell(12))
+        board.add(make_reversal_confirmed())
+        board.add(make_quant_drop_sell(-1.5, "2026-01-10"))
+        assert [s.signal_type for s in board.buy_signals] == [
+            SignalType.BUY_WATCHLIST, SignalType.BUY_CONFIRMED,
+        ]
+        assert [s.metadata["criterion"] for s in board.sells] == ["sma_breach", "quant_drop"]
+        board.sells.clear()  # Views are copies
+        assert len(board.sells) == 2
+
     def test_to_legacy_flags(self):
         board = SignalBoard()
         board.add(make_sma_breach_sell(12))
@@ -161,12 +232,60 @@ class TestSignalBoard:
         assert len(restored) == 2
         assert restored.sells[0].metadata["days_below"] == 12
 
+    def test_signals_snapshot_and_iterator(self):
+        board = SignalBoard()
+        board.add(make_sma_breach_sell(12))
+        board.add(make_bottom_turning())
+        snapshot = board.signals
+        assert isinstance(snapshot, tuple)
+        assert list(board.iter_signals()) == list(snapshot)
+        board.add(make_reversal_confirmed())
+        assert len(snapshot) == 2
+
+    def test_to_dict_matches_signal_to_dict(self):
+        board = SignalBoard()
+        board.add(make_sma_breach_sell(12))
+        board.add(make_defensive_hold("HEDGE", 0.31))
+        board.add(Signal(SignalType.VERIFY, Severity.INFO, "custom", "NOTE:", {"k": 1}))
+        assert board.to_dict() == [s.to_dict() for s in board.signals]
+
     def test_repr(self):
         board = SignalBoard()
         r = repr(board)
         assert "SignalBoard" in r
         assert "0 signals" in r
 
+    def test_stack_columns(self):
+        a = SignalBoard()
+        a.add(make_sma_breach_sell(12))
+        a.add(make_reversal_confirmed())
+        b = SignalBoard()
+        b.add(make_eps_rev_sell(3.5, -0.269))
+        table = SignalBoard.stack({"AAA": a, "EMPTY": SignalBoard(), "BBB": b})
+
+        assert table["ticker"].tolist() == ["AAA", "AAA", "BBB"]
+        assert table["signal_type"].dtype == np.int8
+        assert table["criterion"].tolist() == ["sma_breach", "reversal_confirmed", "eps_revision"]
+        assert table["legacy_flag"].tolist() == a.to_legacy_flags() + b.to_legacy_flags()
+        high_sells = (
+            (table["signal_type"] == SIGNAL_TYPE_CODES[SignalType.SELL_HARD])
+            & (table["severity"] == SEVERITY_CODES[Severity.HIGH])
+        )
+        assert high_sells.sum() == 2
+
+    def test_stack_empty(self):
+        table = SignalBoard.stack({})
+        assert all(len(col) == 0 for col in table.values())
+
+    def test_slotted_and_picklable(self):
+        board = SignalBoard()
+        board.add(make_sma_breach_sell(12))
+        assert not hasattr(board, "__dict__")
+        assert not hasattr(board.signals[0], "__dict__")
+        restored = pickle.loads(pickle.dumps(board))
+        assert restored.to_dict() == board.to_dict()
+        assert restored.sells == board.sells
+
 
 # ---------------------------------------------------------------------------
 # Net Action Priority Resolution
@@ -220,3 +339,36 @@ class TestNetAction:
         board = SignalBoard()
         board.add(make_sma_breach_sell(12))
         assert board.has_sell_review is False
+
+    def test_every_combination_follows_priority(self):
+        """Table lookup agrees with the documented ladder for all mixes."""
+        for n_sells, hold, trim, buy_c, buy_w, warn in itertools.product(
+            range(3), *[(False, True)] * 5,
+        ):
+            board = SignalBoard()
+            for _ in range(n_sells):
+                board.add(make_sma_breach_sell(12))
+            if hold:
+                board.add(make_defensive_hold("HEDGE", 0.3))
+            if trim:
+                board.add(make_amplifier_warning(1.7))
+            if buy_c:
+                board.add(make_reversal_confirmed())
+            if buy_w:
+                board.add(make_bottom_turning())
+            if warn:
+                board.add(make_sma_breach_warning(8))
+
+            if n_sells >= 2:
+                expected = "REVIEW"
+            elif n_sells == 1:
+                expected = "HOLD" if hold else "WATCH"
+            elif trim:
+                expected = "TRIM"
+            elif buy_c:
+                expected = "BUY"
+            elif buy_w:
+                expected = "WATCHLIST"
+            else:
+                expected = "WATCH" if warn else "NONE"
+            assert board.net_action == expected
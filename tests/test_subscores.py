@@ -6,10 +6,16 @@ import numpy as np
 import pandas as pd
 import pytest
 
+from threshold.config.schema import ThresholdConfig
+from threshold.engine._rolling_bundle import bundle_stats, compute_rolling_bundle
 from threshold.engine.subscores import (
+    _MACD_TABLE,
+    _TREND_TABLE,
+    CompiledSubscoreConfig,
     calc_fundamental_quality,
     calc_market_regime,
     calc_momentum_quality,
+    calc_momentum_quality_batch,
     calc_revision_momentum,
     calc_technical_oversold,
     calc_valuation_context,
@@ -102,6 +108,54 @@ class TestMomentumQuality:
         mq, trend, _, _ = calc_momentum_quality(sa_data_strong, close)
         assert 0 <= mq <= 1
 
+    @pytest.mark.parametrize("gap", [None, -5, -300])
+    def test_vol_matches_pct_change(self, gap):
+        """Realized vol uses the last 252 of pct_change().dropna()."""
+        rng = np.random.default_rng(11)
+        close = pd.Series(100 * np.cumprod(1 + rng.normal(0.0005, 0.015, 400)))
+        if gap is not None:
+            close.iloc[gap] = np.nan
+        returns = close.pct_change().dropna()
+        vol = float(returns.iloc[-252:].std() * np.sqrt(252))
+        raw_mom = close.iloc[-21] / close.iloc[-252] - 1.0
+        _, _, vol_adj, _ = calc_momentum_quality({}, close)
+        assert vol_adj == pytest.approx(raw_mom / vol, rel=1e-12)
+
+
+class TestMomentumQualityBatch:
+    @pytest.fixture
+    def panel(self) -> tuple[np.ndarray, np.ndarray]:
+        """300-bar panel of listings from 40 to 300 bars long."""
+        rng = np.random.default_rng(3)
+        lengths = [300, 253, 252, 200, 120, 60, 59, 40]
+        close = np.full((300, len(lengths)), np.nan)
+        for j, n in enumerate(lengths):
+            drift = 0.001 if j % 2 else -0.002
+            close[-n:, j] = 100 * np.cumprod(1 + rng.normal(drift, 0.02, n))
+        return close, 300 - np.array(lengths)
+
+    def test_matches_scalar(self, panel, spy_close, sa_data_strong, sa_data_weak):
+        close, first_valid = panel
+        sa = [sa_data_strong if j % 2 else sa_data_weak for j in range(close.shape[1])]
+        batch = calc_momentum_quality_batch(sa, close, first_valid, spy_close)
+        for j in range(close.shape[1]):
+            col = pd.Series(close[first_valid[j]:, j])
+            mq, trend, vol_adj, rs = calc_momentum_quality(sa[j], col, spy_close)
+            assert batch["mq"][j] == mq
+            assert batch["trend_score"][j] == trend
+            assert batch["vol_adj_mom"][j] == vol_adj
+            if rs is None:
+                assert np.isnan(batch["rs_vs_spy"][j])
+            else:
+                assert batch["rs_vs_spy"][j] == rs
+
+    def test_without_spy_is_neutral(self, panel):
+        close, first_valid = panel
+        batch = calc_momentum_quality_batch([{}] * close.shape[1], close, first_valid)
+        assert np.isnan(batch["rs_vs_spy"]).all()
+        col = pd.Series(close[:, 0])
+        assert batch["mq"][0] == calc_momentum_quality({}, col)[0]
+
 
 # ---------------------------------------------------------------------------
 # Revision Momentum
@@ -169,6 +223,33 @@ class TestRevisionMomentum:
         assert score is not None
         assert 0 <= score <= 1
 
+    def test_mixed_transitions_use_latest_eight_weeks(self):
+        """Only the newest 8 weeks count; flat weeks are neither direction."""
+        grades = ["A", "B", "B", "A-", "C", None, "B", "B-", "F", "F"]
+        history = [
+            {"_metadata": {"generated_at": f"2026-03-{28 - 3 * i:02d}T12:00:00"},
+             "scores": {"AAPL": {"sa_revisions": g}}}
+            for i, g in enumerate(grades)
+        ]
+        score, direction, delta = calc_revision_momentum("AAPL", history)
+        assert score == pytest.approx(0.6833333333333333)
+        assert direction == "positive"
+        assert delta == 0.083
+        assert calc_revision_momentum("AAPL", history[:8]) == (score, direction, delta)
+
+    @pytest.mark.parametrize("oldest", ["not-a-date", "2026-01-18T12:00:00+00:00", 20260118])
+    def test_unusable_timestamps_skip_span_gate(self, oldest):
+        """Timestamps that do not parse or compare leave the gate open."""
+        history = [
+            {"_metadata": {"generated_at": "2026-02-15T12:00:00"},
+             "scores": {"AAPL": {"sa_revisions": "B"}}}
+            for _ in range(4)
+        ]
+        history[-1]["_metadata"] = {"generated_at": oldest}
+        score, direction, _ = calc_revision_momentum("AAPL", history)
+        assert score is not None
+        assert direction == "flat"
+
 
 # ---------------------------------------------------------------------------
 # FQ: Fundamental Quality
@@ -245,6 +326,35 @@ class TestTechnicalOversold:
         to_oversold, _ = calc_technical_oversold(oversold)
         assert to_oversold > to_normal
 
+    def test_without_stats_matches_bundle(self, uptrend_close):
+        stats = bundle_stats(compute_rolling_bundle(uptrend_close.to_numpy()))
+        assert calc_technical_oversold(uptrend_close) == calc_technical_oversold(
+            uptrend_close, stats=stats,
+        )
+        assert calc_momentum_quality({}, uptrend_close) == calc_momentum_quality(
+            {}, uptrend_close, stats=stats,
+        )
+
+
+class TestScoreTables:
+    @pytest.mark.parametrize("up", [False, True])
+    @pytest.mark.parametrize("above", [False, True])
+    def test_trend_table(self, up, above):
+        expected = {(True, True): 1.0, (True, False): 0.5, (False, True): 0.4}
+        assert _TREND_TABLE[up << 1 | above] == expected.get((up, above), 0.1)
+
+    @pytest.mark.parametrize("bullish", [False, True])
+    @pytest.mark.parametrize("rising", [False, True])
+    @pytest.mark.parametrize("below", [False, True])
+    def test_macd_table(self, bullish, rising, below):
+        if bullish:
+            expected = 1.0 if below else 0.7
+        elif rising:
+            expected = 0.6 if below else 0.3
+        else:
+            expected = 0.0
+        assert _MACD_TABLE[bullish << 2 | rising << 1 | below] == expected
+
 
 # ---------------------------------------------------------------------------
 # MR: Market Regime
@@ -280,6 +390,15 @@ class TestMarketRegime:
         mr = calc_market_regime(40.0, 0.99, False, breadth_pct=0.15)
         assert mr > 0.3  # High VIX contrarian boost despite bad trends
 
+    @pytest.mark.parametrize(("vix", "vix_score"), [
+        (10.0, 0.2), (14.0, 0.2), (17.0, 0.35), (20.0, 0.5),
+        (24.0, 0.625), (28.0, 0.75), (34.0, 0.875), (40.0, 1.0), (60.0, 1.0),
+        (float("nan"), 1.0),
+    ])
+    def test_vix_piecewise(self, vix, vix_score):
+        mr = calc_market_regime(vix, 0.5, False)
+        assert mr == pytest.approx(vix_score * 0.60 + 0.4 * 0.40)
+
 
 # ---------------------------------------------------------------------------
 # VC: Valuation Context
@@ -303,3 +422,38 @@ class TestValuationContext:
         vc_weak = calc_valuation_context(sa_data_weak)
         # C+ valuation (strong) vs D+ valuation (weak)
         assert vc_strong > vc_weak
+
+
+# ---------------------------------------------------------------------------
+# Compiled config
+# ---------------------------------------------------------------------------
+
+class TestCompiledSubscoreConfig:
+    def test_none_shares_default_instance(self):
+        compiled = CompiledSubscoreConfig.from_config(None)
+        assert compiled is CompiledSubscoreConfig.from_config(None)
+        assert compiled == CompiledSubscoreConfig()
+
+    def test_reads_threshold_config(self):
+        config = ThresholdConfig()
+        config.scoring.mq_weights.trend = 0.40
+        config.scoring.to_weights.macd = 0.05
+        config.scoring.profitability_blend.sa_weight = 0.50
+        config.scoring.revision_momentum.min_history_weeks = 5
+        compiled = CompiledSubscoreConfig.from_config(config)
+        assert compiled.mq_trend == 0.40
+        assert compiled.to_macd == 0.05
+        assert compiled.prof_blend_sa == 0.50
+        assert compiled.rev_min_history_weeks == 5
+
+    def test_precompiled_matches_config(self, uptrend_close, sa_data_strong):
+        config = ThresholdConfig()
+        config.scoring.mq_weights.trend = 0.40
+        config.scoring.to_weights.rsi = 0.45
+        compiled = CompiledSubscoreConfig.from_config(config)
+        assert calc_momentum_quality(
+            sa_data_strong, uptrend_close, config=config,
+        ) == calc_momentum_quality(sa_data_strong, uptrend_close, compiled=compiled)
+        assert calc_technical_oversold(
+            uptrend_close, config,
+        ) == calc_technical_oversold(uptrend_close, compiled=compiled)
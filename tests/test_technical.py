@@ -149,6 +149,17 @@ class TestOBV:
         # At minimum, verify result structure is valid
         assert result["price_trend"] in ("rising", "falling", "flat")
 
+    def test_obv_heavy_up_days_diverge_bullish(self):
+        """Small heavy-volume up days against larger light down days."""
+        n = 60
+        steps = np.where(np.arange(n) % 2 == 0, 0.5, -1.0)
+        close = pd.Series(100.0 + np.cumsum(steps))
+        vol = pd.Series(np.where(steps > 0, 3_000_000.0, 1_000_000.0))
+        result = calc_obv_divergence(close, vol)
+        assert result["price_trend"] == "falling"
+        assert result["obv_trend"] == "rising"
+        assert result["divergence"] == "bullish"
+
 
 # ---------------------------------------------------------------------------
 # RSI Bullish Divergence
@@ -166,6 +177,11 @@ class TestRSIDivergence:
         assert "price_low_recent" in result
         assert "rsi_low_recent" in result
 
+    def test_precomputed_rsi_series_matches(self, oversold_close):
+        rsi_series = calc_rsi(oversold_close, 14)
+        result = calc_rsi_bullish_divergence(oversold_close, rsi_series=rsi_series)
+        assert result == calc_rsi_bullish_divergence(oversold_close)
+
 
 # ---------------------------------------------------------------------------
 # Bollinger Band Breach
@@ -262,15 +278,15 @@ class TestPriceAcceleration:
 class TestConsecutiveDaysBelowSMA:
     def test_insufficient_data(self):
         close = pd.Series(range(100), dtype=float)
-        count, pct = calc_consecutive_days_below_sma(close)
+        count, sma = calc_consecutive_days_below_sma(close)
         assert count == 0
-        assert pct == 0.0
+        assert sma is None
 
     def test_uptrend_no_breach(self, uptrend_close):
-        count, pct = calc_consecutive_days_below_sma(uptrend_close)
+        count, sma = calc_consecutive_days_below_sma(uptrend_close)
         # Uptrend should generally be above SMA
         assert isinstance(count, int)
-        assert isinstance(pct, float)
+        assert sma == pytest.approx(uptrend_close.iloc[-200:].mean())
 
     def test_crash_triggers_count(self):
         """Sharp decline below 200d SMA should produce positive count."""
@@ -279,6 +295,17 @@ class TestConsecutiveDaysBelowSMA:
         # Add 20 days of crash >3% below SMA
         prices.extend([95.0] * 20)
         close = pd.Series(prices)
-        count, pct = calc_consecutive_days_below_sma(close)
+        count, sma = calc_consecutive_days_below_sma(close)
         assert count > 0
-        assert pct < 0
+        assert close.iloc[-1] < sma
+
+    def test_run_counts_only_trailing_breach(self):
+        """An earlier breach separated by a recovery does not extend the run."""
+        prices = [100.0] * 200 + [90.0] * 5 + [100.0] * 3 + [90.0] * 4
+        count, _ = calc_consecutive_days_below_sma(pd.Series(prices))
+        assert count == 4
+
+    def test_no_breach_on_last_bar(self):
+        prices = [100.0] * 200 + [90.0] * 5 + [100.0]
+        count, _ = calc_consecutive_days_below_sma(pd.Series(prices))
+        assert count == 0
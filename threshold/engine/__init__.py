@@ -2,18 +2,33 @@
 
 Public API:
   score_ticker   — Score a single ticker -> ScoringResult
+  score_tickers  — Score a wide price panel -> {ticker: ScoringResult}
+  score_universe — score_tickers spread across worker processes
+  round_results  — Round ScoringResults to display precision
+  resolve_board_views — Add sell_flags / signal_board to lean scan results
   ScoringResult  — TypedDict for scoring output
   ScoringContext — Shared per-run context (market regime, SPY, history)
   SignalBoard    — Typed container for scoring signals
 """
 
 from threshold.engine.context import ScoringContext
-from threshold.engine.scorer import ScoringResult, score_ticker
+from threshold.engine.scorer import (
+    ScoringResult,
+    resolve_board_views,
+    round_results,
+    score_ticker,
+)
+from threshold.engine.scorer_batch import score_tickers
+from threshold.engine.scorer_parallel import score_universe
 from threshold.engine.signals import SignalBoard
 
 __all__ = [
     "ScoringContext",
     "ScoringResult",
     "SignalBoard",
+    "resolve_board_views",
+    "round_results",
     "score_ticker",
+    "score_tickers",
+    "score_universe",
 ]
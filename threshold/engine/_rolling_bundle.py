@@ -0,0 +1,111 @@
+"""Fused trailing-window statistics for the scorer.
+
+Every rolling quantity score_ticker() needs at the latest bar — the 20d,
+50d and 200d SMAs, the 20d Bollinger std, the 8-week return and the run
+of days more than 3% below the 200d SMA — comes out of one pass over the
+close prices here, instead of each indicator and sub-score rolling its
+own copy of the series. Works column-wise, so a whole (T x N) price
+panel costs the same handful of reductions as a single ticker.
+"""
+
+from __future__ import annotations
+
+from typing import TypedDict
+
+import numpy as np
+
+from threshold.engine.technical import RollingStats
+
+
+class RollingBundle(TypedDict):
+    """Latest-bar statistics per column, one (N,) array per field."""
+    sma_20: np.ndarray
+    std_20: np.ndarray
+    sma_50: np.ndarray
+    sma_200: np.ndarray
+    ret_8w: np.ndarray
+    days_below_sma: np.ndarray
+
+
+def _trailing_mean(close: np.ndarray, window: int) -> np.ndarray:
+    """Mean of the last ``window`` rows; NaN when there are fewer rows."""
+    if len(close) < window:
+        return np.full(close.shape[1], np.nan)
+    return np.asarray(close[-window:].mean(axis=0, dtype=np.float64))
+
+
+def compute_rolling_bundle(
+    close: np.ndarray,
+    first_valid: np.ndarray | None = None,
+    threshold: float = -0.03,
+) -> RollingBundle:
+    """Compute all latest-bar rolling statistics for a price series or panel.
+
+    Parameters:
+        close: Close prices, 1-D (one ticker) or (T x N). Each column may
+            be NaN only before its ``first_valid`` row (late listings); a
+            window reaching into that block comes out NaN, exactly like a
+            too-short history. float32 input is accepted — every mean,
+            std and running sum accumulates in float64.
+        first_valid: First non-NaN row per column (default: row 0).
+        threshold: Fractional distance below the 200d SMA that counts as
+            a breach day (sell criterion #3).
+
+    Returns:
+        RollingBundle of (N,) float64 arrays (``days_below_sma``: int).
+    """
+    if close.ndim == 1:
+        close = close[:, None]
+    n_rows, n_cols = close.shape
+    if first_valid is None:
+        first_valid = np.zeros(n_cols, dtype=int)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        sma_20 = _trailing_mean(close, 20)
+        sma_50 = _trailing_mean(close, 50)
+        sma_200 = _trailing_mean(close, 200)
+        if n_rows >= 20:
+            std_20 = close[-20:].std(axis=0, ddof=1, dtype=np.float64)
+        else:
+            std_20 = np.full(n_cols, np.nan)
+        if n_rows >= 40:
+            ret_8w = close[-1].astype(np.float64) / close[-40] - 1.0
+        else:
+            ret_8w = np.full(n_cols, np.nan)
+
+        # Full 200d SMA series from running sums (leading NaNs add zero),
+        # masked until each column has 200 real bars
+        days_below = np.zeros(n_cols, dtype=int)
+        if n_rows >= 200:
+            csum = np.cumsum(np.nan_to_num(close), axis=0, dtype=np.float64)
+            sma = np.full(close.shape, np.nan)
+            sma[199:] = csum[199:]
+            sma[200:] -= csum[:-200]
+            sma /= 200
+            sma[np.arange(n_rows)[:, None] < first_valid + 199] = np.nan
+            below = (close - sma) / sma < threshold
+
+            # Trailing run of True: position of the first False from the end
+            days_below = np.argmin(below[::-1], axis=0)
+            days_below[below.all(axis=0)] = n_rows
+
+    return RollingBundle(
+        sma_20=sma_20,
+        std_20=std_20,
+        sma_50=sma_50,
+        sma_200=sma_200,
+        ret_8w=ret_8w,
+        days_below_sma=days_below,
+    )
+
+
+def bundle_stats(bundle: RollingBundle, col: int = 0) -> RollingStats:
+    """Extract one column of a bundle as the RollingStats the helpers take."""
+    return RollingStats(
+        sma_20=bundle["sma_20"][col],
+        std_20=bundle["std_20"][col],
+        sma_50=bundle["sma_50"][col],
+        sma_200=bundle["sma_200"][col],
+        ret_8w=bundle["ret_8w"][col],
+        days_below_sma=int(bundle["days_below_sma"][col]),
+    )
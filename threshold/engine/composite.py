@@ -5,6 +5,7 @@ Functions:
   apply_obv_boost           — +up to 5 pts for OBV bullish divergence
   apply_rsi_divergence_boost — +3 pts for RSI divergence when DCS >= 60
   apply_falling_knife_filter — Cap DCS in downtrends (defense-aware)
+  resolve_falling_knife_caps — Falling-knife caps per defense class from config
   apply_drawdown_modifier    — D-5 rule: adjust DCS by defense class in FEAR/PANIC
   classify_dcs              — DCS -> signal classification string
   classify_vix              — VIX -> regime classification string
@@ -75,14 +76,36 @@ def apply_falling_knife_filter(
     trend_score: float,
     dd_classification: str | None = None,
     config: Any | None = None,
+    caps: tuple[dict[str, int], dict[str, int]] | None = None,
 ) -> tuple[float, int | None]:
     """Cap DCS if trend context is bearish — defense-aware.
 
     Hedges/defensives get softer caps (counter-cyclical value).
     Amplifiers/cyclicals get harsher caps (magnify losses).
 
+    ``caps`` is a precomputed ``resolve_falling_knife_caps(config)``; when
+    given, ``config`` is not read.
+
     Returns (capped_dcs, cap_applied) — cap_applied is None if no cap.
     """
+    if not trend_score <= 0.4:  # Also no cap for a NaN trend score
+        return dcs_raw, None
+
+    if caps is None:
+        caps = resolve_falling_knife_caps(config)
+    freefall_caps, downtrend_caps = caps
+
+    if trend_score <= 0.1:
+        cap = freefall_caps.get(dd_classification, 30) if dd_classification else 30
+    else:
+        cap = downtrend_caps.get(dd_classification, 50) if dd_classification else 50
+    return min(dcs_raw, cap), cap
+
+
+def resolve_falling_knife_caps(
+    config: Any | None = None,
+) -> tuple[dict[str, int], dict[str, int]]:
+    """Return the (freefall, downtrend) caps per defense class for ``config``."""
     # Default caps
     freefall_caps = {
         "HEDGE": 50, "DEFENSIVE": 45, "MODERATE": 30,
@@ -103,13 +126,7 @@ def apply_falling_knife_filter(
             if hasattr(fk, "downtrend"):
                 downtrend_caps = dict(fk.downtrend)
 
-    if trend_score <= 0.1:
-        cap = freefall_caps.get(dd_classification, 30) if dd_classification else 30
-        return min(dcs_raw, cap), cap
-    if trend_score <= 0.4:
-        cap = downtrend_caps.get(dd_classification, 50) if dd_classification else 50
-        return min(dcs_raw, cap), cap
-    return dcs_raw, None
+    return freefall_caps, downtrend_caps
 
 
 def apply_drawdown_modifier(
@@ -10,7 +10,7 @@ Ticker-specific data (``sa_data``, ``price_df``) remains positional.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
 import pandas as pd
@@ -41,7 +41,11 @@ class ScoringContext:
     """Pre-computed MR sub-score from ``calc_market_regime()`` (15% of DCS)."""
 
     vix_regime: str | None = None
-    """VIX regime string: 'COMPLACENT', 'NORMAL', 'FEAR', or 'PANIC'."""
+    """VIX regime string: 'COMPLACENT', 'NORMAL', 'FEAR', or 'PANIC'.
+
+    Classified once per run; ``score_ticker()`` reads it from here rather
+    than calling ``classify_vix()`` per ticker.
+    """
 
     # --- SPY data (constant per run) ---
     spy_close: pd.Series | None = None
@@ -62,6 +66,16 @@ class ScoringContext:
     drawdown_classifications: dict[str, dict[str, Any]] | None = None
     """Drawdown defense classifications."""
 
+    _dd_aliases: dict[str, str] = field(
+        init=False, repr=False, compare=False, default_factory=dict,
+    )
+    """Dashed spelling -> dotted key of ``drawdown_classifications``."""
+
+    _dd_aliases_for: tuple[int, int] | None = field(
+        init=False, repr=False, compare=False, default=None,
+    )
+    """``(id, len)`` of the classifications dict ``_dd_aliases`` was built from."""
+
     # ------------------------------------------------------------------
     # Convenience accessors (per-ticker lookups into shared dicts)
     # ------------------------------------------------------------------
@@ -72,6 +86,31 @@ class ScoringContext:
             return None
         return self.yf_fundamentals.get(ticker)
 
+    def get_drawdown_classification(self, ticker: str) -> dict[str, Any] | None:
+        """Return the drawdown classification for a ticker, or None.
+
+        Matches either share-class spelling (``BRK-B`` or ``BRK.B``).
+        """
+        dd = self.drawdown_classifications
+        if not dd:
+            return None
+        info = dd.get(ticker)
+        if info:
+            return info
+        # Classifications are keyed by the DB spelling (BRK.B) while prices
+        # use yfinance's (BRK-B). The dashed aliases are built on first use
+        # and rebuilt whenever the dict is replaced or grows or shrinks, so
+        # filling the context after construction still works; values are
+        # always read from the live dict.
+        if self._dd_aliases_for != (id(dd), len(dd)):
+            self._dd_aliases = {
+                key.replace(".", "-"): key
+                for key in dd if "." in key and "-" not in key
+            }
+            self._dd_aliases_for = (id(dd), len(dd))
+        dotted = self._dd_aliases.get(ticker)
+        return dd.get(dotted) if dotted is not None else None
+
     def get_prev_sa_data(self, ticker: str) -> dict[str, Any] | None:
         """Return previous week's SA data for a specific ticker, or None."""
         if self.prev_scores is None:
@@ -27,7 +27,7 @@ logger = logging.getLogger(__name__)
 # Data types
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class GracePeriodStatus:
     """Status of a ticker's grace period."""
 
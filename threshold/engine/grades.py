@@ -6,6 +6,10 @@ from typing import Any
 
 from threshold.config.defaults import GRADE_TO_NUM
 
+# Normalized score per canonical grade string, the form SA data arrives in;
+# anything else (lower case, padding, non-str) takes the parsing path
+_NORM_BY_GRADE: dict[str, float] = {g: (n - 1) / 12.0 for g, n in GRADE_TO_NUM.items()}
+
 
 def sa_grade_to_norm(grade: Any) -> float:
     """Convert an SA letter grade to a normalized 0.0-1.0 score.
@@ -14,6 +18,10 @@ def sa_grade_to_norm(grade: Any) -> float:
     """
     if grade is None:
         return 0.5
+    if isinstance(grade, str):
+        norm = _NORM_BY_GRADE.get(grade)
+        if norm is not None:
+            return norm
     grade_str = str(grade).strip().upper()
     if not grade_str or grade_str in ("N/A", "NONE", "-", ""):
         return 0.5
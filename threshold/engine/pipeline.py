@@ -32,7 +32,12 @@ from threshold.engine.grace_period import (
     expire_overdue_grace_periods,
     list_active_grace_periods,
 )
-from threshold.engine.scorer import ScoringResult, score_ticker
+from threshold.engine.scorer import (
+    CompiledScoringConfig,
+    ScoringResult,
+    round_results,
+    score_ticker,
+)
 from threshold.portfolio.correlation import (
     CorrelationReport,
     check_concentration_risk,
@@ -58,7 +63,7 @@ logger = logging.getLogger(__name__)
 # Run tracker
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class RunTracker:
     """Tracks the state and metrics of a scoring run."""
 
@@ -89,7 +94,7 @@ class RunTracker:
 # Pipeline result
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class PipelineResult:
     """Result from a full scoring pipeline run."""
 
@@ -286,6 +291,12 @@ def _compute_market_context(
         "market_regime_score": 0.5,
     }
 
+    # Everything below indexes (Price, Ticker) columns; a flat frame means
+    # yfinance returned a single-ticker shape and the context is meaningless.
+    if not isinstance(batch_data.columns, pd.MultiIndex):
+        logger.warning("  yfinance returned non-MultiIndex data; market context unavailable")
+        return result
+
     # SPY
     spy_close = _extract_close(batch_data, "SPY")
     if spy_close is not None and len(spy_close) >= 200:
@@ -312,16 +323,15 @@ def _compute_market_context(
     # Breadth: % of tickers above their 200d SMA
     above_count = 0
     total_count = 0
-    if isinstance(batch_data.columns, pd.MultiIndex):
-        for ticker in batch_data["Close"].columns:
-            if ticker in ("SPY", "^VIX") or ticker.startswith("^"):
-                continue
-            series = batch_data["Close"][ticker].dropna()
-            if len(series) >= 200:
-                sma = series.rolling(200).mean().iloc[-1]
-                if series.iloc[-1] > sma:
-                    above_count += 1
-                total_count += 1
+    for ticker in batch_data["Close"].columns:
+        if ticker in ("SPY", "^VIX") or ticker.startswith("^"):
+            continue
+        series = batch_data["Close"][ticker].dropna()
+        if len(series) >= 200:
+            sma = series.rolling(200).mean().iloc[-1]
+            if series.iloc[-1] > sma:
+                above_count += 1
+            total_count += 1
 
     result["breadth_above"] = above_count
     result["breadth_total"] = total_count
@@ -498,6 +508,7 @@ def run_scoring_pipeline(
     # ------------------------------------------------------------------
     scored_results: dict[str, ScoringResult] = {}
     errors: list[str] = []
+    compiled = CompiledScoringConfig.from_config(config)
 
     for ticker in tickers_to_score:
         try:
@@ -520,6 +531,7 @@ def run_scoring_pipeline(
                 price_df=price_df,
                 ctx=ctx,
                 config=config,
+                compiled=compiled,
             )
 
             if scoring_result is not None:
@@ -536,6 +548,9 @@ def run_scoring_pipeline(
             errors.append(f"{ticker}: {e}")
             logger.error("  %s: scoring error: %s", ticker, e)
 
+    # Scores stay full precision through scoring; round them once here,
+    # before anything reports, compares or persists them
+    round_results(scored_results)
     result.scores = scored_results
 
     logger.info(
@@ -556,9 +571,10 @@ def run_scoring_pipeline(
     logger.info("[5/6] Correlation analysis...")
 
     # Build returns DataFrame for held tickers
+    meta_get = ticker_meta.get
     held_tickers = [
         t for t in scored_results
-        if ticker_meta.get(t, {}).get("type") != "watchlist"
+        if meta_get(t, {}).get("type") != "watchlist"
     ]
 
     if len(held_tickers) >= 3:
@@ -566,8 +582,9 @@ def run_scoring_pipeline(
         for ticker in held_tickers:
             close = _extract_close(batch_data, ticker)
             if close is not None and len(close) >= 90:
-                # Use last 90 days of daily returns
-                returns_data[ticker] = close.pct_change().dropna().tail(90)
+                # Use last 90 days of daily returns (slice first: pct_change
+                # only needs the prior bar, so 91 closes yield 90 returns)
+                returns_data[ticker] = close.iloc[-91:].pct_change().dropna()
 
         if returns_data:
             returns_df = pd.DataFrame(returns_data)
@@ -580,9 +597,10 @@ def run_scoring_pipeline(
             )
 
             # Check concentration risk
+            buy_dip = config.scoring.thresholds.buy_dip
             buy_tickers = {
                 t for t, r in scored_results.items()
-                if r.get("dcs", 0) >= config.scoring.thresholds.buy_dip
+                if r.get("dcs", 0) >= buy_dip
             }
             result.concentration_warnings = check_concentration_risk(
                 high_corr_pairs=result.correlation.high_corr_pairs,
@@ -664,6 +682,9 @@ def _persist_results(
                     metadata=sig.get("metadata"),
                 )
 
+        # Stamp completion once, after all score rows are written
+        finished_at = datetime.now().isoformat()
+
         # Update data freshness
         update_data_freshness(db, "scoring", "ok", f"Run {tracker.run_id}")
 
@@ -671,7 +692,7 @@ def _persist_results(
         update_scoring_run(
             db,
             tracker.run_id,
-            finished_at=datetime.now().isoformat(),
+            finished_at=finished_at,
             status="completed",
         )
 
@@ -21,13 +21,21 @@ Integration: Optional portfolio weighting in pipeline.py.
 
 from __future__ import annotations
 
+import hashlib
+from collections import OrderedDict
 from typing import TypedDict
 
 import numpy as np
 import pandas as pd
-from scipy.cluster.hierarchy import leaves_list, linkage
 from scipy.spatial.distance import squareform
 
+try:
+    # Drop-in replacement with faster single/average linkage (SLINK /
+    # nearest-neighbour chain); same Z-matrix format as scipy.
+    from fastcluster import linkage
+except ImportError:
+    from scipy.cluster.hierarchy import linkage
+
 
 class HRPResult(TypedDict):
     """Result from HRP allocation."""
@@ -47,21 +55,35 @@ class HRPAllocator:
         # result["weights"] = {"AAPL": 0.08, "MSFT": 0.12, ...}
 
     Parameters:
-        linkage_method: Clustering method for scipy linkage.
+        linkage_method: Clustering method for hierarchical linkage
+            (fastcluster when installed, otherwise scipy).
             "single" (default, per paper), "complete", or "average".
         min_periods: Minimum observations required for correlation.
+        cache_size: Number of clustering structures (dendrogram order and
+            reordered covariance) kept per allocator, keyed on a hash of
+            the returns matrix. 0 disables caching.
+        float_dtype: Precision for the correlation / covariance path.
+            float64 (default) or float32, which halves the memory of the
+            N x N matrices for large universes at a small precision cost.
     """
 
     def __init__(
         self,
         linkage_method: str = "single",
         min_periods: int = 60,
+        cache_size: int = 32,
+        float_dtype: type[np.floating] = np.float64,
     ) -> None:
         self.linkage_method = linkage_method
         self.min_periods = min_periods
+        self.cache_size = cache_size
+        self.float_dtype = np.dtype(float_dtype)
+        self._structure_cache: OrderedDict[
+            tuple, tuple[np.ndarray, np.ndarray]
+        ] = OrderedDict()
 
-    def _correlation_distance(self, corr: pd.DataFrame) -> np.ndarray:
-        """Compute correlation distance matrix.
+    def _correlation_distance(self, corr: np.ndarray) -> np.ndarray:
+        """Compute condensed correlation distances.
 
         d(i,j) = sqrt(0.5 * (1 - ρ_ij))
 
@@ -69,88 +91,204 @@ class HRPAllocator:
         - ρ = +1 → d = 0 (identical)
         - ρ = 0  → d ≈ 0.707
         - ρ = -1 → d = 1 (maximally different)
+
+        Only the strict upper triangle is evaluated, so the result is
+        already in scipy's condensed form (length n(n-1)/2) — no square
+        matrix, diagonal fix-up or symmetrization pass is needed. scipy's
+        ``squareform`` copies the triangle in C (no n² index arrays) and
+        the transform is then applied in place on that vector.
         """
-        dist = np.sqrt(0.5 * (1 - corr.values))
-        # Ensure diagonal is exactly zero and symmetry
-        np.fill_diagonal(dist, 0.0)
-        dist = (dist + dist.T) / 2  # Force symmetry
+        dist: np.ndarray = 1.0 - squareform(corr, force="tovector", checks=False)
+        dist *= 0.5
+        np.sqrt(dist, out=dist)
         return dist
 
-    def _quasi_diagonalize(self, link: np.ndarray, n: int) -> list[int]:
+    def _quasi_diagonalize(self, link: np.ndarray, n: int) -> np.ndarray:
         """Reorder assets according to dendrogram leaf order.
 
+        Walks the linkage matrix iteratively from the root (cluster
+        ``2n - 2``): row ``c - n`` of ``link`` holds the two children
+        merged into cluster ``c``; ids below ``n`` are original assets.
+        Pushing the right child first yields the same left-to-right
+        order as scipy's ``leaves_list``.
+
         Parameters:
             link: Linkage matrix from scipy.
             n: Number of original assets.
 
         Returns:
-            List of asset indices in quasi-diagonal order.
+            Array of asset indices in quasi-diagonal order.
         """
-        return list(leaves_list(link))
-
-    def _get_cluster_variance(
-        self, cov: pd.DataFrame, items: list[int]
-    ) -> float:
+        order = np.empty(n, dtype=np.intp)
+        stack = [2 * n - 2]
+        i = 0
+        while stack:
+            c = stack.pop()
+            if c < n:
+                order[i] = c
+                i += 1
+            else:
+                row = link[c - n]
+                stack.append(int(row[1]))
+                stack.append(int(row[0]))
+        return order
+
+    def _get_cluster_variances(
+        self,
+        cov: np.ndarray,
+        inv_diag: np.ndarray,
+        lo: np.ndarray,
+        hi: np.ndarray,
+    ) -> np.ndarray:
         """Compute the variance of the inverse-variance portfolio
-        within a cluster.
+        within each of a batch of clusters.
 
         This is used for the recursive bisection step: each branch
         of the dendrogram gets weight proportional to the inverse
         of its cluster variance.
+
+        ``cov`` must already be in quasi-diagonal order so cluster ``k``
+        is the contiguous block ``[lo[k], hi[k])``.  Clusters at one
+        dendrogram level differ in size by at most one, so they are
+        padded to a common width (padding gets zero weight) and all
+        quadratic forms are evaluated in a single einsum.
+
+        ``inv_diag`` is ``1 / diag(cov)``, computed once per bisection.
         """
-        cov_slice = cov.iloc[items, items]
-        ivp = 1.0 / np.diag(cov_slice.values)
-        ivp /= ivp.sum()
-        # Cluster variance = w' Σ w
-        cluster_var = float(ivp @ cov_slice.values @ ivp)
-        return cluster_var
-
-    def _recursive_bisection(
-        self, cov: pd.DataFrame, sort_ix: list[int]
-    ) -> pd.Series:
+        sizes = hi - lo
+        offsets = np.arange(sizes.max())
+        mask = offsets < sizes[:, None]
+        idx = np.where(mask, lo[:, None] + offsets, lo[:, None])
+
+        ivp = np.where(mask, inv_diag[idx], 0.0)
+        ivp /= ivp.sum(axis=1, keepdims=True)
+        blocks = cov[idx[:, :, None], idx[:, None, :]]
+        # Cluster variance = w' Σ w, per cluster
+        return np.asarray(np.einsum("ij,ijk,ik->i", ivp, blocks, ivp))
+
+    def _recursive_bisection(self, cov: np.ndarray) -> np.ndarray:
         """Recursive bisection: allocate weights top-down.
 
         Starting from the full sorted list, split into halves.
         Each half gets weight proportional to the inverse of its
         cluster variance. Recurse until single assets remain.
-        """
-        weights = pd.Series(1.0, index=sort_ix)
 
-        # List of clusters to process
-        clusters = [sort_ix]
-
-        while clusters:
-            new_clusters = []
-            for cluster in clusters:
-                if len(cluster) <= 1:
-                    continue
+        ``cov`` is the covariance reordered to quasi-diagonal order, so
+        every cluster is a ``[lo, hi)`` position range and weights are
+        returned in that same order.  Each dendrogram level is processed
+        as one batch.
+        """
+        n = cov.shape[0]
+        weights = np.ones(n, dtype=np.float64)
+        # Inverse variances are shared by every cluster at every level
+        inv_diag = 1.0 / np.diag(cov)
+
+        # Clusters still to split at the current level, as [lo, hi) ranges
+        lo = np.array([0])
+        hi = np.array([n])
+
+        while lo.size:
+            # Split every cluster into two halves
+            mid = lo + (hi - lo) // 2
+
+            # Compute left and right cluster variances in one batch
+            k = lo.size
+            variances = self._get_cluster_variances(
+                cov, inv_diag, np.concatenate([lo, mid]), np.concatenate([mid, hi])
+            )
+            var_left = variances[:k]
+            var_right = variances[k:]
+
+            # Allocation factor: inverse of cluster variance
+            total_var = var_left + var_right
+            safe_total = np.where(total_var < 1e-12, 1.0, total_var)
+            alpha = np.where(total_var < 1e-12, 0.5, 1.0 - var_left / safe_total)
+
+            # Scale weights: expand each half's factor over its positions
+            starts = np.concatenate([lo, mid])
+            lengths = np.concatenate([mid - lo, hi - mid])
+            factors = np.concatenate([alpha, 1.0 - alpha])
+            seg_offsets = np.arange(lengths.sum()) - np.repeat(
+                np.cumsum(lengths) - lengths, lengths
+            )
+            weights[np.repeat(starts, lengths) + seg_offsets] *= np.repeat(
+                factors, lengths
+            )
 
-                # Split into two halves
-                mid = len(cluster) // 2
-                left = cluster[:mid]
-                right = cluster[mid:]
+            # Sub-clusters with more than one asset go to the next level
+            keep = lengths > 1
+            lo = starts[keep]
+            hi = (starts + lengths)[keep]
 
-                # Compute cluster variances
-                var_left = self._get_cluster_variance(cov, left)
-                var_right = self._get_cluster_variance(cov, right)
+        return weights
 
-                # Allocation factor: inverse of cluster variance
-                total_var = var_left + var_right
-                alpha = 0.5 if total_var < 1e-12 else 1.0 - var_left / total_var
+    def _covariance_and_correlation(
+        self, arr: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Sample covariance and correlation of the columns of ``arr``.
 
-                # Scale weights
-                weights[left] *= alpha
-                weights[right] *= (1.0 - alpha)
+        Uses the Gram-matrix identity (X = ``arr``)
+        ``Σ = (XᵀX - T·μμᵀ) / (T - 1)`` so the T x N returns matrix is
+        never centred into a full copy (``XᵀX`` dispatches to BLAS syrk),
+        and derives the correlation from the same covariance instead of
+        a second pass.
+        """
+        t = arr.shape[0]
+        mu = arr.mean(axis=0)
+        cov = (arr.T @ arr - t * np.outer(mu, mu)) / (t - 1)
+        sd = np.sqrt(np.diag(cov))
+        corr = cov / np.outer(sd, sd)
+        # Match np.corrcoef: clip rounding excursions, exact unit diagonal
+        np.clip(corr, -1.0, 1.0, out=corr)
+        np.fill_diagonal(corr, 1.0)
+        return cov, corr
+
+    def _build_structure(self, arr: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Cluster the returns and reorder the covariance.
 
-                # Add sub-clusters for further processing
-                if len(left) > 1:
-                    new_clusters.append(left)
-                if len(right) > 1:
-                    new_clusters.append(right)
+        Returns:
+            (sort_ix, cov_sorted) — dendrogram leaf order and the
+            covariance permuted into that order.
+        """
+        # Step 1: Correlation → distance
+        cov, corr = self._covariance_and_correlation(arr)
+        condensed = self._correlation_distance(corr)
 
-            clusters = new_clusters
+        # Step 2: Hierarchical clustering
+        link = linkage(condensed, method=self.linkage_method)
 
-        return weights
+        # Step 3: Quasi-diagonalize
+        sort_ix = self._quasi_diagonalize(link, arr.shape[1])
+
+        # Reorder the covariance once into quasi-diagonal order so every
+        # cluster in the bisection is a contiguous block
+        cov_sorted = np.ascontiguousarray(cov[np.ix_(sort_ix, sort_ix)])
+        return sort_ix, cov_sorted
+
+    def _get_structure(self, arr: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Return the clustering structure for ``arr``, using the LRU cache."""
+        if self.cache_size <= 0:
+            return self._build_structure(arr)
+
+        key = (
+            arr.shape,
+            arr.dtype.str,
+            self.linkage_method,
+            hashlib.blake2b(arr.tobytes(), digest_size=16).digest(),
+        )
+        cached = self._structure_cache.get(key)
+        if cached is not None:
+            self._structure_cache.move_to_end(key)
+            return cached
+
+        sort_ix, cov_sorted = self._build_structure(arr)
+        # Cached arrays are shared between calls — guard against mutation
+        sort_ix.flags.writeable = False
+        cov_sorted.flags.writeable = False
+        self._structure_cache[key] = (sort_ix, cov_sorted)
+        if len(self._structure_cache) > self.cache_size:
+            self._structure_cache.popitem(last=False)
+        return sort_ix, cov_sorted
 
     def compute_weights(
         self,
@@ -196,42 +334,34 @@ class HRPAllocator:
         working = returns[cols].dropna()
         if len(working) < self.min_periods:
             # Insufficient data — fall back to equal weight
-            n = len(cols)
+            equal = round(1.0 / len(cols), 6)
             return HRPResult(
-                weights={c: round(1.0 / n, 6) for c in cols},
+                weights=dict.fromkeys(cols, equal),
                 cluster_order=cols,
-                n_assets=n,
+                n_assets=len(cols),
                 method="hrp",
             )
 
-        # Step 1: Correlation → distance
-        corr = working.corr()
-        dist_matrix = self._correlation_distance(corr)
-
-        # Convert to condensed form for scipy
-        condensed = squareform(dist_matrix, checks=False)
+        # Work on the raw ndarray from here on; names are only needed
+        # again when mapping weights back at the end.
+        arr = working.to_numpy(dtype=self.float_dtype)
 
-        # Step 2: Hierarchical clustering
-        link = linkage(condensed, method=self.linkage_method)
-
-        # Step 3: Quasi-diagonalize
-        sort_ix = self._quasi_diagonalize(link, len(cols))
+        # Steps 1-3 (+ covariance reorder), reused when returns are unchanged
+        sort_ix, cov_sorted = self._get_structure(arr)
 
         # Step 4: Recursive bisection
-        cov = working.cov()
-        weights_series = self._recursive_bisection(cov, sort_ix)
+        weights = self._recursive_bisection(cov_sorted)
 
         # Normalize to sum to 1 (should already be close)
-        total = weights_series.sum()
+        total = weights.sum()
         if total > 0:
-            weights_series /= total
+            weights /= total
 
         # Map back to asset names
         sorted_names = [cols[i] for i in sort_ix]
-        weights_dict = {}
-        for idx, w in weights_series.items():
-            asset_name = cols[idx]
-            weights_dict[asset_name] = round(float(w), 6)
+        weights_dict = dict(
+            zip(sorted_names, np.round(weights, 6).tolist(), strict=True)
+        )
 
         return HRPResult(
             weights=weights_dict,
@@ -59,21 +59,24 @@ class InverseVolWeighter:
         self.min_periods = min_periods
         self.annualization_factor = annualization_factor
 
-    def _compute_volatilities(self, returns: pd.DataFrame) -> pd.Series:
+    def _compute_volatilities(self, returns: np.ndarray) -> np.ndarray:
         """Compute annualized volatility for each asset.
 
         Parameters:
-            returns: Daily returns DataFrame with columns as asset names.
+            returns: Daily returns array (T x N), one column per asset;
+                NaN marks missing observations.
 
         Returns:
-            Series of annualized volatilities indexed by asset name.
+            Array of annualized volatilities, one per column.
         """
         # Use last `window` observations
-        recent = returns.iloc[-self.window:] if len(returns) > self.window else returns
+        recent = returns[-self.window:] if len(returns) > self.window else returns
 
-        # Standard deviation of daily returns, annualized
-        vols = recent.std(ddof=1) * np.sqrt(self.annualization_factor)
-        return vols
+        # Standard deviation of daily returns, annualized — one NaN-aware
+        # kernel over the raw array instead of per-column pandas dispatch
+        vol: np.ndarray = np.nanstd(recent, axis=0, ddof=1)
+        vol *= np.sqrt(self.annualization_factor)
+        return vol
 
     def compute_weights(
         self,
@@ -115,13 +118,12 @@ class InverseVolWeighter:
                 method="inverse_vol",
             )
 
-        working = returns[cols]
+        arr = returns[cols].to_numpy(dtype=np.float64)
 
-        # Drop assets with insufficient data
-        valid_cols = [
-            c for c in working.columns
-            if working[c].dropna().shape[0] >= self.min_periods
-        ]
+        # Drop assets with insufficient data: one isnan sweep counts the
+        # observations of every column, and the mask slices the same array
+        keep = np.count_nonzero(~np.isnan(arr), axis=0) >= self.min_periods
+        valid_cols = [c for c, ok in zip(cols, keep.tolist(), strict=True) if ok]
         if not valid_cols:
             return InverseVolResult(
                 weights={},
@@ -131,15 +133,15 @@ class InverseVolWeighter:
                 method="inverse_vol",
             )
 
-        working = working[valid_cols]
-        vols = self._compute_volatilities(working)
+        vols = self._compute_volatilities(arr[:, keep])
 
         # Replace zero/near-zero vol with small floor to avoid division by zero
         vol_floor = 1e-6
-        vols = vols.clip(lower=vol_floor)
+        vols = np.maximum(vols, vol_floor)
 
-        # Inverse variance raised to eta: w_i ∝ (1/σ²_i)^η
-        inv_var = (1.0 / (vols ** 2)) ** self.eta
+        # Inverse variance raised to eta: w_i ∝ (1/σ²_i)^η = σ_i^(-2η),
+        # a single elementwise power
+        inv_var = vols ** (-2.0 * self.eta)
 
         # Normalize to sum to 1
         total = inv_var.sum()
@@ -148,10 +150,11 @@ class InverseVolWeighter:
             n = len(valid_cols)
             weights = {c: 1.0 / n for c in valid_cols}
         else:
-            raw_weights = inv_var / total
-            weights = {c: round(float(w), 6) for c, w in raw_weights.items()}
+            weights = dict(
+                zip(valid_cols, np.round(inv_var / total, 6).tolist(), strict=True)
+            )
 
-        vol_dict = {c: round(float(v), 6) for c, v in vols.items()}
+        vol_dict = dict(zip(valid_cols, np.round(vols, 6).tolist(), strict=True))
 
         return InverseVolResult(
             weights=weights,
@@ -13,9 +13,50 @@ periodic tax optimization scans. Data stored in the tax_lots table.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import date, timedelta
+from datetime import date
 from typing import TypedDict
 
+import numpy as np
+
+_NAT = np.datetime64("NaT", "D")
+
+# Share-count tolerance when locating the HIFO lot that completes an order
+_SHARE_EPS = 1e-9
+
+# Trade actions that acquire shares and can trigger the wash sale rule
+_WASH_SALE_ACTIONS = ("buy", "reinvest", "transfer_in")
+
+
+def _iso_days(values: list) -> np.ndarray:
+    """Parse ISO ``YYYY-MM-DD`` strings into a ``datetime64[D]`` array.
+
+    Well-formed batches are parsed by numpy in one call; otherwise each
+    value goes through ``date.fromisoformat``. Unparseable values become
+    NaT, which compares False against any holding-period threshold.
+    """
+    if all(isinstance(v, str) and len(v) == 10 for v in values):
+        try:
+            return np.array(values, dtype="datetime64[D]")
+        except ValueError:
+            pass
+    days = np.full(len(values), _NAT)
+    for i, v in enumerate(values):
+        try:
+            days[i] = np.datetime64(date.fromisoformat(v), "D")
+        except (ValueError, TypeError):
+            continue
+    return days
+
+
+def _reference_day(iso_date: str | None) -> np.datetime64:
+    """Parse an optional ISO date, defaulting to today when missing or invalid."""
+    if iso_date:
+        try:
+            return np.datetime64(date.fromisoformat(iso_date), "D")
+        except (ValueError, TypeError):
+            pass
+    return np.datetime64(date.today(), "D")
+
 
 class TaxLot(TypedDict):
     """A single tax lot representing a purchase of shares."""
@@ -71,32 +112,6 @@ class HIFOSelector:
 
     long_term_days: int = 366
 
-    def _holding_period(self, acquired_at: str, sell_date: str | None = None) -> str:
-        """Classify holding period as short-term or long-term.
-
-        Parameters:
-            acquired_at: Acquisition date in ISO format.
-            sell_date: Sell date in ISO format. Defaults to today.
-
-        Returns:
-            "long_term" if held > long_term_days, else "short_term".
-        """
-        try:
-            acq = date.fromisoformat(acquired_at)
-        except (ValueError, TypeError):
-            return "short_term"  # Unknown → assume short
-
-        if sell_date:
-            try:
-                sell = date.fromisoformat(sell_date)
-            except (ValueError, TypeError):
-                sell = date.today()
-        else:
-            sell = date.today()
-
-        days_held = (sell - acq).days
-        return "long_term" if days_held >= self.long_term_days else "short_term"
-
     def select_lots(
         self,
         lots: list[TaxLot],
@@ -135,38 +150,55 @@ class HIFOSelector:
                 holding_periods=[],
             )
 
-        # Sort by cost basis per share DESCENDING (highest first = HIFO)
-        sorted_lots = sorted(
-            open_lots,
-            key=lambda x: x["cost_basis_per_share"],
-            reverse=True,
+        # Sort by cost basis per share DESCENDING (highest first = HIFO).
+        # Argsort a flat key array once instead of a dict lookup per
+        # comparison; sorting the negated key keeps ties in input order.
+        cost_basis = np.fromiter(
+            (lot["cost_basis_per_share"] for lot in open_lots),
+            dtype=np.float64,
+            count=len(open_lots),
+        )
+        order = np.argsort(-cost_basis, kind="stable")
+        cost_basis = cost_basis[order]
+        lot_shares = np.fromiter(
+            (open_lots[i]["shares"] for i in order.tolist()),
+            dtype=np.float64,
+            count=len(order),
         )
 
-        selected = []
-        remaining = shares_to_sell
-        total_cost_basis = 0.0
-        holding_periods = []
-
-        for lot in sorted_lots:
-            if remaining <= 0:
-                break
-
-            available = lot["shares"]
-            take = min(available, remaining)
-
-            selected.append({
+        # Lots before the one where cumulative shares first reach the order
+        # size are consumed whole; that lot is consumed partially. The small
+        # tolerance stops float residue from pulling in an extra ~0-share lot.
+        cumulative = np.cumsum(lot_shares)
+        k = min(
+            int(np.searchsorted(cumulative, shares_to_sell - _SHARE_EPS)),
+            len(order) - 1,
+        )
+        takes = lot_shares[: k + 1].copy()
+        already_taken = cumulative[k - 1] if k > 0 else 0.0
+        takes[k] = min(takes[k], shares_to_sell - already_taken)
+        total_cost_basis = float(takes @ cost_basis[: k + 1])
+        chosen = [open_lots[i] for i in order[: k + 1].tolist()]
+
+        # Round all per-lot share counts in one vectorized call
+        selected = [
+            {
                 "lot_id": lot["lot_id"],
-                "shares_to_sell": round(take, 6),
+                "shares_to_sell": take,
                 "cost_basis_per_share": lot["cost_basis_per_share"],
-            })
-
-            total_cost_basis += take * lot["cost_basis_per_share"]
-            holding_periods.append(
-                self._holding_period(lot["acquired_at"], sell_date)
-            )
-            remaining -= take
-
-        total_shares = shares_to_sell - max(remaining, 0)
+            }
+            for lot, take in zip(chosen, np.round(takes, 6).tolist(), strict=True)
+        ]
+        acquired = [lot["acquired_at"] for lot in chosen]
+
+        # Classify all selected lots at once against the sell date
+        held = _reference_day(sell_date) - _iso_days(acquired)
+        is_long = held >= np.timedelta64(self.long_term_days, "D")
+        holding_periods = [
+            "long_term" if long else "short_term" for long in is_long.tolist()
+        ]
+
+        total_shares = float(takes.sum())
         estimated_gain = total_shares * current_price - total_cost_basis
 
         return LotSelection(
@@ -221,31 +253,40 @@ class TaxLossHarvester:
         Returns:
             True if wash sale rule would be triggered.
         """
-        if reference_date:
-            try:
-                ref = date.fromisoformat(reference_date)
-            except (ValueError, TypeError):
-                ref = date.today()
-        else:
-            ref = date.today()
+        trade_days = self._index_trades(recent_trades).get(symbol)
+        return self._in_wash_sale_window(trade_days, _reference_day(reference_date))
 
-        window_start = ref - timedelta(days=self.wash_sale_window_days)
-        window_end = ref + timedelta(days=self.wash_sale_window_days)
+    def _index_trades(self, recent_trades: list[dict]) -> dict[str, np.ndarray]:
+        """Group wash-sale-relevant trade dates by symbol.
 
+        Returns symbol → sorted ``datetime64[D]`` array of buy /
+        reinvest / transfer-in dates (unparseable dates dropped), so each
+        per-symbol check is a binary search instead of a full scan.
+        """
+        dates_by_symbol: dict[str, list] = {}
         for trade in recent_trades:
-            if trade.get("symbol") != symbol:
-                continue
-            if trade.get("action") not in ("buy", "reinvest", "transfer_in"):
+            if trade.get("action") not in _WASH_SALE_ACTIONS:
                 continue
-            try:
-                trade_date = date.fromisoformat(trade["date"])
-            except (ValueError, TypeError):
+            sym = trade.get("symbol")
+            if sym is None:
                 continue
+            dates_by_symbol.setdefault(sym, []).append(trade.get("date"))
 
-            if window_start <= trade_date <= window_end:
-                return True
+        index: dict[str, np.ndarray] = {}
+        for symbol, dates in dates_by_symbol.items():
+            days = _iso_days(dates)
+            index[symbol] = np.sort(days[~np.isnat(days)])
+        return index
 
-        return False
+    def _in_wash_sale_window(
+        self, trade_days: np.ndarray | None, ref: np.datetime64
+    ) -> bool:
+        """True if any sorted trade date falls within ±window of ref."""
+        if trade_days is None or trade_days.size == 0:
+            return False
+        window = np.timedelta64(self.wash_sale_window_days, "D")
+        i = np.searchsorted(trade_days, ref - window)
+        return bool(i < trade_days.size and trade_days[i] <= ref + window)
 
     def scan_opportunities(
         self,
@@ -273,60 +314,69 @@ class TaxLossHarvester:
         if not positions:
             return []
 
-        trades = recent_trades or []
+        trade_index = self._index_trades(recent_trades or [])
+        ref_day = _reference_day(reference_date)
         opportunities: list[HarvestOpportunity] = []
 
-        for pos in positions:
-            symbol = pos.get("symbol", "")
-            price = current_prices.get(symbol)
-            if price is None or price <= 0:
-                continue
-
-            shares = pos.get("shares", 0)
-            cost_per_share = pos.get("cost_basis_per_share", 0)
-            if shares <= 0 or cost_per_share <= 0:
-                continue
-
-            cost_basis = shares * cost_per_share
-            current_value = shares * price
-            unrealized_loss = current_value - cost_basis
-
-            # Only consider losses
-            if unrealized_loss >= 0:
-                continue
-
-            loss_pct = abs(unrealized_loss) / cost_basis
+        # Structure-of-arrays view of the positions; missing or zero
+        # prices become NaN so every comparison below rejects them.
+        n = len(positions)
+        symbols = [pos.get("symbol", "") for pos in positions]
+        shares = np.fromiter(
+            (pos.get("shares", 0) for pos in positions), dtype=np.float64, count=n
+        )
+        cost_per_share = np.fromiter(
+            (pos.get("cost_basis_per_share", 0) for pos in positions),
+            dtype=np.float64,
+            count=n,
+        )
+        prices = np.fromiter(
+            (current_prices.get(sym) or np.nan for sym in symbols),
+            dtype=np.float64,
+            count=n,
+        )
 
-            # Check threshold
-            if loss_pct < self.loss_threshold_pct:
-                continue
+        cost_basis = shares * cost_per_share
+        current_value = shares * prices
+        unrealized_loss = current_value - cost_basis
+        with np.errstate(divide="ignore", invalid="ignore"):
+            loss_pct = np.abs(unrealized_loss) / cost_basis
+
+        # Valid inputs, a loss, and a loss at or above the threshold
+        keep = (
+            (prices > 0)
+            & (shares > 0)
+            & (cost_per_share > 0)
+            & (unrealized_loss < 0)
+            & (loss_pct >= self.loss_threshold_pct)
+        )
+        kept = np.flatnonzero(keep)
+        if kept.size == 0:
+            return []
 
-            # Check wash sale
-            blocked = self.check_wash_sale(symbol, trades, reference_date)
+        # Sort by largest loss (most negative first) on the cent-rounded
+        # loss the caller sees; stable so ties keep input order
+        order = np.argsort(np.round(unrealized_loss[kept], 2), kind="stable")
+        kept = kept[order].tolist()
 
-            # Determine majority holding period
-            acquired = pos.get("acquired_at", "")
-            try:
-                acq = date.fromisoformat(acquired)
-                ref = date.fromisoformat(reference_date) if reference_date else date.today()
-                days_held = (ref - acq).days
-                period = "long_term" if days_held >= 366 else "short_term"
-            except (ValueError, TypeError):
-                period = "short_term"
+        # Majority holding period for the kept positions in one pass
+        held = ref_day - _iso_days([positions[i].get("acquired_at", "") for i in kept])
+        is_long = (held >= np.timedelta64(366, "D")).tolist()
 
+        for i, long in zip(kept, is_long, strict=True):
+            symbol = symbols[i]
             opportunities.append(HarvestOpportunity(
                 symbol=symbol,
-                account_id=pos.get("account_id", ""),
-                unrealized_loss=round(unrealized_loss, 2),
-                loss_pct=round(loss_pct, 4),
-                shares=shares,
-                cost_basis=round(cost_basis, 2),
-                current_value=round(current_value, 2),
-                wash_sale_blocked=blocked,
-                holding_period=period,
+                account_id=positions[i].get("account_id", ""),
+                unrealized_loss=round(float(unrealized_loss[i]), 2),
+                loss_pct=round(float(loss_pct[i]), 4),
+                shares=positions[i].get("shares", 0),
+                cost_basis=round(float(cost_basis[i]), 2),
+                current_value=round(float(current_value[i]), 2),
+                wash_sale_blocked=self._in_wash_sale_window(
+                    trade_index.get(symbol), ref_day
+                ),
+                holding_period="long_term" if long else "short_term",
             ))
 
-        # Sort by largest loss (most negative first)
-        opportunities.sort(key=lambda x: x["unrealized_loss"])
-
         return opportunities
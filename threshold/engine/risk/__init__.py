@@ -9,13 +9,34 @@ Modules:
   momentum_crash  — Daniel-Moskowitz conditional momentum crash protection
   cvar            — Conditional Value at Risk
   cdar            — Conditional Drawdown at Risk
+
+Results carry full-precision floats; ``format_result`` rounds them at the
+serialization edge.
+
+Submodules are imported lazily (PEP 562) on first attribute access, so
+importing this package does not pull in scipy or any overlay that the
+run never touches.
 """
 
-from threshold.engine.risk.cdar import CDaRCalculator
-from threshold.engine.risk.cvar import CVaRCalculator
-from threshold.engine.risk.ebp import EBPMonitor
-from threshold.engine.risk.momentum_crash import MomentumCrashProtection
-from threshold.engine.risk.turbulence import TurbulenceIndex
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from threshold.engine.risk.cdar import CDaRCalculator
+    from threshold.engine.risk.cvar import CVaRCalculator
+    from threshold.engine.risk.ebp import EBPMonitor
+    from threshold.engine.risk.formatting import format_result
+    from threshold.engine.risk.momentum_crash import MomentumCrashProtection
+    from threshold.engine.risk.turbulence import TurbulenceIndex
+
+_LAZY_IMPORTS = {
+    "CDaRCalculator": "cdar",
+    "CVaRCalculator": "cvar",
+    "EBPMonitor": "ebp",
+    "format_result": "formatting",
+    "MomentumCrashProtection": "momentum_crash",
+    "TurbulenceIndex": "turbulence",
+}
 
 __all__ = [
     "CDaRCalculator",
@@ -23,4 +44,19 @@ __all__ = [
     "EBPMonitor",
     "MomentumCrashProtection",
     "TurbulenceIndex",
+    "format_result",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f"{__name__}.{module_name}")
+    value = getattr(module, name)
+    globals()[name] = value  # Cache so later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,161 @@
+"""Shared rolling-window primitives for the risk overlays.
+
+Every trailing statistic the risk modules need — compounded products,
+variances, Mahalanobis distances — is computed here over whole arrays with
+strided window views and running sums, so the overlays share one tuned
+implementation instead of each slicing Series per date.
+
+All functions return one value per input row (``rolling_mahalanobis``: one
+per row after the estimation window), aligned so that entry ``t`` only
+uses rows up to and including ``t``.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+def rolling_prod(values: np.ndarray, window: int) -> np.ndarray:
+    """Trailing product over ``window`` rows, NaN-skipping.
+
+    Parameters:
+        values: 1-D array of factors (e.g. ``1 + returns``). NaN entries
+            count as 1.
+        window: Rows per product.
+
+    Returns:
+        Array the length of ``values``; NaN before the first full window.
+    """
+    out = np.full(len(values), np.nan)
+    if len(values) >= window:
+        out[window - 1:] = np.nanprod(sliding_window_view(values, window), axis=-1)
+    return out
+
+
+def rolling_var(values: np.ndarray, window: int, min_periods: int) -> np.ndarray:
+    """Trailing sample variance (ddof=1) over up to ``window`` rows.
+
+    Front-padding with NaN lets the first windows expand naturally under
+    ``nanvar``, so entry ``t`` uses the last ``min(window, t + 1)`` rows.
+
+    Parameters:
+        values: 1-D array; NaN entries are skipped.
+        window: Maximum rows per estimate.
+        min_periods: Rows required before the first estimate.
+
+    Returns:
+        Array the length of ``values``; NaN before ``min_periods`` rows.
+    """
+    out = np.full(len(values), np.nan)
+    if len(values) >= min_periods:
+        padded = np.concatenate([np.full(window - 1, np.nan), values])
+        windows = sliding_window_view(padded, window)[min_periods - 1:]
+        out[min_periods - 1:] = np.nanvar(windows, axis=-1, ddof=1)
+    return out
+
+
+# rolling_mahalanobis works through the dates in blocks whose (n, d, d)
+# covariance stack holds about this many floats (~32 MB), so memory stays
+# flat in T; each block restarts its running sums from an exact window
+_MAHALANOBIS_BLOCK_ELEMS = 1 << 22
+_MAHALANOBIS_MAX_BLOCK = 1024
+
+
+def rolling_mahalanobis(
+    returns: np.ndarray, window: int, ridge: float = 1e-8,
+) -> np.ndarray:
+    """Compute d_t = (y_t-μ_t)ᵀ Σ_t⁻¹ (y_t-μ_t) for every date at once.
+
+    μ_t and Σ_t are estimated over the ``window`` rows preceding t.
+    Dates are processed in fixed-size blocks; within a block the window
+    sums of y and yyᵀ are running sums — each step adds the incoming
+    row's outer product and drops the outgoing one, O(d²) per date
+    instead of O(window·d²). Σ_t is never inverted: with the batched
+    Cholesky factor Σ_t = LLᵀ, d_t = |L⁻¹(y_t-μ_t)|², one triangular
+    solve per date.
+
+    Parameters:
+        returns: Returns array (T x d).
+        window: Estimation window in rows.
+        ridge: Diagonal regularization added to every Σ_t.
+
+    Returns:
+        Array of length T - window with one distance per date.
+    """
+    n_dates, n_assets = returns.shape
+    n_out = max(n_dates - window, 0)
+    block = max(1, min(
+        _MAHALANOBIS_MAX_BLOCK, _MAHALANOBIS_BLOCK_ELEMS // (n_assets * n_assets),
+    ))
+    out = np.empty(n_out)
+    for start in range(0, n_out, block):
+        stop = min(start + block, n_out)
+        out[start:stop] = _mahalanobis_block(returns, window, start, stop, ridge)
+    return out
+
+
+def _mahalanobis_block(
+    returns: np.ndarray, window: int, start: int, stop: int, ridge: float,
+) -> np.ndarray:
+    """Distances for output dates ``start:stop`` of ``rolling_mahalanobis``.
+
+    Output date k is row k + window scored against rows [k, k + window).
+    """
+    w = window
+    n = stop - start
+    n_assets = returns.shape[1]
+
+    # Deviations from the block's first window mean keep the running
+    # sums small, so Σ yyᵀ - w·μμᵀ does not cancel catastrophically
+    y = returns[start:stop + w] - returns[start:start + w].mean(axis=0)
+    first = y[:w]
+    incoming = y[w:w + n - 1]
+    outgoing = y[:n - 1]
+
+    # Running window sums: S_{k+1} = S_k + y_{k+w} - y_k, likewise for yyᵀ
+    sums = np.empty((n, n_assets))
+    sums[0] = first.sum(axis=0)
+    np.subtract(incoming, outgoing, out=sums[1:])
+    np.cumsum(sums, axis=0, out=sums)
+    mu = sums / w
+
+    cov = np.empty((n, n_assets, n_assets))
+    np.matmul(first.T, first, out=cov[0])
+    np.einsum(
+        "tki,tkj->tij",
+        np.stack([incoming, outgoing], axis=1),
+        np.stack([incoming, -outgoing], axis=1),
+        out=cov[1:],
+    )
+    np.cumsum(cov, axis=0, out=cov)
+
+    # Σ_t = (Σ yyᵀ - w·μμᵀ) / (w - 1), regularized if nearly singular
+    # All in place on the (n, d, d) stack: the ridge touches only the
+    # diagonal through a strided view instead of broadcasting an eye
+    cov -= np.einsum("ti,tj->tij", sums, mu)
+    cov /= w - 1
+    cov.reshape(n, -1)[:, :: n_assets + 1] += ridge
+
+    diff = y[w:w + n] - mu
+    try:
+        chol = np.linalg.cholesky(cov)
+    except np.linalg.LinAlgError:
+        # Some window is not positive definite — solve one by one with
+        # LU and zero the singular ones
+        x = np.zeros_like(diff)
+        for t in range(n):
+            try:
+                x[t] = np.linalg.solve(cov[t], diff[t])
+            except np.linalg.LinAlgError:
+                continue
+        return np.asarray(np.einsum("ij,ij->i", diff, x))
+
+    # Forward substitution L z = diff, vectorized across dates: the
+    # Python loop runs over the d assets, not the n dates
+    z = np.empty_like(diff)
+    for i in range(n_assets):
+        z[:, i] = (
+            diff[:, i] - np.einsum("tj,tj->t", chol[:, i, :i], z[:, :i])
+        ) / chol[:, i, i]
+    return np.asarray(np.einsum("ij,ij->i", z, z))
@@ -0,0 +1,23 @@
+"""Input helpers shared by the risk calculators."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+
+def drop_nans(
+    returns: pd.Series | np.ndarray, assume_clean: bool = False,
+) -> np.ndarray:
+    """Return ``returns`` as a NaN-free float array.
+
+    Copies only when there are NaNs to drop; with ``assume_clean`` the
+    caller vouches for the input and the NaN scan is skipped too.
+    """
+    arr = np.asarray(returns, dtype=float)
+    if assume_clean:
+        return arr
+    nan_mask = np.isnan(arr)
+    if nan_mask.any():
+        return np.asarray(arr[~nan_mask])
+    return arr
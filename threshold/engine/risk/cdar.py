@@ -22,6 +22,52 @@ from typing import TypedDict
 import numpy as np
 import pandas as pd
 
+from threshold.engine.risk._util import drop_nans
+
+# Series longer than this stream through cache-sized blocks
+_BLOCKED_DRAWDOWN_MIN = 100_000
+_DRAWDOWN_BLOCK = 1 << 15
+
+
+def _blocked_drawdowns(arr: np.ndarray) -> np.ndarray:
+    """Drawdown series computed block by block for very long inputs.
+
+    Each block's compounding, running peak and drawdown passes run while
+    the block is still in cache, carrying wealth and peak across block
+    boundaries, so main memory is streamed roughly once instead of once
+    per pass. Agrees with the whole-array chain to float rounding.
+    """
+    out: np.ndarray = np.add(arr, 1.0)
+    peak_buf = np.empty(_DRAWDOWN_BLOCK)
+    wealth = 1.0
+    peak = 1.0
+    for start in range(0, len(out), _DRAWDOWN_BLOCK):
+        cum = out[start:start + _DRAWDOWN_BLOCK]
+        running_max = peak_buf[:len(cum)]
+        np.cumprod(cum, out=cum)
+        cum *= wealth
+        np.maximum.accumulate(cum, out=running_max)
+        np.maximum(running_max, peak, out=running_max)
+        wealth = cum[-1]
+        peak = running_max[-1]
+        np.subtract(running_max, cum, out=cum)
+        np.divide(cum, running_max, out=cum)
+    return out
+
+
+def _count_rising_edges(mask: np.ndarray) -> np.ndarray:
+    """Count False→True transitions along axis 0, a leading True included.
+
+    The mask is bit-packed eight steps per byte; a step is a rising edge
+    when its bit is set and the previous step's bit (shifted in from the
+    neighbouring byte at byte boundaries) is clear, so the count is a
+    popcount over the packed words.
+    """
+    packed = np.packbits(mask, axis=0)
+    prev = packed >> 1
+    prev[1:] |= packed[:-1] << 7
+    return np.asarray(np.bitwise_count(packed & ~prev).sum(axis=0))
+
 
 class CDaRResult(TypedDict):
     """Result from CDaR calculation."""
@@ -35,6 +81,18 @@ class CDaRResult(TypedDict):
     n_drawdown_periods: int  # Number of distinct drawdown periods
 
 
+class CDaRBatchResult(TypedDict):
+    """Column-wise CDaR metrics for many assets, one array entry per column."""
+    cdar: np.ndarray               # CDaR per asset, positive numbers
+    dar: np.ndarray                # Drawdown at Risk per asset
+    alpha: float                   # Confidence level used
+    max_drawdown: np.ndarray       # Maximum drawdown per asset
+    avg_drawdown: np.ndarray       # Average drawdown per asset
+    current_drawdown: np.ndarray   # Current drawdown per asset
+    n_observations: int            # Number of return observations (rows)
+    n_drawdown_periods: np.ndarray  # Distinct drawdown periods per asset
+
+
 class CDaRCalculator:
     """Conditional Drawdown at Risk calculator.
 
@@ -51,28 +109,37 @@ class CDaRCalculator:
         if not 0.0 < alpha < 1.0:
             raise ValueError(f"alpha must be in (0, 1), got {alpha}")
         self.alpha = alpha
+        self._alpha_pct = alpha * 100
 
-    def compute_drawdowns(self, returns: pd.Series | np.ndarray) -> np.ndarray:
+    def compute_drawdowns(
+        self, returns: pd.Series | np.ndarray, assume_clean: bool = False,
+    ) -> np.ndarray:
         """Compute drawdown series from returns.
 
         Parameters:
             returns: Daily or periodic return series.
+            assume_clean: Skip NaN filtering for inputs already known to
+                be NaN-free floats.
 
         Returns:
             Array of drawdowns (positive numbers = magnitude of drawdown).
         """
-        arr = np.asarray(returns, dtype=float)
-        arr = arr[~np.isnan(arr)]
+        arr = drop_nans(returns, assume_clean)
 
         if len(arr) < 2:
             return np.array([0.0])
+        if len(arr) > _BLOCKED_DRAWDOWN_MIN:
+            return _blocked_drawdowns(arr)
 
-        # Cumulative wealth
-        cum_returns = np.cumprod(1 + arr)
+        # Cumulative wealth, compounded in place over the 1 + r buffer
+        cum_returns = np.add(arr, 1.0)
+        np.cumprod(cum_returns, out=cum_returns)
         running_max = np.maximum.accumulate(cum_returns)
 
-        # Drawdown = (peak - current) / peak
-        drawdowns = (running_max - cum_returns) / running_max
+        # Drawdown = (peak - current) / peak, streamed in place over the
+        # wealth buffer rather than allocating a numerator and a result
+        drawdowns: np.ndarray = np.subtract(running_max, cum_returns, out=cum_returns)
+        np.divide(drawdowns, running_max, out=drawdowns)
 
         return drawdowns
 
@@ -80,10 +147,8 @@ class CDaRCalculator:
         """Count distinct drawdown periods (contiguous runs of dd > 0)."""
         if len(drawdowns) == 0:
             return 0
-        in_dd = drawdowns > 1e-8
         # Count transitions from not-in-drawdown to in-drawdown
-        starts = np.diff(in_dd.astype(int))
-        return int(np.sum(starts == 1)) + (1 if in_dd[0] else 0)
+        return int(_count_rising_edges(drawdowns > 1e-8))
 
     def historical_cdar(self, drawdowns: np.ndarray) -> float:
         """Compute historical CDaR from drawdown series.
@@ -93,25 +158,30 @@ class CDaRCalculator:
         if len(drawdowns) < 2:
             return 0.0
 
-        dar_threshold = np.percentile(drawdowns, self.alpha * 100)
-        tail = drawdowns[drawdowns >= dar_threshold]
-
-        if len(tail) == 0:
-            return float(dar_threshold)
+        # The drawdowns at or above the linearly interpolated α percentile
+        # are those at or above the ceil(α(n-1))-th order statistic (ties
+        # included), so an O(N) partition replaces the percentile sort
+        n = len(drawdowns)
+        start = int(np.ceil(self.alpha * (n - 1) - 1e-9))
+        part = np.partition(drawdowns, start)
+        tail = part[part >= part[start]]
 
         return float(np.mean(tail))
 
-    def compute(self, returns: pd.Series | np.ndarray) -> CDaRResult:
+    def compute(
+        self, returns: pd.Series | np.ndarray, assume_clean: bool = False,
+    ) -> CDaRResult:
         """Compute CDaR from a return series.
 
         Parameters:
             returns: Daily or periodic return series.
+            assume_clean: Skip NaN filtering for inputs already known to
+                be NaN-free floats.
 
         Returns:
             CDaRResult with drawdown risk metrics.
         """
-        arr = np.asarray(returns, dtype=float)
-        arr = arr[~np.isnan(arr)]
+        arr = drop_nans(returns, assume_clean)
         n = len(arr)
 
         if n < 10:
@@ -126,21 +196,82 @@ class CDaRCalculator:
                 n_drawdown_periods=0,
             )
 
-        drawdowns = self.compute_drawdowns(arr)
+        drawdowns = self.compute_drawdowns(arr, assume_clean=True)
         cdar = self.historical_cdar(drawdowns)
-        dar = float(np.percentile(drawdowns, self.alpha * 100))
+        dar = float(np.percentile(drawdowns, self._alpha_pct))
         max_dd = float(np.max(drawdowns))
         avg_dd = float(np.mean(drawdowns))
         current_dd = float(drawdowns[-1])
         n_periods = self._count_drawdown_periods(drawdowns)
 
         return CDaRResult(
-            cdar=round(cdar, 6),
-            dar=round(dar, 6),
+            cdar=cdar,
+            dar=dar,
+            alpha=self.alpha,
+            max_drawdown=max_dd,
+            avg_drawdown=avg_dd,
+            current_drawdown=current_dd,
+            n_observations=n,
+            n_drawdown_periods=n_periods,
+        )
+
+    def compute_batch(self, returns: pd.DataFrame | np.ndarray) -> CDaRBatchResult:
+        """Compute CDaR for many assets at once.
+
+        Every metric is a single NumPy reduction along the time axis, so a
+        universe of N assets costs one pass over the (T x N) matrix rather
+        than N calls to :meth:`compute`.
+
+        Parameters:
+            returns: Return matrix (T x N), one column per asset. Must be
+                NaN-free — rows are shared, so missing values cannot be
+                dropped per asset the way :meth:`compute` does.
+
+        Returns:
+            CDaRBatchResult of per-asset arrays in column order.
+        """
+        arr = np.asarray(returns, dtype=float)
+        if arr.ndim == 1:
+            arr = arr[:, None]
+        n, n_assets = arr.shape
+
+        if n < 10:
+            zeros = np.zeros(n_assets)
+            return CDaRBatchResult(
+                cdar=zeros,
+                dar=zeros.copy(),
+                alpha=self.alpha,
+                max_drawdown=zeros.copy(),
+                avg_drawdown=zeros.copy(),
+                current_drawdown=zeros.copy(),
+                n_observations=n,
+                n_drawdown_periods=np.zeros(n_assets, dtype=int),
+            )
+
+        cum_returns = np.add(arr, 1.0)
+        np.cumprod(cum_returns, axis=0, out=cum_returns)
+        running_max = np.maximum.accumulate(cum_returns, axis=0)
+        drawdowns = np.subtract(running_max, cum_returns, out=cum_returns)
+        np.divide(drawdowns, running_max, out=drawdowns)
+
+        # Tail mean beyond the α percentile via one partition per column
+        # (same threshold and tie handling as historical_cdar)
+        start = int(np.ceil(self.alpha * (n - 1) - 1e-9))
+        part = np.partition(drawdowns, start, axis=0)
+        in_tail = part >= part[start]
+        cdar = np.where(in_tail, part, 0.0).sum(axis=0) / in_tail.sum(axis=0)
+        dar = np.percentile(drawdowns, self._alpha_pct, axis=0)
+
+        # Drawdown periods: rising edges of the in-drawdown mask
+        n_periods = _count_rising_edges(drawdowns > 1e-8).astype(int)
+
+        return CDaRBatchResult(
+            cdar=cdar,
+            dar=dar,
             alpha=self.alpha,
-            max_drawdown=round(max_dd, 6),
-            avg_drawdown=round(avg_dd, 6),
-            current_drawdown=round(current_dd, 6),
+            max_drawdown=drawdowns.max(axis=0),
+            avg_drawdown=drawdowns.mean(axis=0),
+            current_drawdown=drawdowns[-1],
             n_observations=n,
             n_drawdown_periods=n_periods,
         )
@@ -14,11 +14,14 @@ Reference:
 
 from __future__ import annotations
 
+import math
 from typing import TypedDict
 
 import numpy as np
 import pandas as pd
-from scipy import stats
+from scipy.special import ndtri
+
+from threshold.engine.risk._util import drop_nans
 
 
 class CVaRResult(TypedDict):
@@ -61,34 +64,45 @@ class CVaRCalculator:
         self.method = method
         self.annualize = annualize
 
-    def historical_cvar(self, returns: pd.Series | np.ndarray) -> float:
+        # alpha is fixed after construction: resolve the normal quantile
+        # z = Φ⁻¹(1-α) and its density φ(z) once for the parametric path,
+        # along with the other per-call constants
+        self._z = float(ndtri(1 - alpha))
+        self._phi_z = math.exp(-0.5 * self._z * self._z) / math.sqrt(2.0 * math.pi)
+        self._var_pct = (1 - alpha) * 100
+        self._sqrt_ann = math.sqrt(252)
+
+    def historical_cvar(
+        self, returns: pd.Series | np.ndarray, assume_clean: bool = False,
+    ) -> float:
         """Compute historical (non-parametric) CVaR.
 
         CVaR = -E[R | R <= VaR], expressed as positive loss.
         """
-        arr = np.asarray(returns, dtype=float)
-        arr = arr[~np.isnan(arr)]
+        arr = drop_nans(returns, assume_clean)
 
         if len(arr) < 10:
             return 0.0
 
-        var_threshold = np.percentile(arr, (1 - self.alpha) * 100)
-        tail_losses = arr[arr <= var_threshold]
-
-        if len(tail_losses) == 0:
-            return -float(var_threshold)
+        # The returns at or below the linearly interpolated (1-α) percentile
+        # are those at or below the k-th smallest (ties included), so an
+        # O(N) partition replaces the percentile sort
+        k = int((1 - self.alpha) * (len(arr) - 1) + 1e-9) + 1
+        part = np.partition(arr, k - 1)
+        tail_losses = part[part <= part[k - 1]]
 
         return -float(np.mean(tail_losses))
 
-    def parametric_cvar(self, returns: pd.Series | np.ndarray) -> float:
+    def parametric_cvar(
+        self, returns: pd.Series | np.ndarray, assume_clean: bool = False,
+    ) -> float:
         """Compute parametric CVaR assuming normal distribution.
 
         CVaR = -μ + σ × φ(Φ⁻¹(1-α)) / (1-α)
         where φ = standard normal PDF, Φ⁻¹ = inverse CDF.
         Expressed as a positive loss magnitude.
         """
-        arr = np.asarray(returns, dtype=float)
-        arr = arr[~np.isnan(arr)]
+        arr = drop_nans(returns, assume_clean)
 
         if len(arr) < 10:
             return 0.0
@@ -99,27 +113,25 @@ class CVaRCalculator:
         if sigma < 1e-10:
             return 0.0
 
-        # Inverse CDF at (1-alpha) — this is a negative z-score
-        z = stats.norm.ppf(1 - self.alpha)
-        # PDF at that quantile
-        phi_z = stats.norm.pdf(z)
-
         # Parametric CVaR for normal: E[-R | R <= VaR]
-        # = -mu + sigma * phi(z) / (1 - alpha)
-        cvar = -mu + sigma * phi_z / (1 - self.alpha)
-        return max(cvar, 0.0)
+        # = -mu + sigma * phi(z) / (1 - alpha), z precomputed in __init__
+        cvar = -mu + sigma * self._phi_z / (1 - self.alpha)
+        return max(float(cvar), 0.0)
 
-    def compute(self, returns: pd.Series | np.ndarray) -> CVaRResult:
+    def compute(
+        self, returns: pd.Series | np.ndarray, assume_clean: bool = False,
+    ) -> CVaRResult:
         """Compute CVaR using the configured method.
 
         Parameters:
             returns: Daily or periodic return series.
+            assume_clean: Skip NaN filtering for inputs already known to
+                be NaN-free floats.
 
         Returns:
             CVaRResult with risk metrics.
         """
-        arr = np.asarray(returns, dtype=float)
-        arr = arr[~np.isnan(arr)]
+        arr = drop_nans(returns, assume_clean)
         n = len(arr)
 
         if n < 10:
@@ -135,27 +147,27 @@ class CVaRCalculator:
             )
 
         if self.method == "historical":
-            cvar = self.historical_cvar(arr)
+            cvar = self.historical_cvar(arr, assume_clean=True)
         else:
-            cvar = self.parametric_cvar(arr)
+            cvar = self.parametric_cvar(arr, assume_clean=True)
 
-        var_value = -float(np.percentile(arr, (1 - self.alpha) * 100))
+        var_value = -float(np.percentile(arr, self._var_pct))
         worst_loss = -float(np.min(arr))
         mean_ret = float(np.mean(arr))
         vol = float(np.std(arr, ddof=1))
 
         if self.annualize:
-            cvar *= np.sqrt(252)
-            var_value *= np.sqrt(252)
-            vol *= np.sqrt(252)
+            cvar *= self._sqrt_ann
+            var_value *= self._sqrt_ann
+            vol *= self._sqrt_ann
 
         return CVaRResult(
-            cvar=round(cvar, 6),
-            var=round(var_value, 6),
+            cvar=cvar,
+            var=var_value,
             alpha=self.alpha,
             method=self.method,
             n_observations=n,
-            worst_loss=round(worst_loss, 6),
-            mean_return=round(mean_ret, 6),
-            volatility=round(vol, 6),
+            worst_loss=worst_loss,
+            mean_return=mean_ret,
+            volatility=vol,
         )
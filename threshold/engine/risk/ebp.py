@@ -13,6 +13,8 @@ Data source: Federal Reserve Board CSV (updated monthly).
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import TypedDict
 
 import numpy as np
@@ -28,6 +30,18 @@ class EBPSignal(TypedDict):
     ebp_trend: str  # rising, falling, stable, unknown
 
 
+# Regime names in ascending order of risk, indexed by threshold bucket
+_REGIME_NAMES = np.array(["ACCOMMODATIVE", "NORMAL", "ELEVATED", "HIGH_RISK"])
+
+# Normalized risk score per regime, for aggregation
+_REGIME_SCORES = {
+    "ACCOMMODATIVE": 0.0,
+    "NORMAL": 0.33,
+    "ELEVATED": 0.67,
+    "HIGH_RISK": 1.0,
+    "UNAVAILABLE": 0.5,  # Default to neutral when no data
+}
+
 # Default thresholds (basis points, but stored as decimal %)
 DEFAULT_THRESHOLDS = {
     "high_risk": 1.00,       # >100bp
@@ -52,9 +66,24 @@ class EBPMonitor:
         thresholds: dict[str, float] | None = None,
         lookback_months: int = 3,
     ) -> None:
-        self.thresholds = thresholds or dict(DEFAULT_THRESHOLDS)
+        # Thresholds are fixed after construction (read-only view of a
+        # private copy) so the cut points below can never go stale
+        self._thresholds = MappingProxyType(dict(thresholds or DEFAULT_THRESHOLDS))
         self.lookback_months = lookback_months
+        # Regime cut points as an ascending array, so classification is one
+        # searchsorted bucket lookup. Taking running minimums from the top
+        # keeps the high_risk-first precedence even for unordered thresholds.
+        high = self.thresholds["high_risk"]
+        elevated = min(self.thresholds["elevated"], high)
+        normal = min(self.thresholds["normal"], elevated)
+        self._cuts = np.array([normal, elevated, high], dtype=float)
         self._data: pd.Series | None = None
+        self._sorted_values: np.ndarray | None = None
+
+    @property
+    def thresholds(self) -> Mapping[str, float]:
+        """Regime thresholds (read-only; fixed at construction)."""
+        return self._thresholds
 
     def load_data(self, ebp_series: pd.Series) -> None:
         """Load EBP time series.
@@ -65,26 +94,35 @@ class EBPMonitor:
         """
         if ebp_series is None or len(ebp_series) < 2:
             self._data = None
+            self._sorted_values = None
             return
         self._data = ebp_series.sort_index().dropna()
+        # Sorted once per load so every percentile query is a binary search
+        self._sorted_values = np.sort(self._data.to_numpy())
 
     def _classify_regime(self, value: float) -> str:
         """Classify EBP value into risk regime."""
-        if value >= self.thresholds["high_risk"]:
-            return "HIGH_RISK"
-        if value >= self.thresholds["elevated"]:
-            return "ELEVATED"
-        if value >= self.thresholds["normal"]:
-            return "NORMAL"
-        return "ACCOMMODATIVE"
+        return str(_REGIME_NAMES[np.searchsorted(self._cuts, value, side="right")])
+
+    def classify_batch(self, values: np.ndarray | pd.Series) -> np.ndarray:
+        """Classify many EBP values at once.
+
+        Parameters:
+            values: EBP values in decimal, any shape.
+
+        Returns:
+            Array of regime names with the same shape as ``values``.
+        """
+        idx = np.searchsorted(self._cuts, np.asarray(values, dtype=float), side="right")
+        return _REGIME_NAMES[idx]
 
     def _compute_percentile(self, value: float) -> float:
         """Compute percentile rank of current EBP vs full history."""
-        if self._data is None or len(self._data) < 10:
+        if self._sorted_values is None or len(self._sorted_values) < 10:
             return 0.5
         return float(np.searchsorted(
-            np.sort(self._data.values), value
-        ) / len(self._data))
+            self._sorted_values, value
+        ) / len(self._sorted_values))
 
     def _compute_trend(self) -> tuple[float | None, str]:
         """Compute 3-month change and directional trend."""
@@ -102,7 +140,7 @@ class EBPMonitor:
         else:
             trend = "falling"
 
-        return round(change, 4), trend
+        return change, trend
 
     def get_current_signal(self) -> EBPSignal:
         """Compute the current EBP risk signal.
@@ -125,9 +163,9 @@ class EBPMonitor:
         change_3m, trend = self._compute_trend()
 
         return EBPSignal(
-            ebp_value=round(current, 4),
+            ebp_value=current,
             ebp_regime=regime,
-            ebp_percentile=round(percentile, 4),
+            ebp_percentile=percentile,
             ebp_3m_change=change_3m,
             ebp_trend=trend,
         )
@@ -141,11 +179,4 @@ class EBPMonitor:
         1.0 = HIGH_RISK
         """
         signal = self.get_current_signal()
-        regime_map = {
-            "ACCOMMODATIVE": 0.0,
-            "NORMAL": 0.33,
-            "ELEVATED": 0.67,
-            "HIGH_RISK": 1.0,
-            "UNAVAILABLE": 0.5,  # Default to neutral when no data
-        }
-        return regime_map.get(signal["ebp_regime"], 0.5)
+        return _REGIME_SCORES.get(signal["ebp_regime"], 0.5)
@@ -0,0 +1,38 @@
+"""Presentation rounding for risk results.
+
+The calculators return full-precision floats so that downstream
+aggregation (regime scores, blends) never compounds rounding error.
+Round only at the serialization edge — JSON output, dashboards, logs.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any
+
+import numpy as np
+
+
+def format_result(result: Mapping[str, Any], ndigits: int = 6) -> dict[str, Any]:
+    """Return a copy of a risk result with float fields rounded.
+
+    Floats (including NumPy floating scalars) are rounded to ``ndigits``
+    and returned as Python floats; arrays are rounded element-wise and
+    converted to lists. ``None``, bools, ints and strings pass through.
+
+    Parameters:
+        result: Any risk result TypedDict (``CVaRResult``, ``EBPSignal``, ...).
+        ndigits: Decimal places to keep.
+
+    Returns:
+        A new plain dict, safe to serialize.
+    """
+    formatted: dict[str, Any] = {}
+    for key, value in result.items():
+        if isinstance(value, float | np.floating):
+            formatted[key] = round(float(value), ndigits)
+        elif isinstance(value, np.ndarray):
+            formatted[key] = np.round(value, ndigits).tolist()
+        else:
+            formatted[key] = value
+    return formatted
@@ -15,8 +15,11 @@ from __future__ import annotations
 
 from typing import TypedDict
 
+import numpy as np
 import pandas as pd
 
+from threshold.engine.risk._rolling import rolling_prod, rolling_var
+
 
 class MomentumCrashSignal(TypedDict):
     """Result from momentum crash analysis."""
@@ -29,6 +32,19 @@ class MomentumCrashSignal(TypedDict):
     regime: str  # NORMAL, CAUTION, HIGH_RISK, UNAVAILABLE
 
 
+class MomentumCrashRolling(TypedDict):
+    """Point-in-time momentum crash inputs at every date of a return series.
+
+    Each array has one entry per input row; NaN marks dates without enough
+    history (``is_bear`` is False there).
+    """
+    cumulative_return: np.ndarray  # Trailing lookback-month compounded return
+    is_bear: np.ndarray            # Bear indicator I_B (bool)
+    wml_variance: np.ndarray       # Trailing WML (or market proxy) variance
+    crash_probability: np.ndarray  # Estimated crash probability [0, 1]
+    momentum_weight: np.ndarray    # Dynamic weight multiplier [0, 1]
+
+
 class MomentumCrashProtection:
     """Daniel-Moskowitz conditional momentum crash protection.
 
@@ -53,7 +69,9 @@ class MomentumCrashProtection:
         self.crash_threshold = crash_threshold
         self.min_weight = min_weight
 
-    def _compute_bear_indicator(self, market_returns: pd.Series) -> tuple[bool, float | None]:
+    def _compute_bear_indicator(
+        self, market_returns: pd.Series | np.ndarray,
+    ) -> tuple[bool, float | None]:
         """Compute bear market indicator I_B.
 
         I_B = 1 if cumulative market return over lookback period < 0.
@@ -61,13 +79,16 @@ class MomentumCrashProtection:
         if market_returns is None or len(market_returns) < self.lookback_months:
             return False, None
 
-        # Use last lookback_months of monthly returns
-        recent = market_returns.iloc[-self.lookback_months:]
-        cum_return = float((1 + recent).prod() - 1)
+        # Use last lookback_months of monthly returns, compounded on the raw
+        # array (NaN months count as flat, as pandas' skipna prod did)
+        recent = np.asarray(market_returns, dtype=float)[-self.lookback_months:]
+        cum_return = float(np.nanprod(1.0 + recent) - 1.0)
 
         return cum_return < 0, cum_return
 
-    def _estimate_wml_variance(self, wml_returns: pd.Series | None) -> float | None:
+    def _estimate_wml_variance(
+        self, wml_returns: pd.Series | np.ndarray | None,
+    ) -> float | None:
         """Estimate WML (Winners-minus-Losers) return variance.
 
         Uses rolling 126-day (6-month) variance estimate.
@@ -76,7 +97,9 @@ class MomentumCrashProtection:
             return None
 
         lookback = min(126, len(wml_returns))
-        return float(wml_returns.iloc[-lookback:].var())
+        # NaN-skipping sample variance, as pandas' Series.var computed it
+        recent = np.asarray(wml_returns, dtype=float)[-lookback:]
+        return float(np.nanvar(recent, ddof=1))
 
     def _forecast_crash_probability(
         self,
@@ -119,13 +142,14 @@ class MomentumCrashProtection:
 
     def compute_dynamic_weight(
         self,
-        market_returns: pd.Series,
-        wml_returns: pd.Series | None = None,
+        market_returns: pd.Series | np.ndarray,
+        wml_returns: pd.Series | np.ndarray | None = None,
     ) -> MomentumCrashSignal:
         """Compute momentum crash protection signal.
 
         Parameters:
-            market_returns: Monthly market (e.g. SPY) returns.
+            market_returns: Monthly market (e.g. SPY) returns, as a Series
+                or a plain array (which skips pandas dispatch entirely).
             wml_returns: Optional Winners-minus-Losers factor returns.
                         If unavailable, uses market variance as proxy.
 
@@ -166,13 +190,67 @@ class MomentumCrashProtection:
         return MomentumCrashSignal(
             is_bear_market=is_bear,
             bear_indicator=bear_ind,
-            cumulative_24m_return=round(cum_return, 4) if cum_return is not None else None,
-            momentum_weight=round(weight, 4),
-            wml_variance=round(wml_var, 6) if wml_var is not None else None,
-            crash_probability=round(crash_prob, 4),
+            cumulative_24m_return=cum_return,
+            momentum_weight=weight,
+            wml_variance=wml_var,
+            crash_probability=crash_prob,
             regime=regime,
         )
 
+    def compute_rolling(
+        self,
+        market_returns: pd.Series | np.ndarray,
+        wml_returns: pd.Series | np.ndarray | None = None,
+    ) -> MomentumCrashRolling:
+        """Compute the momentum crash signal at every date.
+
+        Equivalent to calling :meth:`compute_dynamic_weight` on each
+        expanding prefix of the series — as a backtest would — but in a
+        few vectorized passes.
+
+        Parameters:
+            market_returns: Monthly market returns.
+            wml_returns: Optional WML returns, row-aligned with
+                ``market_returns``. If unavailable, uses market variance.
+
+        Returns:
+            MomentumCrashRolling of per-date arrays.
+        """
+        market = np.asarray(market_returns, dtype=float)
+        if wml_returns is None:
+            wml = market
+        else:
+            wml = np.asarray(wml_returns, dtype=float)
+            if len(wml) != len(market):
+                raise ValueError(
+                    "wml_returns must be row-aligned with market_returns, "
+                    f"got {len(wml)} and {len(market)} rows"
+                )
+
+        cum_return = rolling_prod(1.0 + market, self.lookback_months) - 1.0
+        is_bear = cum_return < 0
+        wml_var = rolling_var(wml, 126, 60)
+
+        # Same piecewise model as _forecast_crash_probability and
+        # _compute_dynamic_weight, evaluated over whole arrays
+        bear_prob = np.where(
+            np.isnan(wml_var),
+            0.30,
+            np.minimum(0.20 + np.minimum(wml_var / self.crash_threshold, 1.0) * 0.60, 0.95),
+        )
+        crash_prob = np.where(is_bear, bear_prob, 0.05)
+        weight = np.where(
+            is_bear, np.maximum(1.0 - crash_prob * 0.75, self.min_weight), 1.0,
+        )
+
+        return MomentumCrashRolling(
+            cumulative_return=cum_return,
+            is_bear=is_bear,
+            wml_variance=wml_var,
+            crash_probability=crash_prob,
+            momentum_weight=weight,
+        )
+
     def get_regime_score(self, signal: MomentumCrashSignal) -> float:
         """Return normalized risk score in [0, 1] for aggregation.
 
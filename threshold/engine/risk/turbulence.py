@@ -8,7 +8,7 @@ Reference:
   Kritzman, M. & Li, Y. (2010). "Skulls, Financial Turbulence, and Risk
   Management." Financial Analysts Journal, 66(5), 30-41.
 
-Uses: scipy.spatial.distance.mahalanobis, numpy.linalg
+Uses: numpy.linalg (batched solve)
 """
 
 from __future__ import annotations
@@ -18,6 +18,11 @@ from typing import TypedDict
 import numpy as np
 import pandas as pd
 
+from threshold.engine.risk._rolling import rolling_mahalanobis
+
+# Regime names in ascending order of stress, indexed by percentile bucket
+_REGIME_NAMES = np.array(["CALM", "ELEVATED", "TURBULENT"])
+
 
 class TurbulenceSignal(TypedDict):
     """Result from turbulence analysis."""
@@ -51,13 +56,9 @@ class TurbulenceIndex:
         self.window = window
         self.threshold_pctl = threshold_pctl
         self.min_assets = min_assets
-
-    def _compute_mahalanobis(
-        self, y: np.ndarray, mu: np.ndarray, cov_inv: np.ndarray
-    ) -> float:
-        """Compute Mahalanobis distance: d = (y-μ)ᵀ Σ⁻¹ (y-μ)."""
-        diff = y - mu
-        return float(diff @ cov_inv @ diff)
+        # Percentile cut points for CALM / ELEVATED / TURBULENT buckets;
+        # the 0.90 TURBULENT cut takes precedence over threshold_pctl
+        self._cuts = np.array([min(threshold_pctl, 0.90), 0.90])
 
     def compute(self, price_data: pd.DataFrame) -> TurbulenceSignal:
         """Compute turbulence index from multi-asset price data.
@@ -90,30 +91,9 @@ class TurbulenceIndex:
                 rolling_mean=None,
             )
 
-        # Rolling turbulence computation
-        turbulence_series = []
-        n_assets = returns.shape[1]
-
-        for i in range(self.window, len(returns)):
-            window_returns = returns.iloc[i - self.window : i].values
-            current_return = returns.iloc[i].values
-
-            mu = np.mean(window_returns, axis=0)
-            cov = np.cov(window_returns, rowvar=False)
-
-            # Regularize if nearly singular
-            try:
-                cov_inv = np.linalg.inv(
-                    cov + np.eye(n_assets) * 1e-8
-                )
-            except np.linalg.LinAlgError:
-                turbulence_series.append(0.0)
-                continue
-
-            d_t = self._compute_mahalanobis(current_return, mu, cov_inv)
-            turbulence_series.append(d_t)
+        turb_array = rolling_mahalanobis(returns.to_numpy(dtype=np.float64), self.window)
 
-        if not turbulence_series:
+        if len(turb_array) == 0:
             return TurbulenceSignal(
                 turbulence_value=None,
                 turbulence_percentile=None,
@@ -122,13 +102,12 @@ class TurbulenceIndex:
                 rolling_mean=None,
             )
 
-        turb_array = np.array(turbulence_series)
-        current_turb = turb_array[-1]
+        current_turb = float(turb_array[-1])
 
-        # Percentile rank
+        # Percentile rank — only the latest value is ranked, so one
+        # comparison pass replaces sorting the whole series
         percentile = float(
-            np.searchsorted(np.sort(turb_array), current_turb)
-            / len(turb_array)
+            np.count_nonzero(turb_array < current_turb) / len(turb_array)
         )
 
         # Rolling mean (last 21 trading days)
@@ -137,19 +116,14 @@ class TurbulenceIndex:
 
         # Classify regime
         is_turbulent = percentile >= self.threshold_pctl
-        if percentile >= 0.90:
-            regime = "TURBULENT"
-        elif percentile >= self.threshold_pctl:
-            regime = "ELEVATED"
-        else:
-            regime = "CALM"
+        regime = str(_REGIME_NAMES[np.searchsorted(self._cuts, percentile, side="right")])
 
         return TurbulenceSignal(
-            turbulence_value=round(current_turb, 4),
-            turbulence_percentile=round(percentile, 4),
+            turbulence_value=current_turb,
+            turbulence_percentile=percentile,
             is_turbulent=is_turbulent,
             turbulence_regime=regime,
-            rolling_mean=round(rolling_mean, 4),
+            rolling_mean=rolling_mean,
         )
 
     def get_regime_score(self, signal: TurbulenceSignal) -> float:
@@ -12,10 +12,15 @@ Computes the Dip-Buying Composite Score (DCS) for a single ticker by:
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from dataclasses import dataclass, field
 from typing import Any, TypedDict
 
+import numpy as np
 import pandas as pd
 
+from threshold.engine._rolling_bundle import bundle_stats, compute_rolling_bundle
+from threshold.engine.advanced import AlignedSentimentIndex, ContinuousTrendFollower
 from threshold.engine.composite import (
     apply_drawdown_modifier,
     apply_falling_knife_filter,
@@ -23,6 +28,7 @@ from threshold.engine.composite import (
     apply_rsi_divergence_boost,
     classify_dcs,
     compose_dcs,
+    resolve_falling_knife_caps,
 )
 from threshold.engine.context import ScoringContext
 from threshold.engine.signals import (
@@ -39,6 +45,7 @@ from threshold.engine.signals import (
     make_sma_breach_warning,
 )
 from threshold.engine.subscores import (
+    CompiledSubscoreConfig,
     calc_fundamental_quality,
     calc_momentum_quality,
     calc_revision_momentum,
@@ -46,11 +53,11 @@ from threshold.engine.subscores import (
     calc_valuation_context,
 )
 from threshold.engine.technical import (
-    calc_consecutive_days_below_sma,
+    RollingStats,
+    _last_rsi,
     calc_obv_divergence,
-    calc_price_acceleration,
     calc_reversal_signals,
-    calc_rsi_value,
+    calc_rsi,
 )
 
 # ---------------------------------------------------------------------------
@@ -77,7 +84,13 @@ class Technicals(TypedDict, total=False):
 
 
 class ScoringResult(TypedDict, total=False):
-    """Return type for score_ticker() — None when insufficient data."""
+    """Return type for score_ticker() — None when insufficient data.
+
+    A plain dict by design: the pipeline tags it in place (``is_holding``),
+    the report and alert builders read it with ``.get()`` and membership
+    tests on the optional sections, and it is stored as JSON as-is. The
+    optional sections are present only when they apply.
+    """
     dcs: float
     dcs_signal: str
     sub_scores: dict[str, Any]
@@ -96,18 +109,245 @@ class ScoringResult(TypedDict, total=False):
     yf_fundamentals: dict[str, Any]
     drawdown_defense: dict[str, Any]
     falling_knife_cap: dict[str, Any]
+    advanced_signals: dict[str, Any]
+    is_holding: bool             # Set by the pipeline after scoring
+    is_watchlist: bool           # Set by the pipeline after scoring
+    _signal_board_obj: SignalBoard  # Live board behind signal_board / sell_flags
+
+
+# ---------------------------------------------------------------------------
+# Compiled config
+# ---------------------------------------------------------------------------
+
+# EPS revision sell rule: sub-grade counts convert to revision-score deltas
+# at 1/13 per step, the calibrated convention of the 13-grade SA scale
+_SUBGRADES_PER_GRADE = 13.0
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledScoringConfig:
+    """Composition, modifier, falling-knife, sell and classification settings.
+
+    Resolved from a ThresholdConfig once per run so that score_ticker()
+    does not repeat the same getattr chains for every ticker. ``weights``
+    and ``thresholds`` stay None when the config does not set them, which
+    selects the calibrated defaults in compose_dcs() / classify_dcs().
+
+    Enabled advanced overlays are built here too: both are stateless, so
+    one instance serves every ticker. None means disabled (or, for
+    sentiment, its module unavailable).
+    """
+    weights: dict[str, int] | None = None
+    obv_max: int = 5
+    rsi_div_boost: int = 3
+    rsi_div_min_dcs: int = 60
+    sma_sell_days: int = 10
+    sma_warn_days: int = 7
+    eps_sell_delta: float = -3.0 / _SUBGRADES_PER_GRADE
+    eps_warn_delta: float = -2.0 / _SUBGRADES_PER_GRADE
+    thresholds: dict[str, int] | None = None
+    falling_knife_caps: tuple[dict[str, int], dict[str, int]] = field(
+        default_factory=resolve_falling_knife_caps,
+    )
+    trend_follower: ContinuousTrendFollower | None = None
+    trend_blend_weight: float = 0.0
+    sentiment_index: AlignedSentimentIndex | None = None
+    subscores: CompiledSubscoreConfig = field(default_factory=CompiledSubscoreConfig)
+
+    @classmethod
+    def from_config(cls, config: Any | None) -> CompiledScoringConfig:
+        """Resolve every scoring setting from ``config`` (None → defaults)."""
+        if config is None:
+            return _DEFAULT_COMPILED
+        defaults = _DEFAULT_COMPILED
+        sc = getattr(config, "scoring", config)
+
+        weights: dict[str, int] | None = None
+        if hasattr(sc, "weights"):
+            w = sc.weights
+            weights = {
+                "MQ": getattr(w, "MQ", 30),
+                "FQ": getattr(w, "FQ", 25),
+                "TO": getattr(w, "TO", 20),
+                "MR": getattr(w, "MR", 15),
+                "VC": getattr(w, "VC", 10),
+            }
+
+        obv_max = defaults.obv_max
+        rsi_div_boost = defaults.rsi_div_boost
+        rsi_div_min_dcs = defaults.rsi_div_min_dcs
+        if hasattr(sc, "modifiers"):
+            mod = sc.modifiers
+            obv_max = getattr(mod, "obv_bullish_max", obv_max)
+            rsi_div_boost = getattr(mod, "rsi_divergence_boost", rsi_div_boost)
+            rsi_div_min_dcs = getattr(mod, "rsi_divergence_min_dcs", rsi_div_min_dcs)
+
+        # Sub-grade counts become revision-score deltas here, once per run
+        eps_sell_delta = defaults.eps_sell_delta
+        eps_warn_delta = defaults.eps_warn_delta
+        if hasattr(sc, "revision_momentum"):
+            rm = sc.revision_momentum
+            if hasattr(rm, "sell_threshold_subgrades"):
+                eps_sell_delta = -float(rm.sell_threshold_subgrades) / _SUBGRADES_PER_GRADE
+            if hasattr(rm, "warning_threshold_subgrades"):
+                eps_warn_delta = -float(rm.warning_threshold_subgrades) / _SUBGRADES_PER_GRADE
+
+        sma_sell_days = defaults.sma_sell_days
+        sma_warn_days = defaults.sma_warn_days
+        sell_c = getattr(config, "sell_criteria", None)
+        if sell_c is not None:
+            sma_sell_days = getattr(sell_c, "sma_breach_days", sma_sell_days)
+            sma_warn_days = getattr(sell_c, "sma_breach_warning_days", sma_warn_days)
+
+        thresholds: dict[str, int] | None = None
+        if hasattr(sc, "thresholds"):
+            t = sc.thresholds
+            thresholds = {
+                "strong_buy_dip": getattr(t, "strong_buy_dip", 80),
+                "high_conviction": getattr(t, "high_conviction", 70),
+                "buy_dip": getattr(t, "buy_dip", 65),
+                "watch": getattr(t, "watch", 50),
+                "weak": getattr(t, "weak", 35),
+            }
+
+        trend_follower: ContinuousTrendFollower | None = None
+        trend_blend_weight = defaults.trend_blend_weight
+        sentiment_index: AlignedSentimentIndex | None = None
+        adv = getattr(config, "advanced", None)
+        if adv is not None:
+            if hasattr(adv, "trend_following") and adv.trend_following.enabled:
+                trend_follower = ContinuousTrendFollower(
+                    window=adv.trend_following.window,
+                    vol_window=adv.trend_following.vol_window,
+                )
+                trend_blend_weight = adv.trend_following.mq_blend_weight
+            if (
+                AlignedSentimentIndex is not None
+                and hasattr(adv, "sentiment") and adv.sentiment.enabled
+            ):
+                sentiment_index = AlignedSentimentIndex(
+                    n_components=adv.sentiment.n_components,
+                    mr_reduction=adv.sentiment.mr_reduction,
+                    overheated_pctl=adv.sentiment.overheated_pctl,
+                    depressed_pctl=adv.sentiment.depressed_pctl,
+                    min_observations=adv.sentiment.min_observations,
+                )
+
+        return cls(
+            weights=weights,
+            obv_max=obv_max,
+            rsi_div_boost=rsi_div_boost,
+            rsi_div_min_dcs=rsi_div_min_dcs,
+            sma_sell_days=sma_sell_days,
+            sma_warn_days=sma_warn_days,
+            eps_sell_delta=eps_sell_delta,
+            eps_warn_delta=eps_warn_delta,
+            thresholds=thresholds,
+            falling_knife_caps=resolve_falling_knife_caps(config),
+            trend_follower=trend_follower,
+            trend_blend_weight=trend_blend_weight,
+            sentiment_index=sentiment_index,
+            subscores=CompiledSubscoreConfig.from_config(config),
+        )
+
+
+# Shared by every run without a config: the calibrated defaults never change
+_DEFAULT_COMPILED = CompiledScoringConfig()
+
+
+# ---------------------------------------------------------------------------
+# Result post-processing
+# ---------------------------------------------------------------------------
+
+_YF_META_KEYS = (
+    "fcf_yield", "gross_profitability", "ev_to_ebitda",
+    "gross_margin", "sector", "fcf_yield_pctl",
+    "gross_profitability_pctl", "ev_to_ebitda_pctl",
+)
+
+# Display precision per result field (dotted path into the ScoringResult).
+# score_ticker() stores full-precision floats; round_results() applies this
+# once for the whole run, before the scores are reported or persisted.
+_ROUNDING_SCHEMA: dict[str, int] = {
+    "dcs": 1,
+    "sub_scores.dcs.MQ": 3,
+    "sub_scores.dcs.FQ": 3,
+    "sub_scores.dcs.TO": 3,
+    "sub_scores.dcs.MR": 3,
+    "sub_scores.dcs.VC": 3,
+    "technicals.rsi_14": 1,
+    "technicals.pct_from_200d": 4,
+    "technicals.ret_8w": 4,
+    "technicals.vol_adj_mom": 3,
+    "technicals.rs_vs_spy": 3,
+    "falling_knife_cap.original_dcs": 1,
+    "revision_momentum.score": 3,
+    **{f"yf_fundamentals.{key}": 4 for key in _YF_META_KEYS if key != "sector"},
+}
+
+
+def round_results(results: Mapping[str, ScoringResult | None]) -> None:
+    """Round every ScoringResult in ``results`` to display precision, in place.
+
+    Walks ``_ROUNDING_SCHEMA`` field by field across all tickers. Uses the
+    builtin round() rather than np.round: the latter rounds ``x * 10**k``
+    half-to-even and would move values that sit on a tie by one unit in
+    the last place relative to the score history already stored. Missing
+    optional sections, None results and non-float values are left as is.
+    """
+    for path, ndigits in _ROUNDING_SCHEMA.items():
+        *parents, leaf = path.split(".")
+        for result in results.values():
+            holder: Any = result
+            for key in parents:
+                if holder is None:
+                    break
+                holder = holder.get(key)
+            if holder is not None:
+                value = holder.get(leaf)
+                if isinstance(value, float):
+                    holder[leaf] = round(value, ndigits)
+
+
+def resolve_board_views(results: Mapping[str, ScoringResult | None]) -> None:
+    """Add ``sell_flags`` and ``signal_board`` to results scored without them.
+
+    For scans run with ``board_views=False`` (see score_tickers()): call on
+    the results that survive ranking, before they are reported or stored.
+    Results that already carry both keys are left as is.
+    """
+    for result in results.values():
+        if result is None or "signal_board" in result:
+            continue
+        board = result["_signal_board_obj"]
+        result["sell_flags"] = board.to_legacy_flags()
+        result["signal_board"] = board.to_dict()
 
 
 # ---------------------------------------------------------------------------
 # Main scoring function
 # ---------------------------------------------------------------------------
 
+def _drop_missing(series: pd.Series) -> pd.Series:
+    """``series.dropna()``, returning ``series`` itself when nothing is missing.
+
+    End-of-day price data is almost always complete, so one NaN scan on
+    the values replaces dropna's mask-and-reindex on the common path.
+    """
+    values = series.to_numpy()
+    kind = values.dtype.kind
+    if kind in "iub" or (kind == "f" and not np.isnan(values).any()):
+        return series
+    return series.dropna()
+
+
 def score_ticker(
     ticker: str,
     sa_data: dict[str, Any],
     price_df: pd.DataFrame,
     ctx: ScoringContext,
     config: Any | None = None,
+    compiled: CompiledScoringConfig | None = None,
 ) -> ScoringResult | None:
     """Calculate DCS for a single ticker.
 
@@ -118,20 +358,54 @@ def score_ticker(
         price_df: DataFrame with 'Close' and 'Volume' columns.
         ctx: ScoringContext with market regime, SPY data, history, etc.
         config: ThresholdConfig (optional). When None, uses calibrated defaults.
+        compiled: ``CompiledScoringConfig.from_config(config)``, built once
+                  by callers scoring many tickers (resolved here if None).
 
     Returns ScoringResult dict, or None if insufficient data (<50 bars).
+    Scores are full precision; round_results() rounds them for display.
     """
-    close = price_df["Close"].dropna()
-    volume = price_df["Volume"].dropna() if "Volume" in price_df.columns else pd.Series(dtype=float)
+    close = _drop_missing(price_df["Close"])
+    if "Volume" in price_df.columns:
+        volume = _drop_missing(price_df["Volume"])
+    else:
+        volume = pd.Series(dtype=float)
 
     if len(close) < 50:
         return None  # Insufficient data
 
+    if compiled is None:
+        compiled = CompiledScoringConfig.from_config(config)
+    stats = bundle_stats(compute_rolling_bundle(close.to_numpy(dtype=float)))
+    return _score_series(ticker, sa_data, close, volume, ctx, config, compiled, stats)
+
+
+def _score_series(
+    ticker: str,
+    sa_data: dict[str, Any],
+    close: pd.Series,
+    volume: pd.Series,
+    ctx: ScoringContext,
+    config: Any | None,
+    compiled: CompiledScoringConfig,
+    stats: RollingStats,
+    board_views: bool = True,
+    mq_parts: tuple[float, float, float, float | None] | None = None,
+) -> ScoringResult:
+    """Score one ticker from its NaN-free Close / Volume series.
+
+    Shared by score_ticker() and the panel driver in scorer_batch. ``stats``
+    is the ticker's rolling bundle — computed for this series alone, or
+    for every ticker at once by the panel driver — so no helper below
+    re-rolls ``close`` for an SMA, Bollinger band or 8-week return.
+    ``board_views=False`` leaves ``sell_flags`` / ``signal_board`` for
+    resolve_board_views(). ``mq_parts`` is this ticker's
+    calc_momentum_quality() result when the panel driver has it already.
+    """
     # --- OBV divergence ---
     obv_data = calc_obv_divergence(close, volume)
 
     # --- Sell criterion: consecutive days below 200d SMA ---
-    days_below_sma, _ = calc_consecutive_days_below_sma(close)
+    days_below_sma = stats["days_below_sma"]
 
     # --- Quant deterioration (from DB or prev_scores) ---
     current_quant = sa_data.get("quantScore")
@@ -149,132 +423,96 @@ def score_ticker(
             quant_compare_date = prev_sa.get("_date")
 
     # --- Revision Momentum ---
+    sub_config = compiled.subscores
     rev_mom_score, rev_direction, rev_delta_4w = calc_revision_momentum(
-        ticker, ctx.grade_history, config,
+        ticker, ctx.grade_history, config, sub_config,
     )
 
     # --- Retrieve yfinance fundamentals for this ticker ---
     yf_fundamentals = ctx.get_yf_fundamentals(ticker)
 
     # --- Sub-scores ---
-    mq, trend_score, vol_adj_mom, rs_vs_spy = calc_momentum_quality(
-        sa_data, close, ctx.spy_close, config,
-    )
+    values = close.to_numpy(dtype=np.float64)
+    if mq_parts is None:
+        mq_parts = calc_momentum_quality(
+            sa_data, close, ctx.spy_close, config, stats, values, sub_config,
+        )
+    mq, trend_score, vol_adj_mom, rs_vs_spy = mq_parts
     fq = calc_fundamental_quality(
         sa_data, rev_mom_score, yf_fundamentals=yf_fundamentals, config=config,
+        compiled=sub_config,
+    )
+    rsi_series = calc_rsi(close, 14)
+    rsi = _last_rsi(rsi_series)
+    to, macd_data = calc_technical_oversold(
+        close, config, stats, rsi, values, sub_config,
     )
-    to, macd_data = calc_technical_oversold(close, config)
     mr = ctx.market_regime_score
     vc = calc_valuation_context(sa_data, yf_fundamentals=yf_fundamentals, config=config)
 
     # --- Advanced signal overlays (Phase 2C, all disabled by default) ---
     advanced_signals: dict[str, Any] = {}
-    if config is not None and hasattr(config, "advanced"):
-        adv = config.advanced
-
-        # Trend Following: blend into MQ sub-score
-        if hasattr(adv, "trend_following") and adv.trend_following.enabled:
-            from threshold.engine.advanced.trend_following import ContinuousTrendFollower
-            tf = ContinuousTrendFollower(
-                window=adv.trend_following.window,
-                vol_window=adv.trend_following.vol_window,
-            )
-            trend_sig = tf.compute_signal(close)
-            if trend_sig is not None:
-                blend_w = adv.trend_following.mq_blend_weight
-                trend_norm = (trend_sig["signal"] + 1) / 2  # [-1,1] → [0,1]
-                mq = (1 - blend_w) * mq + blend_w * trend_norm
-                advanced_signals["trend_following"] = dict(trend_sig)
-
-        # Sentiment: reduce MR when overheated
-        if hasattr(adv, "sentiment") and adv.sentiment.enabled:
-            try:
-                from threshold.engine.advanced.sentiment import AlignedSentimentIndex
-                asi = AlignedSentimentIndex(
-                    n_components=adv.sentiment.n_components,
-                    mr_reduction=adv.sentiment.mr_reduction,
-                    overheated_pctl=adv.sentiment.overheated_pctl,
-                    depressed_pctl=adv.sentiment.depressed_pctl,
-                    min_observations=adv.sentiment.min_observations,
-                )
-                # Sentiment requires proxy data from context
-                proxy_data = getattr(ctx, "sentiment_proxies", None)
-                market_rets = getattr(ctx, "market_returns", None)
-                if proxy_data is not None:
-                    sent_result = asi.compute(proxy_data, market_rets)
-                    if sent_result["mr_adjustment"] > 0:
-                        mr = mr * (1 - sent_result["mr_adjustment"])
-                    advanced_signals["sentiment"] = dict(sent_result)
-            except ImportError:
-                pass  # scikit-learn not installed, skip
+
+    # Trend Following: blend into MQ sub-score
+    tf = compiled.trend_follower
+    if tf is not None:
+        trend_sig = tf.compute_signal(close)
+        if trend_sig is not None:
+            blend_w = compiled.trend_blend_weight
+            trend_norm = (trend_sig["signal"] + 1) / 2  # [-1,1] → [0,1]
+            mq = (1 - blend_w) * mq + blend_w * trend_norm
+            advanced_signals["trend_following"] = dict(trend_sig)
+
+    # Sentiment: reduce MR when overheated
+    asi = compiled.sentiment_index
+    if asi is not None:
+        # Sentiment requires proxy data from context
+        proxy_data = getattr(ctx, "sentiment_proxies", None)
+        market_rets = getattr(ctx, "market_returns", None)
+        if proxy_data is not None:
+            sent_result = asi.compute(proxy_data, market_rets)
+            if sent_result["mr_adjustment"] > 0:
+                mr = mr * (1 - sent_result["mr_adjustment"])
+            advanced_signals["sentiment"] = dict(sent_result)
 
     # --- Compose raw DCS ---
     sub_score_dict = {"MQ": mq, "FQ": fq, "TO": to, "MR": mr, "VC": vc}
 
-    # Read weights from config
-    weights: dict[str, int] | None = None
-    if config is not None:
-        sc = getattr(config, "scoring", config)
-        if hasattr(sc, "weights"):
-            w = sc.weights
-            weights = {
-                "MQ": getattr(w, "MQ", 30),
-                "FQ": getattr(w, "FQ", 25),
-                "TO": getattr(w, "TO", 20),
-                "MR": getattr(w, "MR", 15),
-                "VC": getattr(w, "VC", 10),
-            }
-
-    dcs_raw = compose_dcs(sub_score_dict, weights)
+    dcs_raw = compose_dcs(sub_score_dict, compiled.weights)
 
     # --- Post-composition modifiers ---
-    # Read modifier settings from config
-    obv_max = 5
-    rsi_div_boost = 3
-    rsi_div_min_dcs = 60
-    if config is not None:
-        sc = getattr(config, "scoring", config)
-        if hasattr(sc, "modifiers"):
-            mod = sc.modifiers
-            obv_max = getattr(mod, "obv_bullish_max", obv_max)
-            rsi_div_boost = getattr(mod, "rsi_divergence_boost", rsi_div_boost)
-            rsi_div_min_dcs = getattr(mod, "rsi_divergence_min_dcs", rsi_div_min_dcs)
-
-    dcs_raw = apply_obv_boost(dcs_raw, obv_data, obv_max)
+    dcs_raw = apply_obv_boost(dcs_raw, obv_data, compiled.obv_max)
 
     # --- Technical data (ret_8w needed by Gate 3) ---
-    _, ret_8w = calc_price_acceleration(close)
+    ret_8w = stats["ret_8w"]
 
     # Technicals for display
-    rsi = calc_rsi_value(close, 14)
-    sma_200 = (
-        close.rolling(200).mean().iloc[-1] if len(close) >= 200 else close.mean()
-    )
+    sma_200 = stats["sma_200"] if len(close) >= 200 else close.mean()
     pct_from_200d = (close.iloc[-1] - sma_200) / sma_200
 
     # --- Reversal Signal Detection (Phase 2 backtest-validated) ---
     sa_quant = sa_data.get("quantScore")
-    reversal = calc_reversal_signals(close, rsi, macd_data, sa_quant)
+    reversal = calc_reversal_signals(
+        close, rsi, macd_data, sa_quant, stats, rsi_series,
+    )
 
     # RSI Bullish Divergence boosts DCS
     dcs_raw = apply_rsi_divergence_boost(
-        dcs_raw, reversal["rsi_bullish_divergence"], rsi_div_boost, rsi_div_min_dcs,
+        dcs_raw, reversal["rsi_bullish_divergence"],
+        compiled.rsi_div_boost, compiled.rsi_div_min_dcs,
     )
 
     # --- Drawdown Defense classification lookup ---
     dd_classification: str | None = None
     dd_downside_capture: float | None = None
-    if ctx.drawdown_classifications:
-        dd_info = ctx.drawdown_classifications.get(
-            ticker
-        ) or ctx.drawdown_classifications.get(ticker.replace("-", "."))
-        if dd_info:
-            dd_classification = dd_info.get("classification")
-            dd_downside_capture = dd_info.get("downside_capture")
+    dd_info = ctx.get_drawdown_classification(ticker)
+    if dd_info:
+        dd_classification = dd_info.get("classification")
+        dd_downside_capture = dd_info.get("downside_capture")
 
     # --- Falling knife filter (defense-aware) ---
     dcs, fk_cap_applied = apply_falling_knife_filter(
-        dcs_raw, trend_score, dd_classification, config,
+        dcs_raw, trend_score, dd_classification, caps=compiled.falling_knife_caps,
     )
 
     # --- Drawdown Defense DCS Modifier (Rule D-5) ---
@@ -286,9 +524,9 @@ def score_ticker(
     reversal_confirmed = dcs >= 65 and reversal["bb_lower_breach"]
 
     technicals: dict[str, Any] = {
-        "rsi_14": round(rsi, 1),
-        "pct_from_200d": round(pct_from_200d, 4),
-        "ret_8w": round(ret_8w, 4),
+        "rsi_14": rsi,
+        "pct_from_200d": pct_from_200d,
+        "ret_8w": ret_8w,
         "macd_crossover": macd_data["crossover"],
         "macd_histogram": macd_data["histogram"],
         "obv_divergence": obv_data["divergence"],
@@ -301,37 +539,17 @@ def score_ticker(
         "reversal_confirmed": reversal_confirmed,
     }
     if vol_adj_mom is not None:
-        technicals["vol_adj_mom"] = round(vol_adj_mom, 3)
+        technicals["vol_adj_mom"] = vol_adj_mom
     if rs_vs_spy is not None:
-        technicals["rs_vs_spy"] = round(rs_vs_spy, 3)
+        technicals["rs_vs_spy"] = rs_vs_spy
 
     # --- Sell criterion flags (SignalBoard taxonomy) ---
     board = SignalBoard()
 
-    # Read sell criteria thresholds from config
-    sma_sell_days = 10
-    sma_warn_days = 7
-    eps_sell_subgrades = 3.0
-    eps_warn_subgrades = 2.0
-    if config is not None:
-        sc = getattr(config, "scoring", config)
-        if hasattr(sc, "revision_momentum"):
-            rm = sc.revision_momentum
-            eps_sell_subgrades = float(
-                getattr(rm, "sell_threshold_subgrades", eps_sell_subgrades)
-            )
-            eps_warn_subgrades = float(
-                getattr(rm, "warning_threshold_subgrades", eps_warn_subgrades)
-            )
-        sell_c = getattr(config, "sell_criteria", None)
-        if sell_c is not None:
-            sma_sell_days = getattr(sell_c, "sma_breach_days", sma_sell_days)
-            sma_warn_days = getattr(sell_c, "sma_breach_warning_days", sma_warn_days)
-
     # Sell #1: SMA breach
-    if days_below_sma >= sma_sell_days:
+    if days_below_sma >= compiled.sma_sell_days:
         board.add(make_sma_breach_sell(days_below_sma))
-    elif days_below_sma >= sma_warn_days:
+    elif days_below_sma >= compiled.sma_warn_days:
         board.add(make_sma_breach_warning(days_below_sma))
 
     # Sell #2: Quant drop
@@ -340,18 +558,22 @@ def score_ticker(
 
     # Sell #3: EPS Revision Momentum
     if rev_delta_4w is not None:
-        sub_grade_steps = abs(rev_delta_4w) / (1.0 / 13.0)
-        if rev_delta_4w <= -eps_sell_subgrades / 13.0:
-            board.add(make_eps_rev_sell(sub_grade_steps, rev_delta_4w))
-        elif rev_delta_4w <= -eps_warn_subgrades / 13.0:
-            board.add(make_eps_rev_warning(sub_grade_steps, rev_delta_4w))
+        if rev_delta_4w <= compiled.eps_sell_delta:
+            board.add(make_eps_rev_sell(
+                abs(rev_delta_4w) * _SUBGRADES_PER_GRADE, rev_delta_4w,
+            ))
+        elif rev_delta_4w <= compiled.eps_warn_delta:
+            board.add(make_eps_rev_warning(
+                abs(rev_delta_4w) * _SUBGRADES_PER_GRADE, rev_delta_4w,
+            ))
 
     # Quant Freshness Warning
     if reversal["quant_freshness_warning"]:
         board.add(make_quant_freshness_warning())
 
-    # Drawdown Defense sell/hold flags (Rules D-7, D-8)
-    if dd_classification and ctx.vix_regime in ("FEAR", "PANIC"):
+    # Drawdown Defense sell/hold flags (Rules D-7, D-8). Both qualify a hard
+    # sell, so an empty board (the common case) skips the block outright
+    if len(board) and dd_classification and ctx.vix_regime in ("FEAR", "PANIC"):
         sell_count = len(board.sells)
         if dd_classification in ("HEDGE", "DEFENSIVE") and sell_count == 1:
             if dd_downside_capture is not None:
@@ -365,45 +587,31 @@ def score_ticker(
     if reversal["bottom_turning"]:
         board.add(make_bottom_turning())
 
-    # Derive legacy sell_flags from SignalBoard
-    sell_flags = board.to_legacy_flags()
-
     # --- Classify DCS ---
-    thresholds = None
-    if config is not None:
-        sc = getattr(config, "scoring", config)
-        if hasattr(sc, "thresholds"):
-            t = sc.thresholds
-            thresholds = {
-                "strong_buy_dip": getattr(t, "strong_buy_dip", 80),
-                "high_conviction": getattr(t, "high_conviction", 70),
-                "buy_dip": getattr(t, "buy_dip", 65),
-                "watch": getattr(t, "watch", 50),
-                "weak": getattr(t, "weak", 35),
-            }
-
-    dcs_signal = classify_dcs(dcs, thresholds)
+    dcs_signal = classify_dcs(dcs, compiled.thresholds)
 
     # --- Build result ---
     result: dict[str, Any] = {
-        "dcs": round(dcs, 1),
+        "dcs": dcs,
         "dcs_signal": dcs_signal,
         "sub_scores": {
             "dcs": {
-                "MQ": round(mq, 3),
-                "FQ": round(fq, 3),
-                "TO": round(to, 3),
-                "MR": round(mr, 3),
-                "VC": round(vc, 3),
+                "MQ": mq,
+                "FQ": fq,
+                "TO": to,
+                "MR": mr,
+                "VC": vc,
             },
         },
         "technicals": technicals,
         "trend_score": trend_score,
         "days_below_sma_3pct": days_below_sma,
-        "sell_flags": sell_flags,
-        "signal_board": board.to_dict(),
         "_signal_board_obj": board,
     }
+    if board_views:
+        # Legacy sell_flags and the serialized board, both from SignalBoard
+        result["sell_flags"] = board.to_legacy_flags()
+        result["signal_board"] = board.to_dict()
 
     if dd_classification:
         result["drawdown_defense"] = {
@@ -416,7 +624,7 @@ def score_ticker(
         result["falling_knife_cap"] = {
             "classification": dd_classification,
             "cap_applied": fk_cap_applied,
-            "original_dcs": round(dcs_raw, 1),
+            "original_dcs": dcs_raw,
         }
 
     if quant_dropped:
@@ -427,7 +635,7 @@ def score_ticker(
 
     if rev_mom_score is not None:
         result["revision_momentum"] = {
-            "score": round(rev_mom_score, 3),
+            "score": rev_mom_score,
             "direction": rev_direction,
             "delta_4w": rev_delta_4w,
         }
@@ -445,14 +653,10 @@ def score_ticker(
     # yfinance fundamentals metadata
     if yf_fundamentals and yf_fundamentals.get("fetch_status") == "ok":
         yf_meta: dict[str, Any] = {}
-        for key in (
-            "fcf_yield", "gross_profitability", "ev_to_ebitda",
-            "gross_margin", "sector", "fcf_yield_pctl",
-            "gross_profitability_pctl", "ev_to_ebitda_pctl",
-        ):
+        for key in _YF_META_KEYS:
             val = yf_fundamentals.get(key)
             if val is not None:
-                yf_meta[key] = round(val, 4) if isinstance(val, float) else val
+                yf_meta[key] = val
         if yf_meta:
             result["yf_fundamentals"] = yf_meta
 
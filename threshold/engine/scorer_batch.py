@@ -0,0 +1,118 @@
+"""score_tickers() — DCS scoring for a whole price panel at once.
+
+score_ticker() computes its rolling statistics for one Series per call.
+For a universe scan the 200d / 50d / 20d SMAs, the Bollinger std, the
+8-week return and the days-below-200d-SMA run are instead computed for
+every column in one rolling-bundle pass over the (T x N) Close matrix,
+and the MQ sub-score in one calc_momentum_quality_batch() call, then
+handed to the shared per-ticker scorer so only the genuinely per-ticker
+work (OBV, RSI/MACD, the other sub-scores, SignalBoard) runs in the
+Python loop.
+
+Results match score_ticker() ticker for ticker (with the default float64
+panel).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from threshold.engine._rolling_bundle import bundle_stats, compute_rolling_bundle
+from threshold.engine.context import ScoringContext
+from threshold.engine.scorer import (
+    CompiledScoringConfig,
+    ScoringResult,
+    _drop_missing,
+    _score_series,
+)
+from threshold.engine.subscores import calc_momentum_quality_batch
+
+
+def score_tickers(
+    close: pd.DataFrame,
+    sa_data: Mapping[str, dict[str, Any]],
+    ctx: ScoringContext,
+    config: Any | None = None,
+    volume: pd.DataFrame | None = None,
+    float_dtype: type[np.floating] = np.float64,
+    compiled: CompiledScoringConfig | None = None,
+    board_views: bool = True,
+) -> dict[str, ScoringResult | None]:
+    """Calculate DCS for every ticker in a wide price panel.
+
+    Parameters:
+        close: Close prices, one column per ticker (T x N). Tickers listed
+               late may lead with NaN.
+        sa_data: SA ratings dict per ticker (missing tickers score as {}).
+        ctx: ScoringContext shared by the whole run.
+        config: ThresholdConfig (optional). When None, uses calibrated defaults.
+        volume: Optional Volume panel, row-aligned with ``close``.
+        float_dtype: Precision of the (T x N) matrix the panel statistics
+               are computed from. float64 (default) or float32, which
+               halves its memory for large universes at a small
+               precision cost; accumulation is float64 either way.
+        compiled: ``CompiledScoringConfig.from_config(config)`` when the
+               caller already has it (resolved here if None).
+        board_views: False leaves ``sell_flags`` / ``signal_board`` out of
+               each result (``_signal_board_obj`` is always there), for
+               scans that rank on DCS and drop most results; call
+               resolve_board_views() on the ones kept.
+
+    Returns {ticker: ScoringResult or None} in column order, with None for
+    insufficient data (<50 bars) as score_ticker() does.
+    """
+    arr = close.to_numpy(dtype=float_dtype)
+    valid = ~np.isnan(arr)
+    n_valid = valid.sum(axis=0)
+    first_valid = valid.argmax(axis=0)
+
+    # Columns whose NaNs all lead share one row layout with their cleaned
+    # series, so the panel statistics apply; gaps mid-history get their
+    # own bundle from the cleaned series, as score_ticker() does
+    aligned = n_valid == arr.shape[0] - first_valid
+    bundle = compute_rolling_bundle(arr, first_valid)
+    if compiled is None:
+        compiled = CompiledScoringConfig.from_config(config)
+    mq_batch = calc_momentum_quality_batch(
+        [sa_data.get(ticker, {}) for ticker in close.columns],
+        arr, first_valid, ctx.spy_close, config, bundle, compiled.subscores,
+    )
+
+    empty_volume = pd.Series(dtype=float)
+    results: dict[str, ScoringResult | None] = {}
+    for j, ticker in enumerate(close.columns):
+        if n_valid[j] < 50:
+            results[ticker] = None
+            continue
+
+        col = close.iloc[:, j]
+        if volume is not None and ticker in volume.columns:
+            vol = _drop_missing(volume[ticker])
+        else:
+            vol = empty_volume
+
+        mq_parts: tuple[float, float, float, float | None] | None = None
+        if aligned[j]:
+            col = col.iloc[first_valid[j]:]
+            stats = bundle_stats(bundle, j)
+            rs_vs_spy = mq_batch["rs_vs_spy"][j]
+            mq_parts = (
+                mq_batch["mq"][j],
+                mq_batch["trend_score"][j],
+                mq_batch["vol_adj_mom"][j],
+                None if np.isnan(rs_vs_spy) else rs_vs_spy,
+            )
+        else:
+            col = col.dropna()
+            stats = bundle_stats(compute_rolling_bundle(col.to_numpy(dtype=np.float64)))
+
+        results[ticker] = _score_series(
+            ticker, sa_data.get(ticker, {}), col, vol, ctx, config, compiled, stats,
+            board_views, mq_parts,
+        )
+
+    return results
@@ -0,0 +1,127 @@
+"""score_universe() — universe scan spread across worker processes.
+
+Tickers score independently given the shared, read-only ScoringContext,
+so the Close / Volume panel is split into column blocks and each block is
+scored by score_tickers() in its own process. The context and compiled
+config reach each worker once through the pool initializer rather than
+with every task.
+
+Uses only the standard library (``concurrent.futures``).
+"""
+
+from __future__ import annotations
+
+import math
+import os
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+import pandas as pd
+
+from threshold.engine.context import ScoringContext
+from threshold.engine.scorer import CompiledScoringConfig, ScoringResult
+from threshold.engine.scorer_batch import score_tickers
+
+# Per-process state installed by _init_worker
+_WORKER_STATE: dict[str, Any] = {}
+
+
+def _init_worker(
+    ctx: ScoringContext,
+    config: Any | None,
+    compiled: CompiledScoringConfig,
+    board_views: bool,
+) -> None:
+    """Receive the run-wide scoring inputs once per worker process."""
+    _WORKER_STATE["ctx"] = ctx
+    _WORKER_STATE["config"] = config
+    _WORKER_STATE["compiled"] = compiled
+    _WORKER_STATE["board_views"] = board_views
+
+
+def _score_block(
+    close: pd.DataFrame,
+    sa_data: dict[str, dict[str, Any]],
+    volume: pd.DataFrame | None,
+) -> dict[str, ScoringResult | None]:
+    """Score one column block inside a worker."""
+    return score_tickers(
+        close,
+        sa_data,
+        _WORKER_STATE["ctx"],
+        _WORKER_STATE["config"],
+        volume,
+        compiled=_WORKER_STATE["compiled"],
+        board_views=_WORKER_STATE["board_views"],
+    )
+
+
+def score_universe(
+    close: pd.DataFrame,
+    sa_data: Mapping[str, dict[str, Any]],
+    ctx: ScoringContext,
+    config: Any | None = None,
+    volume: pd.DataFrame | None = None,
+    n_jobs: int = -1,
+    block_size: int | None = None,
+    board_views: bool = True,
+) -> dict[str, ScoringResult | None]:
+    """Calculate DCS for every ticker in a price panel using worker processes.
+
+    Parameters:
+        close: Close prices, one column per ticker (T x N), as for
+               score_tickers().
+        sa_data: SA ratings dict per ticker (missing tickers score as {}).
+        ctx: ScoringContext shared by the whole run (must be picklable).
+        config: ThresholdConfig (optional). When None, uses calibrated defaults.
+        volume: Optional Volume panel, row-aligned with ``close``.
+        n_jobs: Worker processes; -1 uses every CPU. 1 scores in-process.
+        block_size: Tickers per task. Defaults to about four tasks per
+               worker, enough to balance uneven blocks without paying
+               per-ticker IPC.
+        board_views: As for score_tickers(); False also keeps the
+               serialized boards out of the results sent back by workers.
+
+    Returns {ticker: ScoringResult or None} in column order, identical to
+    score_tickers() on the whole panel.
+    """
+    compiled = CompiledScoringConfig.from_config(config)
+
+    # Tickers with too little history score None; settle them here in one
+    # pass over the panel so they never ship to (or load) a worker
+    results: dict[str, ScoringResult | None] = dict.fromkeys(close.columns)
+    close = close.loc[:, (close.notna().sum() >= 50).to_numpy()]
+
+    n_tickers = close.shape[1]
+    workers = (os.cpu_count() or 1) if n_jobs == -1 else max(n_jobs, 1)
+    workers = min(workers, n_tickers)
+    if workers <= 1:
+        results.update(score_tickers(
+            close, sa_data, ctx, config, volume,
+            compiled=compiled, board_views=board_views,
+        ))
+        return results
+
+    if block_size is None:
+        block_size = math.ceil(n_tickers / (workers * 4))
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(ctx, config, compiled, board_views),
+    ) as pool:
+        futures = []
+        for start in range(0, n_tickers, block_size):
+            block = close.iloc[:, start:start + block_size]
+            vol_block = None
+            if volume is not None:
+                vol_block = volume[volume.columns.intersection(block.columns, sort=False)]
+            futures.append(pool.submit(
+                _score_block,
+                block,
+                {t: sa_data[t] for t in block.columns if t in sa_data},
+                vol_block,
+            ))
+        for future in futures:
+            results.update(future.result())
+    return results
@@ -5,9 +5,10 @@ objects grouped by a ``SignalBoard`` container.  Provides:
 
   - ``SignalType`` enum: SELL_HARD, EARLY_WARNING, BUY_CONFIRMED, etc.
   - ``Severity`` enum: CRITICAL, HIGH, MEDIUM, LOW, INFO
-  - ``Signal`` frozen dataclass: one signal event with metadata
+  - ``Signal`` frozen, slotted dataclass: one signal event with metadata
   - ``SignalBoard`` container: typed access, net_action resolution,
-    and ``to_legacy_flags()`` for backward compatibility
+    ``to_legacy_flags()`` for backward compatibility, and ``stack()``
+    for columnar cross-ticker scans
   - 11 factory functions: one per signal origin in the scoring pipeline
 
 Backward compatibility contract
@@ -19,9 +20,13 @@ that the old ``sell_flags.append(...)`` calls produced.  Consumers
 
 from __future__ import annotations
 
+import functools
+from collections.abc import Iterator, Mapping
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any
+from typing import Any, ClassVar
+
+import numpy as np
 
 # ---------------------------------------------------------------------------
 # Enums
@@ -48,14 +53,178 @@ class Severity(Enum):
     INFO = "INFO"
 
 
+# Enum values cached per member: serialization reads these per signal
+_TYPE_VALUE: dict[SignalType, str] = {t: t.value for t in SignalType}
+_SEV_VALUE: dict[Severity, str] = {s: s.value for s in Severity}
+_TYPE_BY_VALUE: dict[str, SignalType] = {t.value: t for t in SignalType}
+_SEV_BY_VALUE: dict[str, Severity] = {s.value: s for s in Severity}
+
+# Stable int8 codes for the columnar view built by SignalBoard.stack()
+SIGNAL_TYPE_CODES: dict[SignalType, int] = {t: i for i, t in enumerate(SignalType)}
+SEVERITY_CODES: dict[Severity, int] = {s: i for i, s in enumerate(Severity)}
+
+# Legacy prefixes shared by several factories
+_PFX_SELL = "SELL:"
+_PFX_WARNING = "WARNING:"
+
+# %-templates for the factories with numeric format specs: str.__mod__
+# formats them without the per-field format() dispatch of an f-string
+_FMT_QUANT_DROP = "SA Quant dropped %+.2f since %s"
+_FMT_EPS_REV_SELL = "EPS Revisions dropped %.0f sub-grades in 4 weeks (delta %+.3f)"
+_FMT_EPS_REV_WARNING = (
+    "EPS Revisions declined %.0f sub-grades in 4 weeks (delta %+.3f, trigger at 3)"
+)
+_FMT_DEFENSIVE_HOLD = (
+    "%s asset (DC=%.2f) provides drawdown insurance — consider extended grace (270d)"
+)
+_FMT_AMPLIFIER = "DC=%.2f — amplifies losses in drawdowns. Consider priority trim."
+_FMT_PARABOLIC = "Gate 3 PARABOLIC: RSI %.0f, 8w return %.1f%% — sizing: %s"
+_FMT_CONCENTRATION = "High corr with %s (eff. bets: %.0f)"
+
+
+# ---------------------------------------------------------------------------
+# Signal metadata records
+# ---------------------------------------------------------------------------
+
+class _SignalMeta(Mapping[str, Any]):
+    """Slotted, read-only metadata for one signal criterion.
+
+    Every factory's metadata has a fixed schema (``criterion`` plus a few
+    fields), so it is stored as a record instead of a per-signal dict. It
+    still reads as a mapping (``meta["days_below"]``, ``.get()``, ``==``
+    against a dict) and becomes a plain dict in ``Signal.to_dict()``.
+    Subclasses name their fields in ``__slots__``, in constructor order.
+    """
+
+    __slots__: tuple[str, ...] = ()
+    criterion: ClassVar[str]
+
+    def __init__(self, *values: Any) -> None:
+        for name, value in zip(self.__slots__, values, strict=True):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "criterion":
+            return self.criterion
+        if key in self.__slots__:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        yield "criterion"
+        yield from self.__slots__
+
+    def __len__(self) -> int:
+        return len(self.__slots__) + 1
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return type(self), tuple(getattr(self, name) for name in self.__slots__)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.as_dict()!r})"
+
+    def as_dict(self) -> dict[str, Any]:
+        """The metadata as a plain, JSON-ready dict."""
+        d: dict[str, Any] = {"criterion": self.criterion}
+        for name in self.__slots__:
+            d[name] = getattr(self, name)
+        return d
+
+
+class _SmaBreachMeta(_SignalMeta):
+    __slots__ = ("days_below",)
+    criterion = "sma_breach"
+
+
+class _QuantDropMeta(_SignalMeta):
+    __slots__ = ("delta", "compare_date")
+    criterion = "quant_drop"
+
+
+class _EpsRevisionMeta(_SignalMeta):
+    __slots__ = ("sub_grade_steps", "delta_4w")
+    criterion = "eps_revision"
+
+
+class _QuantFreshnessMeta(_SignalMeta):
+    __slots__ = ()
+    criterion = "quant_freshness"
+
+
+class _DefensiveHoldMeta(_SignalMeta):
+    __slots__ = ("classification", "downside_capture")
+    criterion = "defensive_hold"
+
+
+class _AmplifierWarningMeta(_SignalMeta):
+    __slots__ = ("downside_capture",)
+    criterion = "amplifier_warning"
+
+
+class _ReversalConfirmedMeta(_SignalMeta):
+    __slots__ = ()
+    criterion = "reversal_confirmed"
+
+
+class _BottomTurningMeta(_SignalMeta):
+    __slots__ = ()
+    criterion = "bottom_turning"
+
+
+class _GracePeriodMeta(_SignalMeta):
+    __slots__ = ("tier", "days_remaining", "reason")
+    criterion = "grace_period"
+
+
+class _CryptoExemptMeta(_SignalMeta):
+    __slots__ = ("symbol", "expires_at")
+    criterion = "crypto_exempt"
+
+
+class _ParabolicMeta(_SignalMeta):
+    __slots__ = ("rsi", "ret_8w", "sizing")
+    criterion = "parabolic_filter"
+
+
+class _ConcentrationMeta(_SignalMeta):
+    __slots__ = ("correlated_with", "effective_bets")
+    criterion = "concentration"
+
+
+_META_BY_CRITERION: dict[str, type[_SignalMeta]] = {
+    cls.criterion: cls for cls in _SignalMeta.__subclasses__()
+}
+
+
+def _meta_from_dict(metadata: dict[str, Any]) -> Mapping[str, Any]:
+    """Rebuild the record for a serialized metadata dict.
+
+    Dicts that do not match a known schema exactly (external callers,
+    older history) are kept as they are.
+    """
+    meta_cls = _META_BY_CRITERION.get(metadata.get("criterion"))  # type: ignore[arg-type]
+    if meta_cls is None or len(metadata) != len(meta_cls.__slots__) + 1:
+        return metadata
+    try:
+        return meta_cls(*(metadata[name] for name in meta_cls.__slots__))
+    except KeyError:
+        return metadata
+
+
 # ---------------------------------------------------------------------------
 # Signal dataclass
 # ---------------------------------------------------------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Signal:
     """One scoring signal with typed metadata.
 
+    Slotted: a universe scan creates several per ticker, so each instance
+    skips the per-object ``__dict__``.
+
     Attributes:
         signal_type: Semantic category (SELL_HARD, BUY_CONFIRMED, etc.).
         severity: Urgency level.
@@ -63,41 +232,88 @@ class Signal:
         legacy_prefix: The colon-terminated prefix used in legacy sell_flags
             strings (e.g. ``"SELL:"``).
         metadata: Structured data for programmatic consumers (thresholds,
-            criterion names, etc.).
+            criterion names, etc.). A slotted record from the factories,
+            or any dict; read-only either way, as constant signals are
+            shared across boards.
     """
     signal_type: SignalType
     severity: Severity
     message: str
     legacy_prefix: str
-    metadata: dict[str, Any] = field(default_factory=dict)
+    metadata: Mapping[str, Any] = field(default_factory=dict)
+    # Built once here: both sell_flags and the serialized board need it
+    _legacy_flag: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_legacy_flag", f"{self.legacy_prefix} {self.message}")
 
     def to_legacy_flag(self) -> str:
-        """Reconstruct the exact legacy sell_flags string."""
-        return f"{self.legacy_prefix} {self.message}"
+        """The exact legacy sell_flags string (built at construction)."""
+        return self._legacy_flag
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize for JSON persistence (score_history)."""
         return {
-            "signal_type": self.signal_type.value,
-            "severity": self.severity.value,
+            "signal_type": _TYPE_VALUE[self.signal_type],
+            "severity": _SEV_VALUE[self.severity],
             "message": self.message,
             "legacy_prefix": self.legacy_prefix,
-            "legacy_flag": self.to_legacy_flag(),
-            "metadata": self.metadata,
+            "legacy_flag": self._legacy_flag,
+            "metadata": (
+                self.metadata.as_dict() if isinstance(self.metadata, _SignalMeta)
+                else self.metadata
+            ),
         }
 
     @classmethod
     def from_dict(cls, d: dict[str, Any]) -> Signal:
         """Deserialize from JSON."""
         return cls(
-            signal_type=SignalType(d["signal_type"]),
-            severity=Severity(d["severity"]),
+            # Unknown values fall through to the enum call, which raises
+            signal_type=_TYPE_BY_VALUE.get(d["signal_type"]) or SignalType(d["signal_type"]),
+            severity=_SEV_BY_VALUE.get(d["severity"]) or Severity(d["severity"]),
             message=d["message"],
             legacy_prefix=d["legacy_prefix"],
-            metadata=d.get("metadata", {}),
+            metadata=_meta_from_dict(d.get("metadata", {})),
         )
 
 
+# ---------------------------------------------------------------------------
+# Net action resolution
+# ---------------------------------------------------------------------------
+
+# Presence bits for the signal categories net_action depends on
+_B_SELL2 = 1   # 2+ SELL_HARD
+_B_SELL1 = 2   # exactly 1 SELL_HARD
+_B_HOLD = 4    # HOLD_OVERRIDE
+_B_TRIM = 8    # TRIM_PRIORITY
+_B_BUYC = 16   # BUY_CONFIRMED
+_B_BUYW = 32   # BUY_WATCHLIST
+_B_WARN = 64   # EARLY_WARNING
+
+
+def _resolve_action(key: int) -> str:
+    """The net_action priority ladder for one combination of presence bits."""
+    if key & _B_SELL2:
+        return "REVIEW"
+    if key & _B_SELL1:
+        return "HOLD" if key & _B_HOLD else "WATCH"
+    # No hard sells below this point
+    if key & _B_TRIM:
+        return "TRIM"
+    if key & _B_BUYC:
+        return "BUY"
+    if key & _B_BUYW:
+        return "WATCHLIST"
+    if key & _B_WARN:
+        return "WATCH"
+    return "NONE"
+
+
+# The ladder evaluated once for every bit combination; net_action indexes it
+_ACTION_TABLE = tuple(_resolve_action(key) for key in range(128))
+
+
 # ---------------------------------------------------------------------------
 # SignalBoard container
 # ---------------------------------------------------------------------------
@@ -110,64 +326,82 @@ class SignalBoard:
     legacy string conversion (``to_legacy_flags()``).
     """
 
+    __slots__ = ("_by_type", "_signals")
+
     def __init__(self) -> None:
         self._signals: list[Signal] = []
+        # Signals bucketed by type as they are added, so the typed views
+        # and net_action never rescan the whole board
+        self._by_type: dict[SignalType, list[Signal]] = {t: [] for t in SignalType}
 
     # -- mutation --
 
     def add(self, signal: Signal) -> None:
         """Append a signal to the board."""
         self._signals.append(signal)
+        self._by_type[signal.signal_type].append(signal)
 
     # -- read-only views --
 
     @property
-    def signals(self) -> list[Signal]:
-        """All signals in insertion order."""
-        return list(self._signals)
+    def signals(self) -> tuple[Signal, ...]:
+        """All signals in insertion order, as an immutable snapshot."""
+        return tuple(self._signals)
+
+    def iter_signals(self) -> Iterator[Signal]:
+        """Iterate over the signals in insertion order without copying.
+
+        For read-only passes (reports, dashboards); do not add to the
+        board while iterating.
+        """
+        return iter(self._signals)
 
     @property
     def sells(self) -> list[Signal]:
         """SELL_HARD signals only."""
-        return [s for s in self._signals if s.signal_type is SignalType.SELL_HARD]
+        return list(self._by_type[SignalType.SELL_HARD])
 
     @property
     def warnings(self) -> list[Signal]:
         """EARLY_WARNING signals only."""
-        return [s for s in self._signals if s.signal_type is SignalType.EARLY_WARNING]
+        return list(self._by_type[SignalType.EARLY_WARNING])
 
     @property
     def buy_signals(self) -> list[Signal]:
         """BUY_CONFIRMED + BUY_WATCHLIST signals."""
+        by_type = self._by_type
+        if not by_type[SignalType.BUY_WATCHLIST]:
+            return list(by_type[SignalType.BUY_CONFIRMED])
+        confirmed, watchlist = SignalType.BUY_CONFIRMED, SignalType.BUY_WATCHLIST
         return [
             s for s in self._signals
-            if s.signal_type in (SignalType.BUY_CONFIRMED, SignalType.BUY_WATCHLIST)
+            if s.signal_type is confirmed or s.signal_type is watchlist
         ]
 
     @property
     def hold_overrides(self) -> list[Signal]:
         """HOLD_OVERRIDE signals (DEFENSIVE_HOLD)."""
-        return [s for s in self._signals if s.signal_type is SignalType.HOLD_OVERRIDE]
+        return list(self._by_type[SignalType.HOLD_OVERRIDE])
 
     @property
     def trim_signals(self) -> list[Signal]:
         """TRIM_PRIORITY signals (AMPLIFIER_WARNING)."""
-        return [s for s in self._signals if s.signal_type is SignalType.TRIM_PRIORITY]
+        return list(self._by_type[SignalType.TRIM_PRIORITY])
 
     @property
     def deployment_gates(self) -> list[Signal]:
         """DEPLOYMENT_GATE signals (CONCENTRATION)."""
-        return [s for s in self._signals if s.signal_type is SignalType.DEPLOYMENT_GATE]
+        return list(self._by_type[SignalType.DEPLOYMENT_GATE])
 
     @property
     def verify_signals(self) -> list[Signal]:
         """VERIFY signals (QUANT_CHECK)."""
-        return [s for s in self._signals if s.signal_type is SignalType.VERIFY]
+        return list(self._by_type[SignalType.VERIFY])
 
     @property
     def has_sell_review(self) -> bool:
         """True if 2+ SELL_HARD signals -> review required (investment_rules.md)."""
-        return len(self.sells) >= 2
+        return len(self._by_type[SignalType.SELL_HARD]) >= 2
 
     # -- conflict resolution --
 
@@ -184,27 +418,23 @@ class SignalBoard:
           6. BUY_WATCHLIST (no sells) -> "WATCHLIST"
           7. Warnings only -> "WATCH"
           8. Nothing -> "NONE"
+
+        Most boards are empty (quiet holdings); they return "NONE" before
+        any bucket is read. Keep that exit first when changing this.
         """
-        n_sells = len(self.sells)
-
-        if n_sells >= 2:
-            return "REVIEW"
-        if n_sells == 1:
-            if self.hold_overrides:
-                return "HOLD"
-            return "WATCH"
-
-        # No hard sells below this point
-        if self.trim_signals:
-            return "TRIM"
-        if any(s.signal_type is SignalType.BUY_CONFIRMED for s in self._signals):
-            return "BUY"
-        if any(s.signal_type is SignalType.BUY_WATCHLIST for s in self._signals):
-            return "WATCHLIST"
-        if self.warnings:
-            return "WATCH"
-
-        return "NONE"
+        if not self._signals:
+            return "NONE"
+        by_type = self._by_type
+        n_sells = len(by_type[SignalType.SELL_HARD])
+        key = (
+            (_B_SELL2 if n_sells >= 2 else _B_SELL1 if n_sells else 0)
+            | (_B_HOLD if by_type[SignalType.HOLD_OVERRIDE] else 0)
+            | (_B_TRIM if by_type[SignalType.TRIM_PRIORITY] else 0)
+            | (_B_BUYC if by_type[SignalType.BUY_CONFIRMED] else 0)
+            | (_B_BUYW if by_type[SignalType.BUY_WATCHLIST] else 0)
+            | (_B_WARN if by_type[SignalType.EARLY_WARNING] else 0)
+        )
+        return _ACTION_TABLE[key]
 
     # -- legacy conversion --
 
@@ -214,13 +444,31 @@ class SignalBoard:
         Order matches insertion order, which matches the original
         ``sell_flags.append()`` call sequence in ``score_ticker()``.
         """
-        return [s.to_legacy_flag() for s in self._signals]
+        return [s._legacy_flag for s in self._signals]
 
     # -- serialization --
 
     def to_dict(self) -> list[dict[str, Any]]:
-        """Serialize the board to a JSON-safe list of signal dicts."""
-        return [s.to_dict() for s in self._signals]
+        """Serialize the board to a JSON-safe list of signal dicts.
+
+        Same dicts as ``Signal.to_dict()``, built inline in one pass with
+        the lookup tables bound locally.
+        """
+        type_value, sev_value, meta_cls = _TYPE_VALUE, _SEV_VALUE, _SignalMeta
+        return [
+            {
+                "signal_type": type_value[s.signal_type],
+                "severity": sev_value[s.severity],
+                "message": s.message,
+                "legacy_prefix": s.legacy_prefix,
+                "legacy_flag": s._legacy_flag,
+                "metadata": (
+                    s.metadata.as_dict() if isinstance(s.metadata, meta_cls)
+                    else s.metadata
+                ),
+            }
+            for s in self._signals
+        ]
 
     @classmethod
     def from_dict(cls, data: list[dict[str, Any]]) -> SignalBoard:
@@ -230,6 +478,47 @@ class SignalBoard:
             board.add(Signal.from_dict(d))
         return board
 
+    @classmethod
+    def stack(cls, boards: Mapping[str, SignalBoard]) -> dict[str, np.ndarray]:
+        """Flatten many boards into one columnar table for cross-ticker scans.
+
+        Parameters:
+            boards: ``{ticker: board}``, e.g. every ``_signal_board_obj``
+                of a scoring run.
+
+        Returns:
+            Equal-length columns, one row per signal in board then
+            insertion order: ``ticker``, ``signal_type`` and ``severity``
+            (int8, see SIGNAL_TYPE_CODES / SEVERITY_CODES), ``criterion``
+            and ``legacy_flag``. Counting, say, HIGH-severity hard sells
+            is then ``((t == sell) & (sev == high)).sum()``.
+        """
+        n = sum(len(board._signals) for board in boards.values())
+        tickers = np.empty(n, dtype=object)
+        types = np.empty(n, dtype=np.int8)
+        severities = np.empty(n, dtype=np.int8)
+        criteria = np.empty(n, dtype=object)
+        flags = np.empty(n, dtype=object)
+
+        type_code, sev_code = SIGNAL_TYPE_CODES, SEVERITY_CODES
+        i = 0
+        for ticker, board in boards.items():
+            for sig in board._signals:
+                tickers[i] = ticker
+                types[i] = type_code[sig.signal_type]
+                severities[i] = sev_code[sig.severity]
+                criteria[i] = sig.metadata.get("criterion")
+                flags[i] = sig._legacy_flag
+                i += 1
+
+        return {
+            "ticker": tickers,
+            "signal_type": types,
+            "severity": severities,
+            "criterion": criteria,
+            "legacy_flag": flags,
+        }
+
     def __len__(self) -> int:
         return len(self._signals)
 
@@ -250,8 +539,8 @@ def make_sma_breach_sell(days_below: int) -> Signal:
         signal_type=SignalType.SELL_HARD,
         severity=Severity.HIGH,
         message=f"{days_below} consecutive days >3% below 200d SMA",
-        legacy_prefix="SELL:",
-        metadata={"criterion": "sma_breach", "days_below": days_below},
+        legacy_prefix=_PFX_SELL,
+        metadata=_SmaBreachMeta(days_below),
     )
 
 
@@ -261,8 +550,8 @@ def make_sma_breach_warning(days_below: int) -> Signal:
         signal_type=SignalType.EARLY_WARNING,
         severity=Severity.MEDIUM,
         message=f"{days_below} consecutive days >3% below 200d SMA (trigger at 10)",
-        legacy_prefix="WARNING:",
-        metadata={"criterion": "sma_breach", "days_below": days_below},
+        legacy_prefix=_PFX_WARNING,
+        metadata=_SmaBreachMeta(days_below),
     )
 
 
@@ -271,13 +560,9 @@ def make_quant_drop_sell(quant_delta: float, compare_date: str) -> Signal:
     return Signal(
         signal_type=SignalType.SELL_HARD,
         severity=Severity.HIGH,
-        message=f"SA Quant dropped {quant_delta:+.2f} since {compare_date}",
-        legacy_prefix="SELL:",
-        metadata={
-            "criterion": "quant_drop",
-            "delta": quant_delta,
-            "compare_date": compare_date,
-        },
+        message=_FMT_QUANT_DROP % (quant_delta, compare_date),
+        legacy_prefix=_PFX_SELL,
+        metadata=_QuantDropMeta(quant_delta, compare_date),
     )
 
 
@@ -286,16 +571,9 @@ def make_eps_rev_sell(sub_grade_steps: float, delta_4w: float) -> Signal:
     return Signal(
         signal_type=SignalType.SELL_HARD,
         severity=Severity.HIGH,
-        message=(
-            f"EPS Revisions dropped {sub_grade_steps:.0f} sub-grades in 4 weeks "
-            f"(delta {delta_4w:+.3f})"
-        ),
-        legacy_prefix="SELL:",
-        metadata={
-            "criterion": "eps_revision",
-            "sub_grade_steps": sub_grade_steps,
-            "delta_4w": delta_4w,
-        },
+        message=_FMT_EPS_REV_SELL % (sub_grade_steps, delta_4w),
+        legacy_prefix=_PFX_SELL,
+        metadata=_EpsRevisionMeta(sub_grade_steps, delta_4w),
     )
 
 
@@ -304,31 +582,28 @@ def make_eps_rev_warning(sub_grade_steps: float, delta_4w: float) -> Signal:
     return Signal(
         signal_type=SignalType.EARLY_WARNING,
         severity=Severity.MEDIUM,
-        message=(
-            f"EPS Revisions declined {sub_grade_steps:.0f} sub-grades in 4 weeks "
-            f"(delta {delta_4w:+.3f}, trigger at 3)"
-        ),
-        legacy_prefix="WARNING:",
-        metadata={
-            "criterion": "eps_revision",
-            "sub_grade_steps": sub_grade_steps,
-            "delta_4w": delta_4w,
-        },
+        message=_FMT_EPS_REV_WARNING % (sub_grade_steps, delta_4w),
+        legacy_prefix=_PFX_WARNING,
+        metadata=_EpsRevisionMeta(sub_grade_steps, delta_4w),
     )
 
 
+# Parameterless signals are built once and shared by every board
+_SIG_QUANT_FRESHNESS = Signal(
+    signal_type=SignalType.VERIFY,
+    severity=Severity.INFO,
+    message=(
+        "RSI < 30 on Q4+ stock — verify quant score is current "
+        "(41% of Q4+ stocks at RSI<30 drop below quant 4 at next observation)"
+    ),
+    legacy_prefix="QUANT_CHECK:",
+    metadata=_QuantFreshnessMeta(),
+)
+
+
 def make_quant_freshness_warning() -> Signal:
     """Verify: RSI < 30 on Q4+ stock — quant may be stale."""
-    return Signal(
-        signal_type=SignalType.VERIFY,
-        severity=Severity.INFO,
-        message=(
-            "RSI < 30 on Q4+ stock — verify quant score is current "
-            "(41% of Q4+ stocks at RSI<30 drop below quant 4 at next observation)"
-        ),
-        legacy_prefix="QUANT_CHECK:",
-        metadata={"criterion": "quant_freshness"},
-    )
+    return _SIG_QUANT_FRESHNESS
 
 
 def make_defensive_hold(classification: str, downside_capture: float) -> Signal:
@@ -336,16 +611,9 @@ def make_defensive_hold(classification: str, downside_capture: float) -> Signal:
     return Signal(
         signal_type=SignalType.HOLD_OVERRIDE,
         severity=Severity.MEDIUM,
-        message=(
-            f"{classification} asset (DC={downside_capture:.2f}) provides "
-            f"drawdown insurance — consider extended grace (270d)"
-        ),
+        message=_FMT_DEFENSIVE_HOLD % (classification, downside_capture),
         legacy_prefix="DEFENSIVE_HOLD:",
-        metadata={
-            "criterion": "defensive_hold",
-            "classification": classification,
-            "downside_capture": downside_capture,
-        },
+        metadata=_DefensiveHoldMeta(classification, downside_capture),
     )
 
 
@@ -354,44 +622,44 @@ def make_amplifier_warning(downside_capture: float) -> Signal:
     return Signal(
         signal_type=SignalType.TRIM_PRIORITY,
         severity=Severity.HIGH,
-        message=(
-            f"DC={downside_capture:.2f} — amplifies losses "
-            f"in drawdowns. Consider priority trim."
-        ),
+        message=_FMT_AMPLIFIER % downside_capture,
         legacy_prefix="AMPLIFIER_WARNING:",
-        metadata={
-            "criterion": "amplifier_warning",
-            "downside_capture": downside_capture,
-        },
+        metadata=_AmplifierWarningMeta(downside_capture),
     )
 
 
+_SIG_REVERSAL_CONFIRMED = Signal(
+    signal_type=SignalType.BUY_CONFIRMED,
+    severity=Severity.LOW,
+    message=(
+        "DCS >= 65 + BB lower breach — "
+        "higher-conviction dip-buy (+4.6pp edge, walk-forward stable)"
+    ),
+    legacy_prefix="REVERSAL CONFIRMED:",
+    metadata=_ReversalConfirmedMeta(),
+)
+
+
 def make_reversal_confirmed() -> Signal:
     """Buy confirmed: DCS >= 65 + BB lower breach — higher conviction dip-buy."""
-    return Signal(
-        signal_type=SignalType.BUY_CONFIRMED,
-        severity=Severity.LOW,
-        message=(
-            "DCS >= 65 + BB lower breach — "
-            "higher-conviction dip-buy (+4.6pp edge, walk-forward stable)"
-        ),
-        legacy_prefix="REVERSAL CONFIRMED:",
-        metadata={"criterion": "reversal_confirmed"},
-    )
+    return _SIG_REVERSAL_CONFIRMED
+
+
+_SIG_BOTTOM_TURNING = Signal(
+    signal_type=SignalType.BUY_WATCHLIST,
+    severity=Severity.LOW,
+    message=(
+        "MACD hist rising from below zero + RSI < 30 + Q3+ — "
+        "watchlist alert (+4.4pp edge, walk-forward stable)"
+    ),
+    legacy_prefix="BOTTOM TURNING:",
+    metadata=_BottomTurningMeta(),
+)
 
 
 def make_bottom_turning() -> Signal:
     """Buy watchlist: MACD hist rising + RSI < 30 + Q3+ — watchlist alert."""
-    return Signal(
-        signal_type=SignalType.BUY_WATCHLIST,
-        severity=Severity.LOW,
-        message=(
-            "MACD hist rising from below zero + RSI < 30 + Q3+ — "
-            "watchlist alert (+4.4pp edge, walk-forward stable)"
-        ),
-        legacy_prefix="BOTTOM TURNING:",
-        metadata={"criterion": "bottom_turning"},
-    )
+    return _SIG_BOTTOM_TURNING
 
 
 def make_grace_period_active(
@@ -408,12 +676,7 @@ def make_grace_period_active(
             f"sell signals softened. Reason: {reason}"
         ),
         legacy_prefix="GRACE_PERIOD:",
-        metadata={
-            "criterion": "grace_period",
-            "tier": tier,
-            "days_remaining": days_remaining,
-            "reason": reason,
-        },
+        metadata=_GracePeriodMeta(tier, days_remaining, reason),
     )
 
 
@@ -428,11 +691,7 @@ def make_crypto_exempt(symbol: str, expires_at: str = "") -> Signal:
             f"cycle hold{expiry_note}"
         ),
         legacy_prefix="CRYPTO_EXEMPT:",
-        metadata={
-            "criterion": "crypto_exempt",
-            "symbol": symbol,
-            "expires_at": expires_at,
-        },
+        metadata=_CryptoExemptMeta(symbol, expires_at),
     )
 
 
@@ -445,20 +704,18 @@ def make_parabolic_warning(
     return Signal(
         signal_type=SignalType.DEPLOYMENT_GATE,
         severity=Severity.HIGH,
-        message=(
-            f"Gate 3 PARABOLIC: RSI {rsi:.0f}, 8w return {ret_8w:.1%} — "
-            f"sizing: {sizing}"
-        ),
+        message=_FMT_PARABOLIC % (rsi, ret_8w * 100, sizing),
         legacy_prefix="GATE3:",
-        metadata={
-            "criterion": "parabolic_filter",
-            "rsi": rsi,
-            "ret_8w": ret_8w,
-            "sizing": sizing,
-        },
+        metadata=_ParabolicMeta(rsi, ret_8w, sizing),
     )
 
 
+@functools.lru_cache(maxsize=512)
+def _concentration_message(correlated: tuple[str, ...], effective_bets: float) -> str:
+    """Concentration message; the same pairs recur on every re-score."""
+    return _FMT_CONCENTRATION % (", ".join(correlated), effective_bets)
+
+
 def make_concentration_warning(
     correlated_with: list[str],
     effective_bets: float,
@@ -467,14 +724,7 @@ def make_concentration_warning(
     return Signal(
         signal_type=SignalType.DEPLOYMENT_GATE,
         severity=Severity.MEDIUM,
-        message=(
-            f"High corr with {', '.join(correlated_with[:3])} "
-            f"(eff. bets: {effective_bets:.0f})"
-        ),
+        message=_concentration_message(tuple(correlated_with[:3]), effective_bets),
         legacy_prefix="CONCENTRATION:",
-        metadata={
-            "criterion": "concentration",
-            "correlated_with": correlated_with,
-            "effective_bets": effective_bets,
-        },
+        metadata=_ConcentrationMeta(correlated_with, effective_bets),
     )
@@ -14,14 +14,24 @@ Plus:
 
 from __future__ import annotations
 
+import functools
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
 from datetime import datetime
+from itertools import pairwise
 from typing import Any, Literal, TypedDict
 
 import numpy as np
 import pandas as pd
 
+from threshold.engine._rolling_bundle import RollingBundle, compute_rolling_bundle
 from threshold.engine.grades import sa_grade_to_norm
-from threshold.engine.technical import MACDResult, calc_macd, calc_rsi_value
+from threshold.engine.technical import (
+    MACDResult,
+    RollingStats,
+    calc_macd,
+    calc_rsi_value,
+)
 
 # ---------------------------------------------------------------------------
 # Type definitions
@@ -35,6 +45,17 @@ class MQResult(TypedDict):
     rs_vs_spy: float | None
 
 
+class MQBatchResult(TypedDict):
+    """Return type for calc_momentum_quality_batch(), one (N,) array per field.
+
+    ``rs_vs_spy`` is NaN where calc_momentum_quality() returns None.
+    """
+    mq: np.ndarray
+    trend_score: np.ndarray
+    vol_adj_mom: np.ndarray
+    rs_vs_spy: np.ndarray
+
+
 class RevisionMomentumResult(TypedDict):
     """Per-ticker revision momentum metadata."""
     score: float
@@ -42,6 +63,108 @@ class RevisionMomentumResult(TypedDict):
     delta_4w: float
 
 
+# ---------------------------------------------------------------------------
+# Score tables
+# ---------------------------------------------------------------------------
+
+# MQ trend classifier, indexed by (50d > 200d SMA) << 1 | (price > 200d SMA)
+_TREND_TABLE = (
+    0.1,    # Downtrend, below both SMAs — falling knife
+    0.4,    # Recovery attempt
+    0.5,    # Uptrend but price broke 200d — caution
+    1.0,    # Uptrend pullback — IDEAL dip-buy
+)
+
+# TO MACD confirmation, indexed by
+# (bullish crossover) << 2 | (histogram rising) << 1 | (MACD below zero)
+_MACD_TABLE = (0.0, 0.0, 0.3, 0.6, 0.7, 1.0, 0.7, 1.0)
+
+# MR VIX contrarian score: piecewise linear through these knots, flat
+# outside them
+_VIX_KNOTS = np.array([14.0, 20.0, 28.0, 40.0])
+_VIX_SCORES = np.array([0.2, 0.5, 0.75, 1.0])
+
+
+# ---------------------------------------------------------------------------
+# Compiled config
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True, slots=True)
+class CompiledSubscoreConfig:
+    """Sub-score weights and revision-momentum gates.
+
+    Resolved from a ThresholdConfig once per run (score_ticker() carries
+    it on CompiledScoringConfig) so the sub-score helpers do not repeat
+    their getattr chains for every ticker.
+    """
+    mq_trend: float = 0.30
+    mq_vol_adj: float = 0.25
+    mq_sa_mom: float = 0.25
+    mq_rs: float = 0.20
+    to_rsi: float = 0.35
+    to_sma: float = 0.25
+    to_bb: float = 0.25
+    to_macd: float = 0.15
+    prof_blend_sa: float = 0.60
+    prof_blend_nm: float = 0.40
+    rev_min_history_weeks: int = 4
+    rev_min_calendar_days: int = 21
+
+    @classmethod
+    def from_config(cls, config: Any | None) -> CompiledSubscoreConfig:
+        """Resolve the sub-score settings from ``config`` (None → defaults)."""
+        if config is None:
+            return _DEFAULT_SUBSCORE_CONFIG
+        d = _DEFAULT_SUBSCORE_CONFIG
+        sc = getattr(config, "scoring", config)
+
+        mq_trend, mq_vol_adj, mq_sa_mom, mq_rs = d.mq_trend, d.mq_vol_adj, d.mq_sa_mom, d.mq_rs
+        if hasattr(sc, "mq_weights"):
+            mq_w = sc.mq_weights
+            mq_trend = getattr(mq_w, "trend", mq_trend)
+            mq_vol_adj = getattr(mq_w, "vol_adj_momentum", mq_vol_adj)
+            mq_sa_mom = getattr(mq_w, "sa_momentum", mq_sa_mom)
+            mq_rs = getattr(mq_w, "relative_strength", mq_rs)
+
+        to_rsi, to_sma, to_bb, to_macd = d.to_rsi, d.to_sma, d.to_bb, d.to_macd
+        if hasattr(sc, "to_weights"):
+            tw = sc.to_weights
+            to_rsi = getattr(tw, "rsi", to_rsi)
+            to_sma = getattr(tw, "sma_distance", to_sma)
+            to_bb = getattr(tw, "bollinger", to_bb)
+            to_macd = getattr(tw, "macd", to_macd)
+
+        prof_blend_sa, prof_blend_nm = d.prof_blend_sa, d.prof_blend_nm
+        if hasattr(sc, "profitability_blend"):
+            pb = sc.profitability_blend
+            prof_blend_sa = getattr(pb, "sa_weight", prof_blend_sa)
+            prof_blend_nm = getattr(pb, "novy_marx_weight", prof_blend_nm)
+
+        min_weeks, min_days = d.rev_min_history_weeks, d.rev_min_calendar_days
+        if hasattr(sc, "revision_momentum"):
+            rm = sc.revision_momentum
+            min_weeks = getattr(rm, "min_history_weeks", min_weeks)
+            min_days = getattr(rm, "min_calendar_days", min_days)
+
+        return cls(
+            mq_trend=mq_trend,
+            mq_vol_adj=mq_vol_adj,
+            mq_sa_mom=mq_sa_mom,
+            mq_rs=mq_rs,
+            to_rsi=to_rsi,
+            to_sma=to_sma,
+            to_bb=to_bb,
+            to_macd=to_macd,
+            prof_blend_sa=prof_blend_sa,
+            prof_blend_nm=prof_blend_nm,
+            rev_min_history_weeks=min_weeks,
+            rev_min_calendar_days=min_days,
+        )
+
+
+_DEFAULT_SUBSCORE_CONFIG = CompiledSubscoreConfig()
+
+
 # ---------------------------------------------------------------------------
 # MQ: Momentum Quality (30% of DCS)
 # ---------------------------------------------------------------------------
@@ -51,6 +174,9 @@ def calc_momentum_quality(
     close: pd.Series,
     spy_close: pd.Series | None = None,
     config: Any | None = None,
+    stats: RollingStats | None = None,
+    values: np.ndarray | None = None,
+    compiled: CompiledSubscoreConfig | None = None,
 ) -> tuple[float, float, float, float | None]:
     """MQ: Momentum Quality (weight 30% of DCS).
 
@@ -60,58 +186,54 @@ def calc_momentum_quality(
       - SA Momentum Grade (25%)
       - Relative strength vs SPY (20%) [Antonacci dual momentum]
 
+    ``stats`` supplies precomputed 50d / 200d SMAs and ``values`` the
+    float64 array of ``close`` when the caller already has it;
+    ``compiled`` is CompiledSubscoreConfig.from_config(config).
+
     Returns (mq, trend_score, vol_adj_mom, rs_vs_spy).
     """
-    n = len(close)
-    current = close.iloc[-1]
-
-    # Read weights from config if available
-    w_trend = 0.30
-    w_vol_adj = 0.25
-    w_sa_mom = 0.25
-    w_rs = 0.20
-    if config is not None:
-        mq_w = getattr(config, "scoring", config)
-        if hasattr(mq_w, "mq_weights"):
-            mq_w = mq_w.mq_weights
-            w_trend = getattr(mq_w, "trend", w_trend)
-            w_vol_adj = getattr(mq_w, "vol_adj_momentum", w_vol_adj)
-            w_sa_mom = getattr(mq_w, "sa_momentum", w_sa_mom)
-            w_rs = getattr(mq_w, "relative_strength", w_rs)
+    if values is None:
+        values = close.to_numpy(dtype=np.float64)
+    n = len(values)
+    current = values[-1]
+
+    if compiled is None:
+        compiled = CompiledSubscoreConfig.from_config(config)
 
     # 50d and 200d SMA
-    sma_50 = close.rolling(50).mean().iloc[-1] if n >= 50 else current
-    sma_200 = close.rolling(200).mean().iloc[-1] if n >= 200 else current
+    if stats is not None:
+        sma_50 = stats["sma_50"] if n >= 50 else current
+        sma_200 = stats["sma_200"] if n >= 200 else current
+    else:
+        # Latest-bar means over the tail only, as compute_rolling_bundle does
+        sma_50 = values[-50:].mean() if n >= 50 else current
+        sma_200 = values[-200:].mean() if n >= 200 else current
 
     # Trend classifier
-    if sma_50 > sma_200 and current > sma_200:
-        trend_score = 1.0    # Uptrend pullback — IDEAL dip-buy
-    elif sma_50 > sma_200 and current <= sma_200:
-        trend_score = 0.5    # Uptrend but price broke 200d — caution
-    elif sma_50 <= sma_200 and current > sma_200:
-        trend_score = 0.4    # Recovery attempt
-    else:
-        trend_score = 0.1    # Downtrend, below both SMAs — falling knife
+    trend_score = _TREND_TABLE[(sma_50 > sma_200) << 1 | (current > sma_200)]
 
     # 12-1 momentum, volatility-adjusted
     vol_adj_mom = 0.0
     raw_mom_12_1 = 0.0
     if n >= 252:
-        price_12m = close.iloc[-252]
-        price_1m = close.iloc[-21]
+        price_12m = values[-252]
+        price_1m = values[-21]
         raw_mom_12_1 = (price_1m / price_12m) - 1.0
     elif n >= 60:
-        price_start = close.iloc[0]
-        price_1m = close.iloc[-21]
+        price_start = values[0]
+        price_1m = values[-21]
         raw_mom_12_1 = (price_1m / price_start) - 1.0
 
     # Compute realized volatility for vol-adjustment
     if n >= 60:
-        daily_returns = close.pct_change().dropna()
-        if len(daily_returns) >= 252:
-            realized_vol = float(daily_returns.iloc[-252:].std() * np.sqrt(252))
-        else:
-            realized_vol = float(daily_returns.std() * np.sqrt(252))
+        # Last 252 of pct_change().dropna(): only the last 253 prices are
+        # read unless a NaN return there means reaching further back
+        tail = values[-253:]
+        daily_returns = tail[1:] / tail[:-1] - 1.0
+        if np.isnan(daily_returns).any():
+            daily_returns = values[1:] / values[:-1] - 1.0
+            daily_returns = daily_returns[~np.isnan(daily_returns)]
+        realized_vol = float(daily_returns[-252:].std(ddof=1) * np.sqrt(252))
         vol_adj_mom = raw_mom_12_1 / max(realized_vol, 0.05)
     else:
         vol_adj_mom = raw_mom_12_1
@@ -126,30 +248,163 @@ def calc_momentum_quality(
     rs_score = 0.5  # Neutral default if SPY data unavailable
     rs_vs_spy = None
     if spy_close is not None and len(spy_close) >= 252 and n >= 252:
-        ticker_12m_ret = (close.iloc[-21] / close.iloc[-252]) - 1.0
+        ticker_12m_ret = (values[-21] / values[-252]) - 1.0
         spy_12m_ret = (spy_close.iloc[-21] / spy_close.iloc[-252]) - 1.0
         rs_vs_spy = ticker_12m_ret / spy_12m_ret if spy_12m_ret != 0 else 1.0
         rs_score = max(0.0, min(1.0, (rs_vs_spy - 0.3) / 1.4))
 
     # Composite MQ
     mq = (
-        (trend_score * w_trend)
-        + (mom_score * w_vol_adj)
-        + (sa_mom_norm * w_sa_mom)
-        + (rs_score * w_rs)
+        (trend_score * compiled.mq_trend)
+        + (mom_score * compiled.mq_vol_adj)
+        + (sa_mom_norm * compiled.mq_sa_mom)
+        + (rs_score * compiled.mq_rs)
     )
 
     return mq, trend_score, vol_adj_mom, rs_vs_spy
 
 
+def _clamp01(x: np.ndarray) -> np.ndarray:
+    """max(0.0, min(1.0, x)) element-wise, with the builtins' NaN handling."""
+    x = np.where(x < 1.0, x, 1.0)
+    return np.where(x > 0.0, x, 0.0)
+
+
+def calc_momentum_quality_batch(
+    sa_data: Sequence[Mapping[str, Any]],
+    close: np.ndarray,
+    first_valid: np.ndarray | None = None,
+    spy_close: pd.Series | None = None,
+    config: Any | None = None,
+    bundle: RollingBundle | None = None,
+    compiled: CompiledSubscoreConfig | None = None,
+) -> MQBatchResult:
+    """MQ for every column of a (T x N) Close panel at once.
+
+    Same model as calc_momentum_quality(), evaluated as a handful of
+    column-wise array operations instead of one Python call per ticker.
+    Each column may be NaN only before its ``first_valid`` row (late
+    listings), as for compute_rolling_bundle(); ``bundle`` is that
+    function's output for ``close`` when the caller already has it.
+
+    Parameters:
+        sa_data: SA ratings dict per column.
+        close: Close prices (T x N); float32 is read as float64.
+        first_valid: First non-NaN row per column (default: row 0).
+        spy_close: SPY Close series for relative strength.
+        config: ThresholdConfig (optional).
+        bundle: Precomputed rolling bundle for ``close``.
+        compiled: CompiledSubscoreConfig.from_config(config).
+
+    Returns:
+        MQBatchResult matching calc_momentum_quality() column for column.
+    """
+    if compiled is None:
+        compiled = CompiledSubscoreConfig.from_config(config)
+    n_rows, n_cols = close.shape
+    if first_valid is None:
+        first_valid = np.zeros(n_cols, dtype=int)
+    if bundle is None:
+        bundle = compute_rolling_bundle(close, first_valid)
+    n = n_rows - first_valid
+
+    # Only the last 253 rows (252 returns) and each listing's first price
+    # are read below
+    tail = close[-253:].astype(np.float64)
+    current = tail[-1]
+    nan_row = np.full(n_cols, np.nan)
+    price_1m = tail[-21] if n_rows >= 21 else nan_row
+    price_12m = tail[-252] if n_rows >= 252 else nan_row
+    price_start = close[first_valid, np.arange(n_cols)].astype(np.float64)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        # 50d and 200d SMA
+        sma_50 = np.where(n >= 50, bundle["sma_50"], current)
+        sma_200 = np.where(n >= 200, bundle["sma_200"], current)
+
+        # Trend classifier
+        trend_idx = (sma_50 > sma_200).astype(np.intp) << 1 | (current > sma_200)
+        trend_score = np.take(_TREND_TABLE, trend_idx)
+
+        # 12-1 momentum
+        raw_mom_12_1 = np.where(
+            n >= 252,
+            (price_1m / price_12m) - 1.0,
+            np.where(n >= 60, (price_1m / price_start) - 1.0, 0.0),
+        )
+
+        # Realized volatility: columns with 252 clean returns reduce as
+        # rows of the transposed block, the layout whose per-row sums
+        # match the 1-D reduction calc_momentum_quality() does
+        realized_vol = np.full(n_cols, np.nan)
+        returns = tail[1:] / tail[:-1] - 1.0
+        clean = (n >= 253) & ~np.isnan(returns).any(axis=0)
+        if clean.any():
+            block = np.ascontiguousarray(returns[:, clean].T)
+            realized_vol[clean] = block.std(axis=1, ddof=1) * np.sqrt(252)
+        for j in np.flatnonzero((n >= 60) & ~clean):
+            values = close[first_valid[j]:, j].astype(np.float64)
+            daily_returns = values[1:] / values[:-1] - 1.0
+            daily_returns = daily_returns[~np.isnan(daily_returns)]
+            realized_vol[j] = daily_returns[-252:].std(ddof=1) * np.sqrt(252)
+        vol_adj_mom = np.where(
+            n >= 60,
+            raw_mom_12_1 / np.where(realized_vol < 0.05, 0.05, realized_vol),
+            raw_mom_12_1,
+        )
+        mom_score = _clamp01((vol_adj_mom + 0.5) / 2.5)
+
+        # SA Momentum grade
+        sa_mom_norm = np.array([sa_grade_to_norm(d.get("momentum")) for d in sa_data])
+
+        # Relative strength vs SPY
+        rs_vs_spy = nan_row
+        rs_score = np.full(n_cols, 0.5)
+        if spy_close is not None and len(spy_close) >= 252:
+            has_rs = n >= 252
+            ticker_12m_ret = (price_1m / price_12m) - 1.0
+            spy_12m_ret = (spy_close.iloc[-21] / spy_close.iloc[-252]) - 1.0
+            rs = ticker_12m_ret / spy_12m_ret if spy_12m_ret != 0 else np.ones(n_cols)
+            rs_vs_spy = np.where(has_rs, rs, np.nan)
+            rs_score = np.where(has_rs, _clamp01((rs - 0.3) / 1.4), 0.5)
+
+    mq = (
+        (trend_score * compiled.mq_trend)
+        + (mom_score * compiled.mq_vol_adj)
+        + (sa_mom_norm * compiled.mq_sa_mom)
+        + (rs_score * compiled.mq_rs)
+    )
+
+    return MQBatchResult(
+        mq=mq,
+        trend_score=trend_score,
+        vol_adj_mom=vol_adj_mom,
+        rs_vs_spy=rs_vs_spy,
+    )
+
+
 # ---------------------------------------------------------------------------
 # Revision Momentum
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=64)
+def _history_span_days(newest: str, oldest: str) -> int | None:
+    """Whole days between two ISO timestamps (None if they do not parse).
+
+    Every ticker in a run shares one grade history, so its endpoints are
+    parsed once per run rather than once per ticker.
+    """
+    try:
+        return (datetime.fromisoformat(newest) - datetime.fromisoformat(oldest)).days
+    except (ValueError, TypeError):
+        return None
+
+
 def calc_revision_momentum(
     ticker: str,
     grade_history: list[dict[str, Any]] | None,
     config: Any | None = None,
+    compiled: CompiledSubscoreConfig | None = None,
 ) -> tuple[float | None, str | None, float | None]:
     """Compute EPS revision momentum from stored grade history.
 
@@ -161,14 +416,10 @@ def calc_revision_momentum(
 
     Evidence: Novy-Marx 2015 — earnings momentum subsumes price momentum.
     """
-    min_history_weeks = 4
-    min_calendar_days = 21
-    if config is not None:
-        rm = getattr(config, "scoring", config)
-        if hasattr(rm, "revision_momentum"):
-            rm = rm.revision_momentum
-            min_history_weeks = getattr(rm, "min_history_weeks", min_history_weeks)
-            min_calendar_days = getattr(rm, "min_calendar_days", min_calendar_days)
+    if compiled is None:
+        compiled = CompiledSubscoreConfig.from_config(config)
+    min_history_weeks = compiled.rev_min_history_weeks
+    min_calendar_days = compiled.rev_min_calendar_days
 
     if not grade_history or len(grade_history) < min_history_weeks:
         return None, None, None
@@ -178,17 +429,15 @@ def calc_revision_momentum(
         newest_dt = grade_history[0].get("_metadata", {}).get("generated_at", "")
         oldest_dt = grade_history[-1].get("_metadata", {}).get("generated_at", "")
         if newest_dt and oldest_dt:
-            newest = datetime.fromisoformat(newest_dt)
-            oldest = datetime.fromisoformat(oldest_dt)
-            span_days = (newest - oldest).days
-            if span_days < min_calendar_days:
+            span_days = _history_span_days(newest_dt, oldest_dt)
+            if span_days is not None and span_days < min_calendar_days:
                 return None, None, None
-    except (ValueError, TypeError):
-        pass
+    except TypeError:
+        pass  # Unhashable timestamps: no gate, as for unparseable ones
 
     # Extract revisions grades from last 4-8 weeks (most recent first)
     rev_grades: list[float | None] = []
-    for week_data in grade_history:
+    for week_data in grade_history[:8]:
         scores = week_data.get("scores", {})
         ticker_data = scores.get(ticker, {})
         rev_grade = ticker_data.get("sa_revisions")
@@ -198,7 +447,7 @@ def calc_revision_momentum(
             rev_grades.append(None)
 
     # Need at least 4 data points with data
-    valid = [g for g in rev_grades[:8] if g is not None]
+    valid = [g for g in rev_grades if g is not None]
     if len(valid) < min_history_weeks:
         return None, None, None
 
@@ -207,20 +456,19 @@ def calc_revision_momentum(
     four_weeks_ago = valid[min(3, len(valid) - 1)]
     rev_delta_4w = current - four_weeks_ago
 
-    # Direction consistency
-    transitions = []
-    for i in range(len(valid) - 1):
-        if valid[i] > valid[i + 1]:
-            transitions.append(1)   # Improving
-        elif valid[i] < valid[i + 1]:
-            transitions.append(-1)  # Deteriorating
-        else:
-            transitions.append(0)   # Flat
-
-    if transitions:
-        pos = sum(1 for t in transitions if t > 0)
-        neg = sum(1 for t in transitions if t < 0)
-        consistency = pos / len(transitions) if pos > neg else -(neg / len(transitions))
+    # Direction consistency: improving vs deteriorating week-over-week
+    # transitions, counted in one pass (at most 7, so plain Python beats
+    # NumPy's per-call overhead here)
+    pos = neg = 0
+    for newer, older in pairwise(valid):
+        if newer > older:
+            pos += 1    # Improving
+        elif newer < older:
+            neg += 1    # Deteriorating
+    n_transitions = len(valid) - 1
+
+    if n_transitions:
+        consistency = pos / n_transitions if pos > neg else -(neg / n_transitions)
     else:
         consistency = 0.0
 
@@ -249,6 +497,7 @@ def calc_fundamental_quality(
     rev_momentum: float | None = None,
     yf_fundamentals: dict[str, Any] | None = None,
     config: Any | None = None,
+    compiled: CompiledSubscoreConfig | None = None,
 ) -> float:
     """FQ: Fundamental Quality (weight 25% of DCS).
 
@@ -267,15 +516,8 @@ def calc_fundamental_quality(
     rev_norm = sa_grade_to_norm(sa_data.get("revisions"))
     growth_norm = sa_grade_to_norm(sa_data.get("growth"))
 
-    # Read FQ weights and profitability blend from config
-    prof_blend_sa = 0.60
-    prof_blend_nm = 0.40
-    if config is not None:
-        sc = getattr(config, "scoring", config)
-        if hasattr(sc, "profitability_blend"):
-            pb = sc.profitability_blend
-            prof_blend_sa = getattr(pb, "sa_weight", prof_blend_sa)
-            prof_blend_nm = getattr(pb, "novy_marx_weight", prof_blend_nm)
+    if compiled is None:
+        compiled = CompiledSubscoreConfig.from_config(config)
 
     # Check yfinance data availability
     has_yf = (
@@ -288,7 +530,10 @@ def calc_fundamental_quality(
         # Blend SA profitability grade with Novy-Marx gross profitability
         gp_pctl = yf_fundamentals.get("gross_profitability_pctl")
         if gp_pctl is not None:
-            prof_blended = (prof_norm * prof_blend_sa) + (float(gp_pctl) * prof_blend_nm)
+            prof_blended = (
+                (prof_norm * compiled.prof_blend_sa)
+                + (float(gp_pctl) * compiled.prof_blend_nm)
+            )
         else:
             prof_blended = prof_norm
 
@@ -336,6 +581,10 @@ def calc_fundamental_quality(
 def calc_technical_oversold(
     close: pd.Series,
     config: Any | None = None,
+    stats: RollingStats | None = None,
+    rsi: float | None = None,
+    values: np.ndarray | None = None,
+    compiled: CompiledSubscoreConfig | None = None,
 ) -> tuple[float, MACDResult]:
     """TO: Technical Oversold (weight 20% of DCS).
 
@@ -345,32 +594,29 @@ def calc_technical_oversold(
       - Bollinger Band position (25%)
       - MACD confirmation (15%)
 
+    ``stats`` supplies precomputed 200d SMA and Bollinger inputs,
+    ``rsi`` the latest RSI-14, ``values`` the float64 array of ``close``
+    and ``compiled`` CompiledSubscoreConfig.from_config(config).
+
     Returns (to_score, macd_data).
     """
-    n = len(close)
-    current = close.iloc[-1]
-
-    # Read weights from config
-    w_rsi = 0.35
-    w_sma = 0.25
-    w_bb = 0.25
-    w_macd = 0.15
-    if config is not None:
-        sc = getattr(config, "scoring", config)
-        if hasattr(sc, "to_weights"):
-            tw = sc.to_weights
-            w_rsi = getattr(tw, "rsi", w_rsi)
-            w_sma = getattr(tw, "sma_distance", w_sma)
-            w_bb = getattr(tw, "bollinger", w_bb)
-            w_macd = getattr(tw, "macd", w_macd)
+    # Without stats, latest-bar means come from the tail of the raw array
+    if values is None:
+        values = close.to_numpy(dtype=np.float64)
+    n = len(values)
+    current = values[-1]
+
+    if compiled is None:
+        compiled = CompiledSubscoreConfig.from_config(config)
 
     # RSI
-    rsi = calc_rsi_value(close, 14)
+    if rsi is None:
+        rsi = calc_rsi_value(close, 14)
     rsi_score = max(0.0, min(1.0, (70 - rsi) / 40.0))
 
     # Distance from 200d SMA
     if n >= 200:
-        sma_200 = close.rolling(200).mean().iloc[-1]
+        sma_200 = stats["sma_200"] if stats is not None else values[-200:].mean()
         pct_from_sma = (current - sma_200) / sma_200
     else:
         pct_from_sma = 0.0
@@ -378,8 +624,12 @@ def calc_technical_oversold(
 
     # Bollinger Band position (20d, 2 sigma)
     if n >= 20:
-        sma_20 = close.rolling(20).mean().iloc[-1]
-        std_20 = close.rolling(20).std().iloc[-1]
+        if stats is not None:
+            sma_20 = stats["sma_20"]
+            std_20 = stats["std_20"]
+        else:
+            sma_20 = values[-20:].mean()
+            std_20 = values[-20:].std(ddof=1)
         if std_20 > 0:
             upper_bb = sma_20 + 2 * std_20
             lower_bb = sma_20 - 2 * std_20
@@ -392,21 +642,17 @@ def calc_technical_oversold(
 
     # MACD confirmation
     macd_data = calc_macd(close)
-    macd_score = 0.0
-    if macd_data["crossover"] == "bullish" and macd_data["below_zero"]:
-        macd_score = 1.0
-    elif macd_data["crossover"] == "bullish":
-        macd_score = 0.7
-    elif macd_data["hist_rising"] and macd_data["below_zero"]:
-        macd_score = 0.6
-    elif macd_data["hist_rising"]:
-        macd_score = 0.3
+    macd_score = _MACD_TABLE[
+        (macd_data["crossover"] == "bullish") << 2
+        | macd_data["hist_rising"] << 1
+        | macd_data["below_zero"]
+    ]
 
     to = (
-        (rsi_score * w_rsi)
-        + (sma_dist_score * w_sma)
-        + (bb_score * w_bb)
-        + (macd_score * w_macd)
+        (rsi_score * compiled.to_rsi)
+        + (sma_dist_score * compiled.to_sma)
+        + (bb_score * compiled.to_bb)
+        + (macd_score * compiled.to_macd)
     )
     return to, macd_data
 
@@ -429,15 +675,8 @@ def calc_market_regime(
       - SPY trend (above 200d SMA = supportive regime) (30%)
       - Market breadth (% of holdings above 200d SMA) (20%)
     """
-    # VIX contrarian scoring
-    if vix_current < 14:
-        vix_score = 0.2
-    elif vix_current < 20:
-        vix_score = 0.2 + (vix_current - 14) * (0.3 / 6)
-    elif vix_current < 28:
-        vix_score = 0.5 + (vix_current - 20) * (0.25 / 8)
-    else:
-        vix_score = min(1.0, 0.75 + (vix_current - 28) * (0.25 / 12))
+    # VIX contrarian scoring; min() keeps a NaN VIX at the 1.0 cap
+    vix_score = min(1.0, float(np.interp(vix_current, _VIX_KNOTS, _VIX_SCORES)))
 
     market_trend = 1.0 if spy_above_200d else 0.4
 
@@ -502,10 +741,7 @@ def calc_quant_deterioration(
 
     Returns (dropped, delta, compare_date).
     """
-    if current_quant is None:
-        return False, 0.0, None
-
-    if db is None:
+    if current_quant is None or db is None:
         return False, 0.0, None
 
     # Query the scores table for the oldest quant score within lookback window.
@@ -55,6 +55,23 @@ class BBBreachResult(TypedDict):
     lower_bb: float | None
 
 
+class RollingStats(TypedDict):
+    """Trailing-window statistics at the most recent bar.
+
+    Computed once up front (e.g. for a whole price panel by
+    ``scorer_batch.score_tickers``) and handed to the indicator and
+    sub-score helpers so they skip their own rolling passes. Windows
+    longer than the available history hold NaN; callers keep their
+    usual short-history fallbacks.
+    """
+    sma_20: float
+    std_20: float
+    sma_50: float
+    sma_200: float
+    ret_8w: float
+    days_below_sma: int
+
+
 class ReversalSignals(TypedDict):
     """Return type for calc_reversal_signals()."""
     rsi_bullish_divergence: bool
@@ -82,7 +99,11 @@ def calc_rsi(series: pd.Series, period: int = 14) -> pd.Series:
 
 def calc_rsi_value(series: pd.Series, period: int = 14) -> float:
     """Return single most recent RSI value."""
-    rsi_series = calc_rsi(series, period)
+    return _last_rsi(calc_rsi(series, period))
+
+
+def _last_rsi(rsi_series: pd.Series) -> float:
+    """Latest value of a calc_rsi() series (50.0 while still warming up)."""
     val = rsi_series.iloc[-1]
     return float(val) if not np.isnan(val) else 50.0
 
@@ -107,21 +128,27 @@ def calc_macd(
     ema_slow = close.ewm(span=slow, adjust=False).mean()
     macd_line = ema_fast - ema_slow
     signal_line = macd_line.ewm(span=signal, adjust=False).mean()
-    histogram = macd_line - signal_line
 
-    macd_now = float(macd_line.iloc[-1])
-    signal_now = float(signal_line.iloc[-1])
-    hist_now = float(histogram.iloc[-1])
-    hist_prev = float(histogram.iloc[-2]) if len(histogram) >= 2 else 0.0
+    # Only the last four bars feed the state below; read them as arrays
+    # once instead of one iloc lookup per value, and take the histogram
+    # for just the two bars it is read at
+    macd_tail = macd_line.to_numpy()[-4:]
+    signal_tail = signal_line.to_numpy()[-4:]
+    hist_tail = macd_tail[-2:] - signal_tail[-2:]
+
+    macd_now = float(macd_tail[-1])
+    signal_now = float(signal_tail[-1])
+    hist_now = float(hist_tail[-1])
+    hist_prev = float(hist_tail[-2]) if len(hist_tail) >= 2 else 0.0
 
     # Crossover detection (last 3 bars)
     crossover = "neutral"
-    if len(macd_line) >= 3:
+    if len(macd_tail) >= 3:
         for i in range(-3, 0):
-            prev_m = float(macd_line.iloc[i - 1])
-            prev_s = float(signal_line.iloc[i - 1])
-            curr_m = float(macd_line.iloc[i])
-            curr_s = float(signal_line.iloc[i])
+            prev_m = float(macd_tail[i - 1])
+            prev_s = float(signal_tail[i - 1])
+            curr_m = float(macd_tail[i])
+            curr_s = float(signal_tail[i])
             if prev_m <= prev_s and curr_m > curr_s:
                 crossover = "bullish"
             elif prev_m >= prev_s and curr_m < curr_s:
@@ -160,19 +187,17 @@ def calc_obv_divergence(
             "divergence": "none", "divergence_strength": 0.0,
         }
 
-    # Compute OBV
-    obv = pd.Series(0.0, index=close.index[:n])
-    for i in range(1, n):
-        if close.iloc[i] > close.iloc[i - 1]:
-            obv.iloc[i] = obv.iloc[i - 1] + volume.iloc[i]
-        elif close.iloc[i] < close.iloc[i - 1]:
-            obv.iloc[i] = obv.iloc[i - 1] - volume.iloc[i]
-        else:
-            obv.iloc[i] = obv.iloc[i - 1]
+    # Compute OBV: each bar adds, subtracts or skips its volume by the
+    # sign of the price change — a signed cumulative sum (np.cumsum adds
+    # sequentially, so this matches the bar-by-bar recurrence exactly)
+    close_arr = close.to_numpy(dtype=float)
+    volume_arr = volume.to_numpy(dtype=float)
+    obv = np.zeros(n)
+    np.cumsum(np.sign(np.diff(close_arr[:n])) * volume_arr[1:n], out=obv[1:])
 
     # Linear regression slopes over lookback period (normalized)
-    recent_close = close.iloc[-lookback:].values
-    recent_obv = obv.iloc[-lookback:].values
+    recent_close = close_arr[-lookback:]
+    recent_obv = obv[-lookback:]
     x = np.arange(lookback)
 
     # Price trend
@@ -219,18 +244,22 @@ def calc_rsi_bullish_divergence(
     close: pd.Series,
     rsi_period: int = 14,
     lookback: int = 40,
+    rsi_series: pd.Series | None = None,
 ) -> RSIDivergenceResult:
     """Detect RSI bullish divergence: price makes a lower low over two windows
     while RSI makes a higher low.
 
     Walk-forward stable: Cal=58.6%, Val=57.1%, +2.2pp edge,
     11,259 signals in Phase 2 backtest.
+
+    ``rsi_series`` supplies a precomputed ``calc_rsi(close, rsi_period)``.
     """
     n = len(close)
     if n < lookback:
         return {"detected": False, "price_low_recent": None, "rsi_low_recent": None}
 
-    rsi_series = calc_rsi(close, rsi_period)
+    if rsi_series is None:
+        rsi_series = calc_rsi(close, rsi_period)
     rsi_clean = rsi_series.dropna()
     if len(rsi_clean) < lookback:
         return {"detected": False, "price_low_recent": None, "rsi_low_recent": None}
@@ -260,19 +289,28 @@ def calc_rsi_bullish_divergence(
     }
 
 
-def calc_bb_lower_breach(close: pd.Series) -> BBBreachResult:
+def calc_bb_lower_breach(
+    close: pd.Series,
+    stats: RollingStats | None = None,
+) -> BBBreachResult:
     """Detect Bollinger Band lower breach: price below 20d SMA - 2*std.
 
     DCS >= 65 + BB breach: 60.4% win rate, +4.6pp edge,
     Cal=64.5%, Val=57.5%.
+
+    ``stats`` supplies a precomputed 20d SMA / std.
     """
     n = len(close)
     if n < 20:
         return {"breach": False, "bb_pct_b": 0.5, "lower_bb": None}
 
     current = float(close.iloc[-1])
-    sma_20 = float(close.rolling(20).mean().iloc[-1])
-    std_20 = float(close.rolling(20).std().iloc[-1])
+    if stats is not None:
+        sma_20 = float(stats["sma_20"])
+        std_20 = float(stats["std_20"])
+    else:
+        sma_20 = float(close.rolling(20).mean().iloc[-1])
+        std_20 = float(close.rolling(20).std().iloc[-1])
 
     if std_20 <= 0:
         return {"breach": False, "bb_pct_b": 0.5, "lower_bb": None}
@@ -293,10 +331,14 @@ def calc_reversal_signals(
     rsi_value: float,
     macd_data: MACDResult,
     sa_quant: float | None,
+    stats: RollingStats | None = None,
+    rsi_series: pd.Series | None = None,
 ) -> ReversalSignals:
     """Compute all backtest-validated reversal signals for a ticker.
 
     Called from score_ticker(). Returns dict of signal flags and metadata.
+    ``stats`` supplies precomputed Bollinger inputs and ``rsi_series`` the
+    RSI(14) series the divergence check scans.
 
     Signals:
       1. RSI Bullish Divergence (+2.2pp edge, walk-forward stable)
@@ -313,11 +355,11 @@ def calc_reversal_signals(
     }
 
     # 1. RSI Bullish Divergence
-    div_data = calc_rsi_bullish_divergence(close)
+    div_data = calc_rsi_bullish_divergence(close, rsi_series=rsi_series)
     result["rsi_bullish_divergence"] = div_data["detected"]
 
     # 2. BB Lower Breach
-    bb_data = calc_bb_lower_breach(close)
+    bb_data = calc_bb_lower_breach(close, stats)
     result["bb_lower_breach"] = bb_data["breach"]
     result["bb_pct_b"] = bb_data["bb_pct_b"]
 
@@ -393,31 +435,25 @@ def calc_price_acceleration(close: pd.Series) -> tuple[float, float]:
 def calc_consecutive_days_below_sma(
     close: pd.Series,
     threshold: float = -0.03,
-) -> tuple[int, float]:
+) -> tuple[int, float | None]:
     """Count consecutive trading days where price is >3% below 200d SMA.
 
     Sell criterion #3 requires 10+ consecutive days.
-    Returns (count, pct_from_sma_current).
+    Returns (count, sma_200_last) — the latest 200d SMA, None when there
+    are fewer than 200 bars, so callers can reuse it instead of rolling
+    the series again.
     """
     n = len(close)
     if n < 200:
-        return 0, 0.0
-
-    sma_200 = close.rolling(200).mean()
-    pct_from_sma = (close - sma_200) / sma_200
-
-    # Count consecutive days from the most recent bar going backwards
-    count = 0
-    for i in range(len(pct_from_sma) - 1, -1, -1):
-        val = pct_from_sma.iloc[i]
-        if not np.isnan(val) and val < threshold:
-            count += 1
-        else:
-            break
-
-    current_pct = (
-        float(pct_from_sma.iloc[-1])
-        if not np.isnan(pct_from_sma.iloc[-1])
-        else 0.0
-    )
-    return count, current_pct
+        return 0, None
+
+    sma_200 = close.rolling(200).mean().to_numpy()
+    pct_from_sma = (close.to_numpy(dtype=float) - sma_200) / sma_200
+
+    # Consecutive days from the most recent bar going backwards: the
+    # trailing run of True ends at the first False from the end (argmin
+    # of a bool array). NaN compares False, so warm-up bars end the run.
+    below = pct_from_sma < threshold
+    count = n if below.all() else int(np.argmin(below[::-1]))
+
+    return count, float(sma_200[-1])